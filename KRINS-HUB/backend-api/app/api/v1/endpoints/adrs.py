@@ -6,14 +6,36 @@ from typing import List, Optional, Any, Dict
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
+from pydantic import BaseModel, Field
 import uuid
 
+from app.core.config import settings
 from app.database.connection import get_db
 from app.models.database import ADR, Project, User
+from app.services.adr_bulk import bulk_upsert_adrs
 
 router = APIRouter()
 
 
+class ADRBulkItem(BaseModel):
+    """ADR to create, or to update when (project_id, number) already exists"""
+    project_id: uuid.UUID
+    number: Optional[int] = Field(None, ge=1, description="Allocated per project when omitted")
+    component_id: Optional[uuid.UUID] = None
+    title: str = Field(..., min_length=1, max_length=200)
+    status: str = Field("draft", max_length=20)
+    problem_statement: Optional[str] = None
+    alternatives: List[str] = []
+    decision: Optional[str] = None
+    rationale: Optional[str] = None
+    evidence: Optional[Dict[str, Any]] = None
+    author_id: uuid.UUID
+
+
+class ADRBulkRequest(BaseModel):
+    adrs: List[ADRBulkItem] = Field(..., min_length=1, max_length=settings.MAX_BATCH_SIZE)
+
+
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_adrs(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
@@ -61,6 +83,36 @@ async def get_adrs(
     ]
 
 
+@router.post("/bulk", response_model=Dict[str, Any])
+async def bulk_upsert(
+    request: ADRBulkRequest,
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Create or update up to MAX_BATCH_SIZE ADRs in one transaction
+    """
+    rows = await bulk_upsert_adrs(db, [adr.model_dump() for adr in request.adrs])
+    await db.commit()
+    
+    created = sum(1 for row in rows if row["inserted"])
+    return {
+        "adrs": [
+            {
+                "id": str(row["id"]),
+                "project_id": str(row["project_id"]),
+                "number": row["number"],
+                "action": "created" if row["inserted"] else "updated"
+            }
+            for row in rows
+        ],
+        "summary": {
+            "received": len(request.adrs),
+            "created": created,
+            "updated": len(rows) - created
+        }
+    }
+
+
 @router.get("/{adr_id}", response_model=Dict[str, Any])
 async def get_adr(
     adr_id: str,
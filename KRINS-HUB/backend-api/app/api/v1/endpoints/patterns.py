@@ -3,16 +3,32 @@ Pattern endpoints
 """
 
 from typing import List, Optional, Any, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 import uuid
+import hashlib
+from datetime import datetime
 
 from app.database.connection import get_db
 from app.models.database import Pattern
 
 router = APIRouter()
 
+PATTERN_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _pattern_etag(version: Optional[int], updated_at: Optional[datetime], usage_count: Optional[int]) -> str:
+    """Strong ETag from the columns that change whenever the pattern representation does"""
+    stamp = updated_at.isoformat() if updated_at else ""
+    digest = hashlib.sha1(f"{version}|{stamp}|{usage_count}".encode("utf-8")).hexdigest()[:16]
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_patterns(
@@ -61,16 +77,30 @@ async def get_patterns(
 @router.get("/{pattern_id}", response_model=Dict[str, Any])
 async def get_pattern(
     pattern_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
     Get a specific pattern by ID
+
+    Supports conditional requests: a matching If-None-Match returns 304 after
+    reading only the version columns.
     """
     try:
         pattern_uuid = uuid.UUID(pattern_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid pattern ID format")
     
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        version_query = select(Pattern.version, Pattern.updated_at, Pattern.usage_count).where(Pattern.id == pattern_uuid)
+        current = (await db.execute(version_query)).first()
+        if current:
+            etag = _pattern_etag(current.version, current.updated_at, current.usage_count)
+            if _etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PATTERN_CACHE_CONTROL})
+    
     query = select(Pattern).where(Pattern.id == pattern_uuid)
     result = await db.execute(query)
     pattern = result.scalar_one_or_none()
@@ -78,6 +108,9 @@ async def get_pattern(
     if not pattern:
         raise HTTPException(status_code=404, detail="Pattern not found")
     
+    response.headers["ETag"] = _pattern_etag(pattern.version, pattern.updated_at, pattern.usage_count)
+    response.headers["Cache-Control"] = PATTERN_CACHE_CONTROL
+    
     return {
         "id": str(pattern.id),
         "name": pattern.name,
@@ -0,0 +1,171 @@
+"""
+Bulk ADR upserts with set-based INSERT ... ON CONFLICT statements
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# One INSERT ... ON CONFLICT for a whole batch. A (project_id, number) pair may
+# appear only once per statement, so input is deduplicated first.
+BULK_UPSERT_ADRS_QUERY = text("""
+    INSERT INTO adrs (
+        project_id, component_id, number, title, status,
+        problem_statement, alternatives, decision, rationale,
+        evidence, author_id, embedding_text
+    )
+    SELECT
+        project_id, component_id, number, title, status,
+        problem_statement, alternatives::json, decision, rationale,
+        evidence::json, author_id, embedding_text
+    FROM unnest(
+        CAST(:project_ids AS uuid[]), CAST(:component_ids AS uuid[]), CAST(:numbers AS int[]),
+        CAST(:titles AS text[]), CAST(:statuses AS text[]), CAST(:problem_statements AS text[]),
+        CAST(:alternatives AS text[]), CAST(:decisions AS text[]), CAST(:rationales AS text[]),
+        CAST(:evidence AS text[]), CAST(:author_ids AS uuid[]), CAST(:embedding_texts AS text[])
+    ) AS t(
+        project_id, component_id, number, title, status,
+        problem_statement, alternatives, decision, rationale,
+        evidence, author_id, embedding_text
+    )
+    ON CONFLICT (project_id, number)
+    DO UPDATE SET
+        component_id = EXCLUDED.component_id,
+        title = EXCLUDED.title,
+        status = EXCLUDED.status,
+        problem_statement = EXCLUDED.problem_statement,
+        alternatives = EXCLUDED.alternatives,
+        decision = EXCLUDED.decision,
+        rationale = EXCLUDED.rationale,
+        evidence = EXCLUDED.evidence,
+        embedding_text = EXCLUDED.embedding_text,
+        updated_at = NOW()
+    RETURNING id, project_id, number, (xmax = 0) AS inserted
+""")
+
+# Transaction-scoped locks serialize number allocation per project; sorted to avoid deadlocks
+LOCK_PROJECT_NUMBERS_QUERY = text("""
+    SELECT pg_advisory_xact_lock(hashtext('adrs.number:' || p))
+    FROM unnest(CAST(:project_ids AS text[])) AS p
+""")
+
+LAST_NUMBERS_QUERY = text("""
+    SELECT project_id::text AS project_id, COALESCE(MAX(number), 0) AS last_number
+    FROM adrs
+    WHERE project_id = ANY(CAST(:project_ids AS uuid[]))
+    GROUP BY project_id
+""")
+
+COLUMN_PARAMS = (
+    "project_ids", "component_ids", "numbers", "titles", "statuses", "problem_statements",
+    "alternatives", "decisions", "rationales", "evidence", "author_ids", "embedding_texts"
+)
+
+
+def dedupe_adrs(adrs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate project ids and keep the last ADR per (project_id, number)"""
+    last_index: Dict[Tuple[str, int], int] = {}
+    for index, adr in enumerate(adrs):
+        if not adr.get("project_id"):
+            raise ValueError(f"ADR at position {index} has no project_id")
+        if adr.get("number") is not None:
+            last_index[(str(adr["project_id"]), adr["number"])] = index
+
+    return [
+        adr for index, adr in enumerate(adrs)
+        if adr.get("number") is None or last_index[(str(adr["project_id"]), adr["number"])] == index
+    ]
+
+
+def assign_adr_numbers(adrs: List[Dict[str, Any]], last_numbers: Dict[str, int]) -> List[int]:
+    """
+    Number per ADR: given numbers are kept, missing ones continue their project's
+    sequence after both the stored maximum and every number given anywhere in
+    ``adrs``, so an allocated number can never collide with a later explicit one.
+    """
+    last_numbers = dict(last_numbers)
+    for adr in adrs:
+        project_id = str(adr["project_id"])
+        if adr.get("number") is not None and project_id in last_numbers:
+            last_numbers[project_id] = max(last_numbers[project_id], adr["number"])
+
+    numbers = []
+    for adr in adrs:
+        number = adr.get("number")
+        if number is None:
+            project_id = str(adr["project_id"])
+            last_numbers[project_id] += 1
+            number = last_numbers[project_id]
+        numbers.append(number)
+    return numbers
+
+
+def adr_columns(batch: List[Dict[str, Any]], numbers: List[int]) -> Dict[str, List[Any]]:
+    """Column arrays for BULK_UPSERT_ADRS_QUERY, prepared like DatabaseQueries.upsert_adr"""
+    columns: Dict[str, List[Any]] = {name: [] for name in COLUMN_PARAMS}
+    for adr, number in zip(batch, numbers):
+        alternatives = adr.get("alternatives") or []
+        evidence = adr.get("evidence")
+        embedding_text = " ".join([
+            str(adr.get("title") or ""),
+            str(adr.get("problem_statement") or ""),
+            str(adr.get("decision") or ""),
+            str(adr.get("rationale") or ""),
+            " ".join(alternatives) if isinstance(alternatives, list) else str(alternatives or "")
+        ]).strip()
+        values = (
+            adr["project_id"], adr.get("component_id"), number, adr.get("title"),
+            adr.get("status") or "draft", adr.get("problem_statement"),
+            json.dumps(alternatives) if alternatives else None, adr.get("decision"),
+            adr.get("rationale"), json.dumps(evidence) if evidence else None,
+            adr.get("author_id"), embedding_text
+        )
+        for name, value in zip(COLUMN_PARAMS, values):
+            columns[name].append(value)
+    return columns
+
+
+async def _last_numbers(db: AsyncSession, adrs: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Lock and read the current maximum number of every project that needs numbers"""
+    projects = sorted({str(adr["project_id"]) for adr in adrs if adr.get("number") is None})
+    if not projects:
+        return {}
+
+    await db.execute(LOCK_PROJECT_NUMBERS_QUERY, {"project_ids": projects})
+    result = await db.execute(LAST_NUMBERS_QUERY, {"project_ids": projects})
+    last_numbers = {project_id: 0 for project_id in projects}
+    last_numbers.update({row.project_id: row.last_number for row in result})
+    return last_numbers
+
+
+async def bulk_upsert_adrs(
+    db: AsyncSession,
+    adrs: List[Dict[str, Any]],
+    batch_size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Insert or update many ADRs with one statement per ``batch_size`` rows
+    (default settings.MAX_BATCH_SIZE). Every ADR needs a project_id (ValueError
+    otherwise); of repeated (project_id, number) pairs the last one wins.
+    Numbers are allocated for the whole input before any batch is written.
+    The caller commits.
+    """
+    batch_size = batch_size or settings.MAX_BATCH_SIZE
+    adrs = dedupe_adrs(adrs)
+    numbers = assign_adr_numbers(adrs, await _last_numbers(db, adrs))
+
+    results = []
+    for start in range(0, len(adrs), batch_size):
+        end = start + batch_size
+        rows = await db.execute(BULK_UPSERT_ADRS_QUERY, adr_columns(adrs[start:end], numbers[start:end]))
+        results.extend(dict(row) for row in rows.mappings())
+
+    logger.info(f"Bulk upserted {len(results)} ADRs")
+    return results
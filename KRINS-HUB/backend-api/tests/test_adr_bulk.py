@@ -0,0 +1,87 @@
+"""
+Bulk ADR upsert tests: deduplication and number allocation across batches
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.adr_bulk import (
+    BULK_UPSERT_ADRS_QUERY, LAST_NUMBERS_QUERY, assign_adr_numbers, bulk_upsert_adrs, dedupe_adrs
+)
+
+PROJECT = str(uuid.uuid4())
+OTHER_PROJECT = str(uuid.uuid4())
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def mappings(self):
+        return self.rows
+
+
+class FakeSession:
+    """Serves stored maximum numbers and records every upserted batch"""
+
+    def __init__(self, last_numbers):
+        self.last_numbers = last_numbers
+        self.batches = []
+
+    async def execute(self, statement, params):
+        if statement is LAST_NUMBERS_QUERY:
+            return FakeResult([
+                SimpleNamespace(project_id=project_id, last_number=self.last_numbers[project_id])
+                for project_id in params["project_ids"] if project_id in self.last_numbers
+            ])
+        if statement is BULK_UPSERT_ADRS_QUERY:
+            self.batches.append(params)
+            return FakeResult([
+                {"id": uuid.uuid4(), "project_id": project_id, "number": number, "inserted": True}
+                for project_id, number in zip(params["project_ids"], params["numbers"])
+            ])
+        return FakeResult([])
+
+
+def _adr(title, number=None, project_id=PROJECT):
+    return {"project_id": project_id, "number": number, "title": title, "author_id": str(uuid.uuid4())}
+
+
+def test_dedupe_keeps_last_occurrence():
+    adrs = [_adr("first", 1), _adr("unnumbered"), _adr("second", 1), _adr("other", 1, OTHER_PROJECT)]
+    assert [adr["title"] for adr in dedupe_adrs(adrs)] == ["unnumbered", "second", "other"]
+
+
+def test_dedupe_requires_project_id():
+    with pytest.raises(ValueError, match="position 1 has no project_id"):
+        dedupe_adrs([_adr("ok"), {"title": "orphan", "number": 3}])
+
+
+def test_allocated_numbers_skip_every_explicit_number():
+    adrs = [_adr("a"), _adr("b", 8), _adr("c"), _adr("d", 11, OTHER_PROJECT), _adr("e", None, OTHER_PROJECT)]
+    assert assign_adr_numbers(adrs, {PROJECT: 7, OTHER_PROJECT: 0}) == [9, 8, 10, 11, 12]
+
+
+@pytest.mark.asyncio
+async def test_explicit_number_in_later_batch_does_not_overwrite_allocated_one():
+    # Stored maximum is 4: the unnumbered ADR in batch 1 must not take 5,
+    # which an ADR in batch 2 claims explicitly
+    session = FakeSession({PROJECT: 4})
+    rows = await bulk_upsert_adrs(session, [_adr("allocated"), _adr("explicit", 5)], batch_size=1)
+
+    assert [batch["numbers"] for batch in session.batches] == [[6], [5]]
+    assert len({row["number"] for row in rows}) == 2
+
+
+@pytest.mark.asyncio
+async def test_batches_follow_batch_size():
+    session = FakeSession({})
+    adrs = [_adr(f"adr {i}", i) for i in range(1, 8)]
+    await bulk_upsert_adrs(session, adrs, batch_size=3)
+    assert [len(batch["numbers"]) for batch in session.batches] == [3, 3, 1]
+    assert session.batches[0]["statuses"] == ["draft"] * 3
@@ -3,19 +3,35 @@ ADR (Architecture Decision Records) API endpoints
 Integrates with Chronicle-Keeper decision management system.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request, Response
 from fastapi.responses import JSONResponse
 from typing import List, Dict, Any, Optional
 import asyncpg
 import json
 import logging
+import os
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from services.cache import data_generations
+from services.etags import (
+    ROW_VERSION_SQL, DETAIL_CACHE_CONTROL, make_etag, etag_matches_none_match, if_match_versions
+)
+from services.query_runner import ConcurrentQueryRunner, QueryPlan
+from services.serialization import FastJSONResponse, decode_json_list
+from services.numbering import allocate_adr_id
+from services.adr_import import adr_importer, bulk_upsert_adrs
+from services.pagination import encode_cursor, decode_cursor, estimate_count, parse_fields
+from api.dependencies import get_pool
+
 logger = logging.getLogger(__name__)
 
 adr_router = APIRouter()
 
+MAX_BATCH_IDS = 200
+BATCH_INCLUDES = ("links", "evidence", "scores")
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "50"))
+
 # Pydantic models
 class ADRCreate(BaseModel):
     title: str = Field(..., min_length=10, max_length=200)
@@ -47,6 +63,37 @@ class ADRResponse(BaseModel):
     actionability_score: Optional[float]
     tags: List[str]
 
+class ADRProjection(BaseModel):
+    """ADR with only the requested fields (see ``fields=``)"""
+    id: Optional[int] = None
+    adr_id: Optional[str] = None
+    title: Optional[str] = None
+    status: Optional[str] = None
+    context: Optional[str] = None
+    decision: Optional[str] = None
+    consequences: Optional[str] = None
+    component: Optional[str] = None
+    decision_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    confidence_score: Optional[float] = None
+    complexity_score: Optional[float] = None
+    actionability_score: Optional[float] = None
+    tags: Optional[List[str]] = None
+
+class ADRBatchRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
+    include: List[str] = Field(default_factory=list, description="Any of: links, evidence, scores")
+    fields: Optional[List[str]] = Field(None, description="ADR fields to return (default: summary fields)")
+
+class ADRBulkItem(ADRCreate):
+    adr_id: Optional[str] = Field(
+        None, max_length=100, description="Existing or historical ADR id; a new id is allocated when omitted"
+    )
+
+class ADRBulkUpsert(BaseModel):
+    adrs: List[ADRBulkItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
 class ADRUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=10, max_length=200)
     status: Optional[str] = Field(None, pattern="^(proposed|accepted|superseded|deprecated)$")
@@ -58,100 +105,298 @@ class ADRUpdate(BaseModel):
     actionability_score: Optional[float] = Field(None, ge=0, le=1)
     tags: Optional[List[str]] = None
 
+ADR_FIELDS = (
+    "id", "adr_id", "title", "status", "context", "decision", "consequences", "component",
+    "decision_date", "created_at", "updated_at", "confidence_score", "complexity_score",
+    "actionability_score", "tags"
+)
+# List views skip the large text columns unless they are asked for
+ADR_SUMMARY_FIELDS = tuple(f for f in ADR_FIELDS if f not in ("context", "decision", "consequences"))
+
+def _adr_fields(fields: Optional[str], default: tuple) -> List[str]:
+    """Resolve ``fields=`` to ADR columns, rejecting unknown names"""
+    try:
+        return parse_fields(fields, ADR_FIELDS, default)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _adr_record(row: asyncpg.Record, selected: List[str]) -> Dict[str, Any]:
+    """Response dict with the selected fields of an ADR row"""
+    adr = {field: row[field] for field in selected}
+    if "tags" in adr:
+        adr["tags"] = decode_json_list(row["tags"])
+    return adr
+
+BATCH_SCORE_COLUMNS = (
+    "confidence_score", "complexity_score", "actionability_score",
+    "effectiveness_score", "influence_score"
+)
+
+# One range scan per endpoint column; UNION drops self-links counted twice
+BATCH_LINKS_QUERY = """
+    SELECT id, from_adr, to_adr, relationship_type, strength::float8 AS strength, description, created_at
+    FROM decision_links WHERE from_adr = ANY($1::text[])
+    UNION
+    SELECT id, from_adr, to_adr, relationship_type, strength::float8 AS strength, description, created_at
+    FROM decision_links WHERE to_adr = ANY($1::text[])
+    ORDER BY created_at DESC
+"""
+
+# Per (ADR, evidence type) counts with ADR-level averages attached by window functions
+BATCH_EVIDENCE_QUERY = """
+    SELECT
+        adr_id,
+        evidence_type,
+        COUNT(*) AS count,
+        MAX(collection_date) AS latest_collection_date,
+        (SUM(SUM(confidence_level)) OVER w / NULLIF(SUM(COUNT(confidence_level)) OVER w, 0))::float8
+            AS adr_avg_confidence,
+        ((SUM(COUNT(*) FILTER (WHERE value_after > value_before)) OVER w)::float8
+            / NULLIF(SUM(COUNT(*) FILTER (WHERE value_before IS NOT NULL AND value_after IS NOT NULL)) OVER w, 0))
+            AS adr_success_rate
+    FROM decision_evidence
+    WHERE adr_id = ANY($1::text[])
+    GROUP BY adr_id, evidence_type
+    WINDOW w AS (PARTITION BY adr_id)
+"""
+
 # Dependency injection for database
 async def get_db():
     """Get database connection - will be injected from main.py"""
     # This will be overridden by dependency injection
     pass
 
-@adr_router.get("/", response_model=List[ADRResponse])
+@adr_router.get("/", response_model=List[ADRProjection], response_model_exclude_unset=True)
 async def list_adrs(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    skip: int = Query(0, ge=0, description="Legacy offset pagination; ignored when a cursor is given"),
     status: Optional[str] = Query(None, regex="^(proposed|accepted|superseded|deprecated)$"),
     component: Optional[str] = Query(None, min_length=1),
+    component_match: str = Query("contains", regex="^(contains|exact)$", description="Substring or exact component match"),
+    count: str = Query("estimated", regex="^(none|estimated|exact)$", description="Total count mode"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields (default: summary fields)"),
+    as_of: Optional[datetime] = Query(None, description="Only ADRs in force at this time"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     📋 List all ADRs with optional filtering
     
-    - **skip**: Pagination offset
     - **limit**: Maximum results per page
+    - **cursor**: Keyset cursor over (created_at, id); every page costs the same
+    - **skip**: Legacy pagination offset
     - **status**: Filter by ADR status
-    - **component**: Filter by component/system
+    - **component**: Filter by component/system (`component_match=exact` uses the composite index)
+    - **count**: Total in X-Total-Count: planner estimate (default), exact, or none
+    - **fields**: Fields to return (summary projection by default)
+    - **as_of**: Point in time; only ADRs whose validity period contains it
+    
+    The next page's cursor is returned in the X-Next-Cursor header.
     """
     try:
-        query = """
-            SELECT * FROM adrs 
-            WHERE ($3::text IS NULL OR status = $3)
-            AND ($4::text IS NULL OR component ILIKE '%' || $4 || '%')
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $1
+        try:
+            after = decode_cursor(cursor, (datetime, int)) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        selected = _adr_fields(fields, ADR_SUMMARY_FIELDS)
+        # The cursor needs the sort key even when it is not returned
+        columns = selected + [column for column in ("created_at", "id") if column not in selected]
+        
+        conditions = []
+        params: List[Any] = []
+        if status:
+            params.append(status)
+            conditions.append(f"status = ${len(params)}")
+        if component:
+            params.append(component)
+            if component_match == "exact":
+                conditions.append(f"component = ${len(params)}")
+            else:
+                conditions.append(f"component ILIKE '%' || ${len(params)} || '%'")
+        if as_of:
+            params.append(as_of)
+            conditions.append(f"validity @> ${len(params)}::timestamptz")
+        filter_count = len(params)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        page_conditions = list(conditions)
+        if after:
+            params.extend(after)
+            page_conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+        params.append(limit + 1)
+        
+        query = f"""
+            SELECT {', '.join(columns)} FROM adrs 
+            {f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ""}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${len(params)}
         """
+        if not after and skip:
+            params.append(skip)
+            query += f" OFFSET ${len(params)}"
         
-        rows = await db.fetch(query, skip, limit, status, component)
+        rows = await db.fetch(query, *params)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         
-        adrs = []
-        for row in rows:
-            adrs.append({
-                "id": row["id"],
-                "adr_id": row["adr_id"],
-                "title": row["title"],
-                "status": row["status"],
-                "context": row["context"],
-                "decision": row["decision"],
-                "consequences": row["consequences"],
-                "component": row["component"],
-                "decision_date": row["decision_date"],
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-                "confidence_score": row["confidence_score"],
-                "complexity_score": row["complexity_score"],
-                "actionability_score": row["actionability_score"],
-                "tags": json.loads(row["tags"]) if row["tags"] else []
-            })
+        adrs = [_adr_record(row, selected) for row in rows]
         
-        logger.info(f"📋 Retrieved {len(adrs)} ADRs (skip={skip}, limit={limit})")
-        return adrs
+        headers = {}
+        if has_more:
+            headers["X-Next-Cursor"] = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
         
+        if count != "none":
+            filter_args = params[:filter_count]
+            if count == "exact":
+                total = await db.fetchval(f"SELECT COUNT(*) FROM adrs {where}", *filter_args)
+            elif conditions:
+                total = await estimate_count(db, f"SELECT 1 FROM adrs {where}", *filter_args)
+            else:
+                total = await db.fetchval(
+                    "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'adrs'::regclass"
+                )
+            headers["X-Total-Count"] = str(total)
+            headers["X-Total-Count-Mode"] = count
+        
+        logger.info(f"📋 Retrieved {len(adrs)} ADRs (limit={limit}, cursor={'yes' if after else 'no'})")
+        # Rows come straight from the database in ADRProjection shape; skip revalidation
+        return FastJSONResponse(adrs, headers=headers)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error listing ADRs: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve ADRs")
 
-@adr_router.get("/{adr_id}", response_model=ADRResponse)
+@adr_router.post("/batch")
+async def batch_get_adrs(
+    batch: ADRBatchRequest,
+    pool: asyncpg.Pool = Depends(get_pool)
+):
+    """
+    📦 Fetch many ADRs with related data in one request
+    
+    Resolves each requested kind (ADRs, links, evidence summaries) with a single
+    `= ANY($1)` query, run concurrently through the pool. Results follow the
+    order of `ids`; unknown ids are listed under `missing`.
+    """
+    try:
+        unknown = set(batch.include) - set(BATCH_INCLUDES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown includes: {', '.join(sorted(unknown))}")
+        selected = _adr_fields(",".join(batch.fields) if batch.fields else None, ADR_SUMMARY_FIELDS)
+        ids = list(dict.fromkeys(batch.ids))
+        
+        columns = list(selected)
+        if "adr_id" not in columns:
+            columns.append("adr_id")
+        if "scores" in batch.include:
+            columns += [c for c in BATCH_SCORE_COLUMNS if c not in columns]
+        
+        plan: QueryPlan = {
+            "adrs": ("fetch", f"SELECT {', '.join(columns)} FROM adrs WHERE adr_id = ANY($1::text[])", (ids,)),
+        }
+        if "links" in batch.include:
+            plan["links"] = ("fetch", BATCH_LINKS_QUERY, (ids,))
+        if "evidence" in batch.include:
+            plan["evidence"] = ("fetch", BATCH_EVIDENCE_QUERY, (ids,))
+        
+        results = await ConcurrentQueryRunner(pool).run(plan)
+        
+        by_id = {}
+        for row in results["adrs"]:
+            adr = _adr_record(row, selected)
+            if "scores" in batch.include:
+                adr["scores"] = {column: row[column] for column in BATCH_SCORE_COLUMNS}
+            if "links" in batch.include:
+                adr["links"] = []
+            if "evidence" in batch.include:
+                adr["evidence"] = {
+                    "count": 0,
+                    "by_type": {},
+                    "avg_confidence": None,
+                    "success_rate": None,
+                    "latest_collection_date": None
+                }
+            by_id[row["adr_id"]] = adr
+        
+        for row in results.get("links", []):
+            link = {
+                "id": row["id"],
+                "from_adr": row["from_adr"],
+                "to_adr": row["to_adr"],
+                "relationship_type": row["relationship_type"],
+                "strength": row["strength"],
+                "description": row["description"],
+                "created_at": row["created_at"]
+            }
+            for endpoint in {row["from_adr"], row["to_adr"]}:
+                if endpoint in by_id:
+                    by_id[endpoint]["links"].append(link)
+        
+        for row in results.get("evidence", []):
+            # Evidence can outlive its ADR (or race a delete between the concurrent queries)
+            if row["adr_id"] not in by_id:
+                continue
+            summary = by_id[row["adr_id"]]["evidence"]
+            summary["count"] += row["count"]
+            summary["by_type"][row["evidence_type"]] = row["count"]
+            summary["avg_confidence"] = row["adr_avg_confidence"]
+            summary["success_rate"] = row["adr_success_rate"]
+            latest = row["latest_collection_date"]
+            if latest and (summary["latest_collection_date"] is None or latest > summary["latest_collection_date"]):
+                summary["latest_collection_date"] = latest
+        
+        logger.info(f"📦 Batch fetched {len(by_id)} of {len(ids)} ADRs (include={','.join(batch.include) or 'none'})")
+        return FastJSONResponse({
+            "adrs": [by_id[adr_id] for adr_id in ids if adr_id in by_id],
+            "missing": [adr_id for adr_id in ids if adr_id not in by_id]
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error batch fetching ADRs: {e}")
+        raise HTTPException(status_code=500, detail="Failed to batch fetch ADRs")
+
+@adr_router.get("/{adr_id}", response_model=ADRProjection, response_model_exclude_unset=True)
 async def get_adr(
+    request: Request,
+    response: Response,
     adr_id: str = Path(..., description="ADR identifier"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     📄 Get specific ADR by ID
     
     Returns detailed information about a single ADR including all metadata.
+    Use `fields=` to fetch only the columns you need. Responses carry an ETag;
+    a matching If-None-Match is answered with 304 after a version-only lookup.
     """
     try:
-        query = "SELECT * FROM adrs WHERE adr_id = $1"
+        selected = _adr_fields(fields, ADR_FIELDS)
+        variant = selected if fields else None
+        
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            version = await db.fetchval(f"SELECT {ROW_VERSION_SQL} FROM adrs WHERE adr_id = $1", adr_id)
+            if version is not None:
+                etag = make_etag(version, variant)
+                if etag_matches_none_match(if_none_match, etag):
+                    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": DETAIL_CACHE_CONTROL})
+        
+        query = f"SELECT {', '.join(selected)}, {ROW_VERSION_SQL} AS row_version FROM adrs WHERE adr_id = $1"
         row = await db.fetchrow(query, adr_id)
         
         if not row:
             raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
         
-        adr = {
-            "id": row["id"],
-            "adr_id": row["adr_id"],
-            "title": row["title"],
-            "status": row["status"],
-            "context": row["context"],
-            "decision": row["decision"],
-            "consequences": row["consequences"],
-            "component": row["component"],
-            "decision_date": row["decision_date"],
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
-            "confidence_score": row["confidence_score"],
-            "complexity_score": row["complexity_score"],
-            "actionability_score": row["actionability_score"],
-            "tags": json.loads(row["tags"]) if row["tags"] else []
-        }
+        adr = _adr_record(row, selected)
+        if row["row_version"] is not None:
+            response.headers["ETag"] = make_etag(row["row_version"], variant)
+            response.headers["Cache-Control"] = DETAIL_CACHE_CONTROL
         
         logger.info(f"📄 Retrieved ADR: {adr_id}")
         return adr
@@ -175,9 +420,7 @@ async def create_adr(
     """
     try:
         # Generate ADR ID
-        count_query = "SELECT COUNT(*) FROM adrs WHERE component = $1"
-        count = await db.fetchval(count_query, adr.component)
-        adr_id = f"ADR-{str(count + 1).zfill(4)}-{adr.component.upper().replace(' ', '-')}"
+        adr_id = await allocate_adr_id(db, adr.component)
         
         # Set defaults
         decision_date = adr.decision_date or datetime.now()
@@ -217,9 +460,10 @@ async def create_adr(
             "confidence_score": row["confidence_score"],
             "complexity_score": row["complexity_score"],
             "actionability_score": row["actionability_score"],
-            "tags": json.loads(row["tags"]) if row["tags"] else []
+            "tags": decode_json_list(row["tags"])
         }
         
+        data_generations.bump("adrs")
         logger.info(f"✨ Created ADR: {adr_id}")
         return new_adr
         
@@ -227,22 +471,101 @@ async def create_adr(
         logger.error(f"❌ Error creating ADR: {e}")
         raise HTTPException(status_code=500, detail="Failed to create ADR")
 
-@adr_router.put("/{adr_id}", response_model=ADRResponse)
+@adr_router.post("/bulk")
+async def upsert_adrs_bulk(
+    payload: ADRBulkUpsert,
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    📦 Bulk create or update ADRs
+    
+    Upserts up to MAX_BATCH_SIZE ADRs in one transaction. Items with an ``adr_id``
+    replace the stored ADR (or are imported under that id); optional fields left
+    out keep their stored values. Items without an ``adr_id`` get new ids,
+    allocated per component in one statement. New ADRs and ADRs whose text
+    changed are queued for embedding generation.
+    """
+    try:
+        started = datetime.now()
+        items = payload.adrs
+        supplied = [item.adr_id for item in items if item.adr_id]
+        if len(supplied) != len(set(supplied)):
+            raise HTTPException(status_code=400, detail="Duplicate adr_id in request")
+        
+        adrs = [item.model_dump(exclude_unset=True) for item in items]
+        async with db.transaction():
+            rows = await bulk_upsert_adrs(db, adrs)
+        
+        results = {row["adr_id"]: row for row in rows}
+        created = sum(1 for row in rows if row["inserted"])
+        queued = sum(1 for row in rows if row["embedding_queued"])
+        
+        data_generations.bump("adrs")
+        duration_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+        logger.info(f"📦 Bulk upserted {len(rows)} ADRs ({created} created, {duration_ms}ms)")
+        return {
+            "adrs": [
+                {
+                    "id": results[adr["adr_id"]]["id"],
+                    "adr_id": adr["adr_id"],
+                    "action": "created" if results[adr["adr_id"]]["inserted"] else "updated",
+                    "embedding_queued": results[adr["adr_id"]]["embedding_queued"]
+                }
+                for adr in adrs
+            ],
+            "summary": {
+                "received": len(items),
+                "created": created,
+                "updated": len(rows) - created,
+                "embedding_queued": queued,
+                "duration_ms": duration_ms
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error bulk upserting ADRs: {e}")
+        raise HTTPException(status_code=500, detail="Failed to upsert ADRs")
+
+@adr_router.post("/import")
+async def import_adr_corpus(
+    force: bool = Query(False, description="Re-import files whose content hash is unchanged"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    📚 Import markdown ADRs
+    
+    Parses the ADR markdown corpus (ADR_SOURCE_DIRS, default shared/docs/adr and
+    docs/adr) in parallel and upserts only ADRs whose file content changed since
+    the last import.
+    """
+    try:
+        return await adr_importer.import_directories(db, force=force)
+        
+    except Exception as e:
+        logger.error(f"❌ Error importing ADR corpus: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import ADRs")
+
+@adr_router.put("/{adr_id}", response_model=ADRProjection, response_model_exclude_unset=True)
 async def update_adr(
+    request: Request,
+    response: Response,
     adr_id: str = Path(..., description="ADR identifier"),
     adr_update: ADRUpdate = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     📝 Update existing ADR
     
     Updates specified fields of an existing ADR. Only provided fields are updated.
+    Send the ETag from a previous read as If-Match to reject the update with 412
+    if the ADR changed in the meantime.
     """
     try:
-        # Check if ADR exists
-        existing = await db.fetchrow("SELECT * FROM adrs WHERE adr_id = $1", adr_id)
-        if not existing:
-            raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
+        selected = _adr_fields(fields, ADR_FIELDS)
+        expected_versions = if_match_versions(request.headers.get("if-match"))
         
         # Build update query dynamically
         updates = {}
@@ -273,28 +596,31 @@ async def update_adr(
         
         # Build SQL
         set_clause = ", ".join([f"{k} = ${i+2}" for i, k in enumerate(updates.keys())])
-        query = f"UPDATE adrs SET {set_clause} WHERE adr_id = $1 RETURNING *"
+        if adr_update.status in ("superseded", "deprecated"):
+            # Retiring a decision closes its validity period (kept if already closed)
+            set_clause += ", valid_to = COALESCE(valid_to, NOW())"
+        params = [adr_id, *updates.values()]
+        version_check = ""
+        if expected_versions is not None:
+            params.append(expected_versions)
+            version_check = f" AND {ROW_VERSION_SQL} = ANY(${len(params)}::bigint[])"
+        query = f"""
+            UPDATE adrs SET {set_clause} WHERE adr_id = $1{version_check}
+            RETURNING {', '.join(selected)}, {ROW_VERSION_SQL} AS row_version
+        """
         
-        row = await db.fetchrow(query, adr_id, *updates.values())
+        row = await db.fetchrow(query, *params)
+        if not row:
+            if expected_versions is not None and await db.fetchval("SELECT 1 FROM adrs WHERE adr_id = $1", adr_id):
+                raise HTTPException(status_code=412, detail=f"ADR {adr_id} was modified; reload and retry")
+            raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
         
-        updated_adr = {
-            "id": row["id"],
-            "adr_id": row["adr_id"],
-            "title": row["title"],
-            "status": row["status"],
-            "context": row["context"],
-            "decision": row["decision"],
-            "consequences": row["consequences"],
-            "component": row["component"],
-            "decision_date": row["decision_date"],
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
-            "confidence_score": row["confidence_score"],
-            "complexity_score": row["complexity_score"],
-            "actionability_score": row["actionability_score"],
-            "tags": json.loads(row["tags"]) if row["tags"] else []
-        }
+        if row["row_version"] is not None:
+            response.headers["ETag"] = make_etag(row["row_version"], selected if fields else None)
+        
+        updated_adr = _adr_record(row, selected)
         
+        data_generations.bump("adrs")
         logger.info(f"📝 Updated ADR: {adr_id}")
         return updated_adr
         
@@ -320,6 +646,8 @@ async def delete_adr(
         if result == "DELETE 0":
             raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
         
+        # Evidence and links may reference the deleted ADR
+        data_generations.bump("adrs", "evidence", "links")
         logger.info(f"🗑️ Deleted ADR: {adr_id}")
         return {"message": f"ADR {adr_id} deleted successfully"}
         
@@ -334,28 +662,36 @@ async def semantic_search(
     query: str = Query(..., min_length=3, description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     threshold: float = Query(0.7, ge=0, le=1, description="Similarity threshold"),
+    as_of: Optional[datetime] = Query(None, description="Only ADRs in force at this time"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     🔍 Semantic search across ADRs using pgvector
     
     Performs vector similarity search on ADR content for intelligent discovery.
+    With ``as_of``, only decisions in force at that time are searched.
     """
     try:
         # This would integrate with pgvector for semantic search
         # For now, fallback to text search
-        search_query = """
+        params: List[Any] = [query, limit]
+        in_force = ""
+        if as_of:
+            params.append(as_of)
+            in_force = "AND validity @> $3::timestamptz"
+        search_query = f"""
             SELECT *, 
                    ts_rank(to_tsvector('english', title || ' ' || context || ' ' || decision), 
                           plainto_tsquery('english', $1)) as rank
             FROM adrs 
             WHERE to_tsvector('english', title || ' ' || context || ' ' || decision) 
                   @@ plainto_tsquery('english', $1)
+            {in_force}
             ORDER BY rank DESC
             LIMIT $2
         """
         
-        rows = await db.fetch(search_query, query, limit)
+        rows = await db.fetch(search_query, *params)
         
         results = []
         for row in rows:
@@ -3,8 +3,8 @@ Analytics API endpoints
 Advanced decision analytics and visualization data for dashboards.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 import asyncpg
 import json
@@ -12,6 +12,11 @@ import logging
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
+from services.timeseries import fetch_decision_buckets, lttb_indices, summarize_buckets
+from services.export import EXPORT_DATASETS, stream_csv, stream_parquet, parquet_available
+from services.influence import influence_ranker
+from services.rollups import evidence_rollups, ADR_EVIDENCE_STATS_QUERY
+
 logger = logging.getLogger(__name__)
 
 analytics_router = APIRouter()
@@ -133,77 +138,80 @@ async def get_dashboard_overview(
 async def get_decision_trends(
     days: int = Query(90, ge=7, le=365, description="Analysis period in days"),
     granularity: str = Query("week", regex="^(day|week|month)$", description="Time granularity"),
+    max_points: Optional[int] = Query(None, ge=3, le=1000, description="Downsample the series to at most this many points"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     📈 Decision trends over time
     
-    Returns time-series data for decision creation trends.
+    Returns gap-filled time-series data for decision creation trends. Empty
+    periods are included as zero buckets; long series can be reduced to a
+    fixed point budget with LTTB downsampling via `max_points`.
     """
     try:
         since_date = datetime.now() - timedelta(days=days)
         
-        # Map granularity to PostgreSQL date_trunc
-        trunc_mapping = {"day": "day", "week": "week", "month": "month"}
-        trunc_unit = trunc_mapping[granularity]
-        
-        trends_query = f"""
-            SELECT 
-                DATE_TRUNC('{trunc_unit}', created_at) as period,
-                COUNT(*) as decision_count,
-                AVG(confidence_score) as avg_confidence,
-                COUNT(CASE WHEN status = 'accepted' THEN 1 END) as accepted_count,
-                COUNT(CASE WHEN status = 'proposed' THEN 1 END) as proposed_count
-            FROM adrs 
-            WHERE created_at >= $1
-            GROUP BY period 
-            ORDER BY period
-        """
+        trend_data = await fetch_decision_buckets(db, since_date, granularity)
+        summary = summarize_buckets(trend_data)
         
-        rows = await db.fetch(trends_query, since_date)
-        
-        trend_data = []
-        for row in rows:
-            trend_data.append({
-                "period": row["period"].isoformat(),
-                "decision_count": row["decision_count"],
-                "avg_confidence": round(float(row["avg_confidence"] or 0), 2),
-                "accepted_count": row["accepted_count"],
-                "proposed_count": row["proposed_count"],
-                "acceptance_rate": round((row["accepted_count"] / max(row["decision_count"], 1)) * 100, 1)
-            })
-        
-        # Calculate trend direction
-        if len(trend_data) >= 2:
-            recent_avg = sum(d["decision_count"] for d in trend_data[-3:]) / min(3, len(trend_data))
-            earlier_avg = sum(d["decision_count"] for d in trend_data[:-3]) / max(len(trend_data) - 3, 1)
-            
-            trend_direction = "increasing" if recent_avg > earlier_avg * 1.1 else \
-                             "decreasing" if recent_avg < earlier_avg * 0.9 else "stable"
-        else:
-            trend_direction = "insufficient_data"
+        # Summary statistics always describe the full series
+        downsampled = max_points is not None and len(trend_data) > max_points
+        if downsampled:
+            indices = lttb_indices([d["decision_count"] for d in trend_data], max_points)
+            trend_data = [trend_data[i] for i in indices]
         
         logger.info(f"📈 Generated decision trends for {days} days ({granularity})")
         return {
             "period_days": days,
             "granularity": granularity,
-            "trend_direction": trend_direction,
+            "trend_direction": summary.pop("trend_direction"),
             "data": trend_data,
-            "summary": {
-                "total_periods": len(trend_data),
-                "total_decisions": sum(d["decision_count"] for d in trend_data),
-                "avg_decisions_per_period": round(sum(d["decision_count"] for d in trend_data) / max(len(trend_data), 1), 1),
-                "overall_acceptance_rate": round(
-                    sum(d["accepted_count"] for d in trend_data) * 100 / 
-                    max(sum(d["decision_count"] for d in trend_data), 1), 1
-                )
-            }
+            "downsampled": downsampled,
+            "summary": summary
         }
         
     except Exception as e:
         logger.error(f"❌ Error generating decision trends: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate decision trends")
 
+@analytics_router.get("/charts/evidence-trends")
+async def get_evidence_trends(
+    days: int = Query(30, ge=1, le=365),
+    granularity: str = Query("day", regex="^(hour|day)$"),
+    adr_id: Optional[str] = Query(None),
+    component: Optional[str] = Query(None),
+    metric_unit: Optional[str] = Query(None),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    ⏱️ Evidence metric trends
+    
+    Returns min/max/avg values, evidence counts and success rates per time bucket
+    and metric unit, read from the pre-aggregated evidence rollups.
+    """
+    try:
+        if granularity == "hour" and days > 31:
+            raise HTTPException(status_code=400, detail="Hourly evidence trends are limited to 31 days")
+        
+        since_date = datetime.now() - timedelta(days=days)
+        series = await evidence_rollups.fetch_series(
+            db, granularity, since_date, adr_id=adr_id, component=component, metric_unit=metric_unit
+        )
+        
+        logger.info(f"⏱️ Generated evidence trends for {days} days ({len(series)} buckets)")
+        return {
+            "period_days": days,
+            "granularity": granularity,
+            "filters": {"adr_id": adr_id, "component": component, "metric_unit": metric_unit},
+            "data": series
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error generating evidence trends: {e}")
+        raise HTTPException(status_code=500, detail="Failed to generate evidence trends")
+
 @analytics_router.get("/charts/component-distribution")
 async def get_component_distribution(
     days: int = Query(30, ge=1, le=365),
@@ -296,23 +304,22 @@ async def get_effectiveness_matrix(
                 a.complexity_score,
                 a.actionability_score,
                 a.created_at,
-                COUNT(de.id) as evidence_count,
-                AVG(CASE 
-                    WHEN de.value_before IS NOT NULL AND de.value_after IS NOT NULL 
-                    THEN CASE WHEN de.value_after > de.value_before THEN 1.0 ELSE 0.0 END 
-                END) as success_rate,
+                COALESCE(es.evidence_count, 0) as evidence_count,
+                es.success_rate,
                 COUNT(dl.id) as link_count
             FROM adrs a
-            LEFT JOIN decision_evidence de ON a.adr_id = de.adr_id
+            LEFT JOIN ({evidence_stats}) es ON es.adr_id = a.adr_id
             LEFT JOIN decision_links dl ON (a.adr_id = dl.from_adr OR a.adr_id = dl.to_adr)
             WHERE a.created_at >= $1 
             AND a.confidence_score IS NOT NULL
             AND a.complexity_score IS NOT NULL
             GROUP BY a.adr_id, a.title, a.component, a.status, a.confidence_score, 
-                     a.complexity_score, a.actionability_score, a.created_at
+                     a.complexity_score, a.actionability_score, a.created_at,
+                     es.evidence_count, es.success_rate
             ORDER BY a.created_at DESC
-        """
+        """.format(evidence_stats=ADR_EVIDENCE_STATS_QUERY)
         
+        await evidence_rollups.ensure_current(db)
         rows = await db.fetch(matrix_query, since_date)
         
         matrix_data = []
@@ -383,6 +390,82 @@ async def get_effectiveness_matrix(
         logger.error(f"❌ Error generating effectiveness matrix: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate effectiveness matrix")
 
+@analytics_router.get("/charts/influence-ranking")
+async def get_influence_ranking(
+    limit: int = Query(25, ge=1, le=500),
+    component: Optional[str] = Query(None),
+    refresh: bool = Query(False, description="Incrementally refresh scores first if links changed"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🌐 Most influential decisions
+    
+    Ranks ADRs by weighted PageRank over decision links (link strength as weight).
+    Returns the stored scores; they are written by POST /influence/recompute, or
+    incrementally here with `refresh=true`.
+    """
+    try:
+        refresh_stats = await influence_ranker.refresh(db) if refresh else {"refreshed": False, "updated": 0}
+        
+        conditions = ["influence_score IS NOT NULL"]
+        params = []
+        if component:
+            params.append(component)
+            conditions.append(f"component = ${len(params)}")
+        params.append(limit)
+        
+        rows = await db.fetch(f"""
+            SELECT adr_id, title, component, status, influence_score, influence_scored_at
+            FROM adrs
+            WHERE {' AND '.join(conditions)}
+            ORDER BY influence_score DESC
+            LIMIT ${len(params)}
+        """, *params)
+        
+        top_score = float(rows[0]["influence_score"]) if rows else 0.0
+        ranking = [
+            {
+                "rank": position,
+                "adr_id": row["adr_id"],
+                "title": row["title"],
+                "component": row["component"],
+                "status": row["status"],
+                "influence_score": float(row["influence_score"]),
+                "relative_influence": round(float(row["influence_score"]) / top_score, 4) if top_score else 0.0,
+                "scored_at": row["influence_scored_at"]
+            }
+            for position, row in enumerate(rows, start=1)
+        ]
+        
+        logger.info(f"🌐 Generated influence ranking ({len(ranking)} decisions)")
+        return {
+            "ranking": ranking,
+            "total_ranked": len(ranking),
+            "refresh": refresh_stats
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error generating influence ranking: {e}")
+        raise HTTPException(status_code=500, detail="Failed to generate influence ranking")
+
+@analytics_router.post("/influence/recompute")
+async def recompute_influence(
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🔄 Recompute influence scores for every linked decision
+    
+    Runs a cold-start PageRank over the full decision graph and rewrites stored scores.
+    """
+    try:
+        result = await influence_ranker.refresh(db, force=True)
+        logger.info(f"🔄 Recomputed influence scores for {result['nodes']} decisions")
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ Error recomputing influence scores: {e}")
+        raise HTTPException(status_code=500, detail="Failed to recompute influence scores")
+
 @analytics_router.get("/reports/comprehensive")
 async def generate_comprehensive_report(
     days: int = Query(30, ge=7, le=365),
@@ -551,4 +634,41 @@ async def generate_comprehensive_report(
         
     except Exception as e:
         logger.error(f"❌ Error generating comprehensive report: {e}")
-        raise HTTPException(status_code=500, detail="Failed to generate comprehensive report")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to generate comprehensive report")
+
+@analytics_router.get("/export/{dataset}")
+async def export_dataset(
+    dataset: str = Path(..., regex="^(effectiveness-matrix|evidence)$", description="Dataset to export"),
+    format: str = Query("csv", regex="^(csv|parquet)$", description="Output format"),
+    days: int = Query(365, ge=1, le=3650, description="Export window in days"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    📤 Stream an analytics dataset as CSV or Parquet
+    
+    Rows are read from a server-side cursor and written in chunks, so memory use
+    stays constant regardless of the export size. Parquet requires pyarrow.
+    """
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow to be installed")
+    
+    since_date = datetime.now() - timedelta(days=days)
+    spec = EXPORT_DATASETS[dataset]
+    if spec.get("rollups"):
+        await evidence_rollups.ensure_current(db)
+    
+    if format == "parquet":
+        body = stream_parquet(db, spec["columns"], spec["query"], since_date)
+        media_type = "application/vnd.apache.parquet"
+    else:
+        body = stream_csv(db, spec["columns"], spec["query"], since_date)
+        media_type = "text/csv; charset=utf-8"
+    
+    filename = f"{dataset}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{format}"
+    
+    logger.info(f"📤 Streaming {dataset} export as {format} ({days} days)")
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -3,8 +3,8 @@ Decision Management API endpoints
 Integrates with Chronicle-Keeper decision tracking and analytics system.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, BackgroundTasks, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 import asyncpg
 import json
@@ -12,10 +12,73 @@ import logging
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
+from services.cache import data_generations
+from services.effectiveness import EffectivenessScorer, effectiveness_recommendation
+from services.graph import decision_graph
+from services.supersession import supersession_resolver
+from services.conflicts import conflict_detector
+from services.rollups import evidence_rollups
+from services.ingest import EvidenceIngestor, iter_ndjson_records, iter_csv_records
+from services.graph_export import GRAPH_EXPORT_FORMATS, stream_graph, gzip_stream
+from services.serialization import FastJSONResponse
+from services.pagination import encode_cursor, decode_cursor, parse_fields
+from api.dependencies import get_pool
+
 logger = logging.getLogger(__name__)
 
 decision_router = APIRouter()
 
+MAX_BULK_LINKS = 5000
+
+LINK_FIELDS = (
+    "id", "from_adr", "to_adr", "relationship_type", "strength",
+    "description", "created_at", "from_details", "to_details"
+)
+# Detail field -> (adrs alias, link endpoint column)
+LINK_DETAIL_JOINS = {"from_details": ("a1", "from_adr"), "to_details": ("a2", "to_adr")}
+
+# Classifies every submitted link in one pass (missing endpoints, existing links,
+# repeats within the batch) and inserts the valid ones in the same statement.
+BULK_LINK_QUERY = """
+    WITH input AS (
+        SELECT *
+        FROM unnest($1::text[], $2::text[], $3::text[], $4::float8[], $5::text[])
+            WITH ORDINALITY AS i(from_adr, to_adr, relationship_type, strength, description, position)
+    ),
+    classified AS (
+        SELECT
+            i.*,
+            CASE
+                WHEN fa.adr_id IS NULL THEN 'from_not_found'
+                WHEN ta.adr_id IS NULL THEN 'to_not_found'
+                WHEN EXISTS (
+                    SELECT 1 FROM decision_links dl WHERE dl.from_adr = i.from_adr AND dl.to_adr = i.to_adr
+                ) THEN 'exists'
+                WHEN i.position > MIN(i.position) OVER (PARTITION BY i.from_adr, i.to_adr) THEN 'duplicate_in_batch'
+                ELSE 'created'
+            END AS outcome
+        FROM input i
+        LEFT JOIN adrs fa ON fa.adr_id = i.from_adr
+        LEFT JOIN adrs ta ON ta.adr_id = i.to_adr
+    ),
+    inserted AS (
+        INSERT INTO decision_links (from_adr, to_adr, relationship_type, strength, description)
+        SELECT from_adr, to_adr, relationship_type, strength, description
+        FROM classified
+        WHERE outcome = 'created'
+        ORDER BY position
+        ON CONFLICT DO NOTHING
+        RETURNING *
+    )
+    SELECT
+        c.position, c.from_adr, c.to_adr, c.outcome,
+        ins.id, ins.relationship_type, ins.strength, ins.description, ins.created_at
+    FROM classified c
+    LEFT JOIN inserted ins
+        ON c.outcome = 'created' AND ins.from_adr = c.from_adr AND ins.to_adr = c.to_adr
+    ORDER BY c.position
+"""
+
 # Pydantic models
 class DecisionLink(BaseModel):
     from_adr: str
@@ -24,6 +87,9 @@ class DecisionLink(BaseModel):
     strength: float = Field(..., ge=0, le=1)
     description: Optional[str] = None
 
+class BulkLinkCreate(BaseModel):
+    links: List[DecisionLink] = Field(..., min_length=1, max_length=MAX_BULK_LINKS)
+
 class EvidenceCreate(BaseModel):
     adr_id: str
     evidence_type: str = Field(..., pattern="^(metric|feedback|outcome|observation)$")
@@ -44,6 +110,8 @@ class DecisionAnalytics(BaseModel):
     top_components: List[Dict[str, Any]]
     trend_analysis: Dict[str, Any]
 
+evidence_ingestor = EvidenceIngestor(EvidenceCreate.model_validate)
+
 # Dependency injection for database
 async def get_db():
     """Get database connection - will be injected from main.py"""
@@ -154,58 +222,114 @@ async def get_decision_analytics(
 async def list_decision_links(
     adr_id: Optional[str] = Query(None, description="Filter by specific ADR"),
     relationship_type: Optional[str] = Query(None, regex="^(extends|supersedes|conflicts|depends|influences)$"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum links per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to return ({', '.join(LINK_FIELDS)})"),
     db: asyncpg.Connection = Depends(get_db)
 ):
     """
     🔗 List decision links and relationships
     
-    Shows how ADRs are connected and influence each other.
+    Shows how ADRs are connected and influence each other. Results are ordered
+    newest first and paginated with an opaque cursor over (created_at, id).
     """
     try:
-        query = """
-            SELECT dl.*, 
-                   a1.title as from_title, a1.component as from_component,
-                   a2.title as to_title, a2.component as to_component
-            FROM decision_links dl
-            JOIN adrs a1 ON dl.from_adr = a1.adr_id
-            JOIN adrs a2 ON dl.to_adr = a2.adr_id
-            WHERE ($1::text IS NULL OR dl.from_adr = $1 OR dl.to_adr = $1)
-            AND ($2::text IS NULL OR dl.relationship_type = $2)
-            ORDER BY dl.created_at DESC
+        try:
+            selected = parse_fields(fields, LINK_FIELDS, LINK_FIELDS)
+            after = decode_cursor(cursor, (datetime, int)) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        details = [field for field in selected if field in LINK_DETAIL_JOINS]
+        link_columns = ["id", "created_at"] + [
+            field for field in selected if field not in LINK_DETAIL_JOINS and field not in ("id", "created_at")
+        ]
+        for field in details:
+            endpoint = LINK_DETAIL_JOINS[field][1]
+            if endpoint not in link_columns:
+                link_columns.append(endpoint)
+        
+        params: List[Any] = []
+        conditions = []
+        if relationship_type:
+            params.append(relationship_type)
+            conditions.append(f"relationship_type = ${len(params)}")
+        if after:
+            params.extend(after)
+            conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+        params.append(limit + 1)
+        limit_ref = f"${len(params)}"
+        
+        inner_columns = ", ".join(link_columns)
+        if adr_id:
+            # One index range scan per endpoint column instead of an OR over both
+            params.append(adr_id)
+            extra = "".join(f" AND {condition}" for condition in conditions)
+            page_query = f"""
+                (SELECT {inner_columns} FROM decision_links WHERE from_adr = ${len(params)}{extra}
+                 ORDER BY created_at DESC, id DESC LIMIT {limit_ref})
+                UNION
+                (SELECT {inner_columns} FROM decision_links WHERE to_adr = ${len(params)}{extra}
+                 ORDER BY created_at DESC, id DESC LIMIT {limit_ref})
+            """
+        else:
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            page_query = f"""
+                SELECT {inner_columns} FROM decision_links {where}
+                ORDER BY created_at DESC, id DESC LIMIT {limit_ref}
+            """
+        
+        select_columns = [f"dl.{column}" for column in link_columns]
+        joins = []
+        for field in details:
+            alias, endpoint = LINK_DETAIL_JOINS[field]
+            select_columns += [f"{alias}.title AS {alias}_title", f"{alias}.component AS {alias}_component"]
+            joins.append(f"LEFT JOIN adrs {alias} ON {alias}.adr_id = dl.{endpoint}")
+        
+        query = f"""
+            SELECT {', '.join(select_columns)}
+            FROM ({page_query}) dl
+            {' '.join(joins)}
+            ORDER BY dl.created_at DESC, dl.id DESC
+            LIMIT {limit_ref}
         """
         
-        rows = await db.fetch(query, adr_id, relationship_type)
+        rows = await db.fetch(query, *params)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         
         links = []
         for row in rows:
-            links.append({
-                "id": row["id"],
-                "from_adr": row["from_adr"],
-                "to_adr": row["to_adr"],
-                "relationship_type": row["relationship_type"],
-                "strength": float(row["strength"]),
-                "description": row["description"],
-                "created_at": row["created_at"],
-                "from_details": {
-                    "title": row["from_title"],
-                    "component": row["from_component"]
-                },
-                "to_details": {
-                    "title": row["to_title"],
-                    "component": row["to_component"]
-                }
-            })
+            link = {}
+            for field in selected:
+                if field in LINK_DETAIL_JOINS:
+                    alias = LINK_DETAIL_JOINS[field][0]
+                    link[field] = {
+                        "title": row[f"{alias}_title"],
+                        "component": row[f"{alias}_component"]
+                    }
+                elif field == "strength":
+                    link[field] = float(row["strength"])
+                else:
+                    link[field] = row[field]
+            links.append(link)
+        
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"]) if has_more else None
         
         logger.info(f"🔗 Retrieved {len(links)} decision links")
-        return {
+        return FastJSONResponse({
             "links": links,
             "total": len(links),
+            "has_more": has_more,
+            "next_cursor": next_cursor,
             "filters": {
                 "adr_id": adr_id,
                 "relationship_type": relationship_type
             }
-        }
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error retrieving decision links: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve decision links")
@@ -261,6 +385,7 @@ async def create_decision_link(
             "created_at": row["created_at"]
         }
         
+        decision_graph.record_created_link(row)
         logger.info(f"🔗 Created decision link: {link.from_adr} -> {link.to_adr}")
         return new_link
         
@@ -270,6 +395,372 @@ async def create_decision_link(
         logger.error(f"❌ Error creating decision link: {e}")
         raise HTTPException(status_code=500, detail="Failed to create decision link")
 
+@decision_router.post("/links/bulk")
+async def bulk_create_decision_links(
+    payload: BulkLinkCreate,
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🔗 Create many decision links at once
+    
+    Validates endpoints and duplicates for the whole batch and inserts the valid
+    links in a single statement. Returns an outcome per submitted link, in order:
+    created, exists, duplicate_in_batch, from_not_found or to_not_found.
+    """
+    try:
+        links = payload.links
+        rows = await db.fetch(
+            BULK_LINK_QUERY,
+            [link.from_adr for link in links],
+            [link.to_adr for link in links],
+            [link.relationship_type for link in links],
+            [link.strength for link in links],
+            [link.description for link in links]
+        )
+        
+        results = []
+        created_rows = []
+        for row in rows:
+            outcome = row["outcome"]
+            if outcome == "created" and row["id"] is None:
+                # Inserted concurrently by another request
+                outcome = "exists"
+            result = {
+                "index": row["position"] - 1,
+                "from_adr": row["from_adr"],
+                "to_adr": row["to_adr"],
+                "outcome": outcome
+            }
+            if outcome == "created":
+                created_rows.append(row)
+                result["link"] = {
+                    "id": row["id"],
+                    "from_adr": row["from_adr"],
+                    "to_adr": row["to_adr"],
+                    "relationship_type": row["relationship_type"],
+                    "strength": float(row["strength"]),
+                    "description": row["description"],
+                    "created_at": row["created_at"]
+                }
+            results.append(result)
+        
+        decision_graph.record_created_links(created_rows)
+        
+        summary = {}
+        for result in results:
+            summary[result["outcome"]] = summary.get(result["outcome"], 0) + 1
+        
+        logger.info(f"🔗 Bulk link request: {summary.get('created', 0)} of {len(links)} links created")
+        return {"results": results, "summary": summary}
+        
+    except Exception as e:
+        logger.error(f"❌ Error bulk creating decision links: {e}")
+        raise HTTPException(status_code=500, detail="Failed to bulk create decision links")
+
+async def _adr_summaries(db: asyncpg.Connection, adr_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Title, component and status for a set of ADRs in one query"""
+    if not adr_ids:
+        return {}
+    rows = await db.fetch(
+        "SELECT adr_id, title, component, status FROM adrs WHERE adr_id = ANY($1::text[])",
+        adr_ids
+    )
+    return {
+        row["adr_id"]: {"title": row["title"], "component": row["component"], "status": row["status"]}
+        for row in rows
+    }
+
+@decision_router.get("/graph/export")
+async def export_decision_graph(
+    format: str = Query("json", regex="^(json|graphml|edgelist)$", description="JSON Graph, GraphML or TSV edge list"),
+    component: Optional[str] = Query(None, description="Only export ADRs in this component"),
+    status: Optional[str] = Query(None, regex="^(proposed|accepted|superseded|deprecated)$"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🗺️ Stream the decision graph
+    
+    Exports ADR nodes and link edges in one consistent snapshot, read through
+    server-side cursors so memory use stays constant for large graphs. With
+    filters, only links whose both endpoints match are included.
+    """
+    media_type, extension = GRAPH_EXPORT_FORMATS[format]
+    body = stream_graph(db, format, component, status)
+    filename = f"decision-graph-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{extension}"
+    
+    if gzip:
+        body = gzip_stream(body)
+        media_type = "application/gzip"
+        filename += ".gz"
+    
+    logger.info(f"🗺️ Streaming decision graph export as {format}{' (gzip)' if gzip else ''}")
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@decision_router.get("/graph/neighbors/{adr_id}")
+async def get_graph_neighbors(
+    adr_id: str = Path(..., description="ADR identifier"),
+    direction: str = Query("both", regex="^(out|in|both)$"),
+    relationship_type: Optional[str] = Query(None, regex="^(extends|supersedes|conflicts|depends|influences)$"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🕸️ Directly linked decisions
+    
+    Served from the in-memory decision graph; only the returned ADRs' titles are queried.
+    """
+    try:
+        await decision_graph.ensure_loaded(db)
+        neighbors = decision_graph.neighbors(adr_id, direction, relationship_type)
+        
+        details = await _adr_summaries(db, list({n["adr_id"] for n in neighbors}))
+        for neighbor in neighbors:
+            neighbor["details"] = details.get(neighbor["adr_id"])
+        
+        return {
+            "adr_id": adr_id,
+            "neighbors": neighbors,
+            "total": len(neighbors),
+            "filters": {
+                "direction": direction,
+                "relationship_type": relationship_type
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error retrieving graph neighbors for {adr_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve graph neighbors")
+
+@decision_router.get("/graph/k-hop/{adr_id}")
+async def get_graph_k_hop(
+    adr_id: str = Path(..., description="ADR identifier"),
+    k: int = Query(2, ge=1, le=6, description="Maximum number of hops"),
+    direction: str = Query("both", regex="^(out|in|both)$"),
+    limit: int = Query(500, ge=1, le=10000, description="Maximum decisions to return"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🕸️ Decisions reachable within k hops
+    
+    Returns reachable ADRs ordered by hop distance.
+    """
+    try:
+        await decision_graph.ensure_loaded(db)
+        reachable = decision_graph.k_hop(adr_id, k, direction)
+        
+        return {
+            "adr_id": adr_id,
+            "k": k,
+            "direction": direction,
+            "total_reachable": len(reachable),
+            "decisions": [
+                {"adr_id": node, "distance": distance}
+                for node, distance in list(reachable.items())[:limit]
+            ]
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error computing k-hop neighbourhood for {adr_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to compute k-hop neighbourhood")
+
+@decision_router.get("/graph/path")
+async def get_graph_path(
+    from_adr: str = Query(..., description="Start ADR identifier"),
+    to_adr: str = Query(..., description="Target ADR identifier"),
+    direction: str = Query("both", regex="^(out|in|both)$"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🧭 Shortest relationship path between two decisions
+    
+    Finds the fewest-hop chain of links connecting two ADRs.
+    """
+    try:
+        await decision_graph.ensure_loaded(db)
+        path = decision_graph.shortest_path(from_adr, to_adr, direction)
+        
+        details = await _adr_summaries(db, path or [])
+        
+        return {
+            "from_adr": from_adr,
+            "to_adr": to_adr,
+            "direction": direction,
+            "connected": path is not None,
+            "hops": len(path) - 1 if path else None,
+            "path": [{"adr_id": node, "details": details.get(node)} for node in path or []]
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error finding path {from_adr} -> {to_adr}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to find decision path")
+
+@decision_router.get("/graph/components")
+async def get_graph_components(
+    top_n: int = Query(10, ge=1, le=100, description="Number of largest components to return"),
+    min_size: int = Query(2, ge=1, description="Ignore components smaller than this"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🧩 Connected decision clusters
+    
+    Summarizes weakly connected components of the decision graph.
+    """
+    try:
+        await decision_graph.ensure_loaded(db)
+        return decision_graph.components_summary(top_n, min_size)
+        
+    except Exception as e:
+        logger.error(f"❌ Error computing graph components: {e}")
+        raise HTTPException(status_code=500, detail="Failed to compute graph components")
+
+@decision_router.get("/graph/components/{adr_id}")
+async def get_graph_component(
+    adr_id: str = Path(..., description="ADR identifier"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🧩 Connected cluster containing a decision
+    
+    Lists every ADR linked to this one through any chain of relationships.
+    """
+    try:
+        await decision_graph.ensure_loaded(db)
+        members = decision_graph.component_of(adr_id)
+        
+        return {
+            "adr_id": adr_id,
+            "members": members,
+            "size": len(members)
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error computing component for {adr_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to compute decision component")
+
+@decision_router.get("/supersession/{adr_id}")
+async def resolve_supersession(
+    adr_id: str = Path(..., description="ADR identifier"),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🧬 Resolve the currently effective decision
+    
+    Follows `supersedes` links to the newest decision that replaces this ADR and
+    returns the full lineage (older decisions at negative depth, newer at positive).
+    """
+    try:
+        resolution = await supersession_resolver.resolve(db, adr_id)
+        if resolution is None:
+            raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
+        
+        logger.info(f"🧬 Resolved supersession for {adr_id}: {len(resolution['lineage'])} decisions in lineage")
+        return resolution
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error resolving supersession for {adr_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to resolve supersession")
+
+@decision_router.post("/conflicts/scan", status_code=202)
+async def start_conflict_scan(
+    background_tasks: BackgroundTasks,
+    threshold: Optional[float] = Query(None, ge=0.5, le=1.0, description="Minimum cosine similarity"),
+    pool: asyncpg.Pool = Depends(get_pool)
+):
+    """
+    ⚔️ Start a conflict and duplicate scan
+    
+    Compares embeddings of all accepted ADRs within each component in the background
+    and replaces the stored candidate list when finished.
+    """
+    if conflict_detector.running:
+        raise HTTPException(status_code=409, detail="A conflict scan is already running")
+    
+    conflict_detector.running = True
+    background_tasks.add_task(conflict_detector.run_in_background, pool, threshold)
+    
+    logger.info("⚔️ Conflict scan scheduled")
+    return {"status": "started", "threshold": threshold or conflict_detector.threshold}
+
+@decision_router.get("/conflicts/scan")
+async def get_conflict_scan_status():
+    """
+    ⚔️ Status of the most recent conflict scan
+    """
+    return {"running": conflict_detector.running, "last_scan": conflict_detector.last_scan}
+
+@decision_router.get("/conflicts")
+async def list_conflict_candidates(
+    component: Optional[str] = Query(None),
+    candidate_type: Optional[str] = Query(None, regex="^(conflict|duplicate)$"),
+    min_similarity: float = Query(0.0, ge=0.0, le=1.0),
+    unlinked_only: bool = Query(True, description="Hide pairs that are already linked"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    ⚔️ Candidate conflicts and duplicates from the last scan
+    
+    Pairs of same-component accepted ADRs with highly similar content, most similar first.
+    """
+    try:
+        conditions = ["c.similarity >= $1"]
+        params: List[Any] = [min_similarity]
+        
+        if component:
+            params.append(component)
+            conditions.append(f"c.component = ${len(params)}")
+        
+        if candidate_type:
+            params.append(candidate_type)
+            conditions.append(f"c.candidate_type = ${len(params)}")
+        
+        if unlinked_only:
+            conditions.append("""
+                NOT EXISTS (
+                    SELECT 1 FROM decision_links dl
+                    WHERE (dl.from_adr = c.adr_a AND dl.to_adr = c.adr_b)
+                    OR (dl.from_adr = c.adr_b AND dl.to_adr = c.adr_a)
+                )
+            """)
+        
+        params.append(limit)
+        rows = await db.fetch(f"""
+            SELECT
+                c.adr_a, a.title AS title_a, c.adr_b, b.title AS title_b,
+                c.component, c.similarity, c.candidate_type, c.detected_at
+            FROM decision_conflict_candidates c
+            JOIN adrs a ON a.adr_id = c.adr_a
+            JOIN adrs b ON b.adr_id = c.adr_b
+            WHERE {' AND '.join(conditions)}
+            ORDER BY c.similarity DESC
+            LIMIT ${len(params)}
+        """, *params)
+        
+        candidates = [
+            {
+                "adr_a": {"adr_id": row["adr_a"], "title": row["title_a"]},
+                "adr_b": {"adr_id": row["adr_b"], "title": row["title_b"]},
+                "component": row["component"],
+                "similarity": round(float(row["similarity"]), 4),
+                "candidate_type": row["candidate_type"],
+                "detected_at": row["detected_at"]
+            }
+            for row in rows
+        ]
+        
+        logger.info(f"⚔️ Retrieved {len(candidates)} conflict candidates")
+        return {"candidates": candidates, "total": len(candidates)}
+        
+    except Exception as e:
+        logger.error(f"❌ Error listing conflict candidates: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list conflict candidates")
+
 @decision_router.get("/evidence/{adr_id}")
 async def get_decision_evidence(
     adr_id: str = Path(..., description="ADR identifier"),
@@ -337,6 +828,41 @@ async def get_decision_evidence(
         logger.error(f"❌ Error retrieving evidence for {adr_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve evidence")
 
+@decision_router.post("/evidence/bulk")
+async def bulk_create_evidence(
+    request: Request,
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    📥 Bulk-load evidence from an NDJSON or CSV stream
+    
+    Send `application/x-ndjson` (one EvidenceCreate object per line) or `text/csv`
+    (header row with EvidenceCreate field names). The body is parsed as it streams,
+    ADR references are checked per batch and valid rows are loaded with COPY.
+    Invalid records are skipped and reported by line number. The load runs in one
+    transaction, so a failure part-way leaves nothing behind and can be retried.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in ("application/x-ndjson", "application/jsonl", "application/json"):
+        records = iter_ndjson_records(request.stream())
+    elif content_type in ("text/csv", "application/csv"):
+        records = iter_csv_records(request.stream())
+    else:
+        raise HTTPException(status_code=415, detail="Expected application/x-ndjson or text/csv")
+    
+    try:
+        async with db.transaction():
+            result = await evidence_ingestor.ingest(db, records)
+        
+        if result["inserted"]:
+            data_generations.bump("evidence")
+        logger.info(f"📥 Bulk evidence load: {result['inserted']} of {result['received']} records inserted")
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ Error bulk loading evidence: {e}")
+        raise HTTPException(status_code=500, detail="Failed to bulk load evidence")
+
 @decision_router.post("/evidence")
 async def create_evidence(
     evidence: EvidenceCreate,
@@ -363,12 +889,14 @@ async def create_evidence(
             RETURNING *
         """
         
-        row = await db.fetchrow(
-            insert_query,
-            evidence.adr_id, evidence.evidence_type, evidence.description,
-            evidence.value_before, evidence.value_after, evidence.metric_unit,
-            collection_date, evidence.confidence_level
-        )
+        async with db.transaction():
+            row = await db.fetchrow(
+                insert_query,
+                evidence.adr_id, evidence.evidence_type, evidence.description,
+                evidence.value_before, evidence.value_after, evidence.metric_unit,
+                collection_date, evidence.confidence_level
+            )
+            await evidence_rollups.mark_pending(db, [evidence.adr_id])
         
         new_evidence = {
             "id": row["id"],
@@ -383,6 +911,7 @@ async def create_evidence(
             "created_at": row["created_at"]
         }
         
+        data_generations.bump("evidence")
         logger.info(f"📊 Created evidence for {evidence.adr_id}: {evidence.evidence_type}")
         return new_evidence
         
@@ -392,6 +921,81 @@ async def create_evidence(
         logger.error(f"❌ Error creating evidence: {e}")
         raise HTTPException(status_code=500, detail="Failed to create evidence")
 
+@decision_router.get("/effectiveness")
+async def rank_decision_effectiveness(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum decisions to return"),
+    status: Optional[str] = Query(None, regex="^(proposed|accepted|superseded|deprecated)$"),
+    component: Optional[str] = Query(None, min_length=1),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🏆 Rank decisions by stored effectiveness score
+    
+    Reads the scores persisted by the batch scorer; run
+    `POST /effectiveness/recompute` to refresh them.
+    """
+    try:
+        query = """
+            SELECT adr_id, title, component, status, effectiveness_score, effectiveness_scored_at
+            FROM adrs
+            WHERE effectiveness_score IS NOT NULL
+            AND ($1::text IS NULL OR status = $1)
+            AND ($2::text IS NULL OR component ILIKE '%' || $2 || '%')
+            ORDER BY effectiveness_score DESC, adr_id
+            LIMIT $3
+        """
+        
+        rows = await db.fetch(query, status, component, limit)
+        
+        decisions = [
+            {
+                "adr_id": row["adr_id"],
+                "title": row["title"],
+                "component": row["component"],
+                "status": row["status"],
+                "effectiveness_score": float(row["effectiveness_score"]),
+                "scored_at": row["effectiveness_scored_at"],
+                "recommendation": effectiveness_recommendation(float(row["effectiveness_score"]))
+            }
+            for row in rows
+        ]
+        
+        logger.info(f"🏆 Ranked {len(decisions)} decisions by effectiveness")
+        return {
+            "decisions": decisions,
+            "total": len(decisions),
+            "filters": {
+                "status": status,
+                "component": component,
+                "limit": limit
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error ranking decision effectiveness: {e}")
+        raise HTTPException(status_code=500, detail="Failed to rank decision effectiveness")
+
+@decision_router.post("/effectiveness/recompute")
+async def recompute_decision_effectiveness(
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """
+    🔄 Recompute effectiveness scores for all ADRs
+    
+    Loads evidence and link aggregates for the whole ADR set in one query,
+    scores every decision with NumPy and stores the result on `adrs.effectiveness_score`.
+    """
+    try:
+        started = datetime.now()
+        result = await EffectivenessScorer(db).recompute_all()
+        result["duration_ms"] = round((datetime.now() - started).total_seconds() * 1000, 1)
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ Error recomputing effectiveness scores: {e}")
+        raise HTTPException(status_code=500, detail="Failed to recompute effectiveness scores")
+
 @decision_router.get("/effectiveness/{adr_id}")
 async def analyze_decision_effectiveness(
     adr_id: str = Path(..., description="ADR identifier"),
@@ -403,76 +1007,33 @@ async def analyze_decision_effectiveness(
     Provides comprehensive effectiveness analysis based on evidence and metrics.
     """
     try:
-        # Get ADR info
-        adr = await db.fetchrow("SELECT * FROM adrs WHERE adr_id = $1", adr_id)
-        if not adr:
+        scored = await EffectivenessScorer(db).score([adr_id])
+        if not scored["adr_id"]:
             raise HTTPException(status_code=404, detail=f"ADR {adr_id} not found")
         
-        # Get evidence
-        evidence_query = """
-            SELECT * FROM decision_evidence 
-            WHERE adr_id = $1 
-            ORDER BY collection_date ASC
-        """
-        evidence_rows = await db.fetch(evidence_query, adr_id)
-        
-        # Calculate effectiveness metrics
-        evidence_count = len(evidence_rows)
-        avg_confidence = sum(float(row["confidence_level"]) for row in evidence_rows) / evidence_count if evidence_count > 0 else 0
-        
-        # Calculate impact metrics
-        positive_impacts = 0
-        negative_impacts = 0
-        total_impacts = 0
-        
-        for row in evidence_rows:
-            if row["value_before"] and row["value_after"]:
-                total_impacts += 1
-                if row["value_after"] > row["value_before"]:
-                    positive_impacts += 1
-                else:
-                    negative_impacts += 1
-        
-        success_rate = (positive_impacts / total_impacts) * 100 if total_impacts > 0 else 0
-        
-        # Get decision links (influence factor)
-        links_count = await db.fetchval(
-            "SELECT COUNT(*) FROM decision_links WHERE from_adr = $1 OR to_adr = $1",
-            adr_id
-        )
-        
-        # Calculate overall effectiveness score
-        base_score = float(adr["confidence_score"] or 0.5) * 0.3
-        evidence_score = min(evidence_count / 5.0, 1.0) * 0.2  # Up to 5 evidence entries for full score
-        confidence_score = avg_confidence * 0.2
-        success_score = (success_rate / 100) * 0.2
-        influence_score = min(links_count / 3.0, 1.0) * 0.1  # Up to 3 links for full influence score
-        
-        effectiveness_score = base_score + evidence_score + confidence_score + success_score + influence_score
+        effectiveness_score = float(scored["effectiveness_score"][0])
         
         analysis = {
             "adr_id": adr_id,
-            "title": adr["title"],
-            "status": adr["status"],
+            "title": scored["title"][0],
+            "status": scored["status"][0],
             "effectiveness_score": round(effectiveness_score, 2),
             "metrics": {
-                "evidence_count": evidence_count,
-                "average_confidence": round(avg_confidence, 2),
-                "positive_impacts": positive_impacts,
-                "negative_impacts": negative_impacts,
-                "success_rate": round(success_rate, 1),
-                "influence_factor": links_count
+                "evidence_count": int(scored["evidence_count"][0]),
+                "average_confidence": round(float(scored["avg_confidence"][0]), 2),
+                "positive_impacts": int(scored["positive_impacts"][0]),
+                "negative_impacts": int(scored["negative_impacts"][0]),
+                "success_rate": round(float(scored["success_rate"][0]), 1),
+                "influence_factor": int(scored["links_count"][0])
             },
             "scores": {
-                "base_confidence": round(base_score, 2),
-                "evidence_completeness": round(evidence_score, 2),
-                "confidence_level": round(confidence_score, 2),
-                "success_rate_score": round(success_score, 2),
-                "influence_score": round(influence_score, 2)
+                "base_confidence": round(float(scored["base_confidence"][0]), 2),
+                "evidence_completeness": round(float(scored["evidence_completeness"][0]), 2),
+                "confidence_level": round(float(scored["confidence_level"][0]), 2),
+                "success_rate_score": round(float(scored["success_rate_score"][0]), 2),
+                "influence_score": round(float(scored["influence_score"][0]), 2)
             },
-            "recommendation": "High effectiveness" if effectiveness_score > 0.7 else 
-                           "Moderate effectiveness" if effectiveness_score > 0.4 else 
-                           "Low effectiveness - consider review"
+            "recommendation": effectiveness_recommendation(effectiveness_score)
         }
         
         logger.info(f"🎯 Analyzed effectiveness for {adr_id}: {effectiveness_score:.2f}")
@@ -482,4 +1043,4 @@ async def analyze_decision_effectiveness(
         raise
     except Exception as e:
         logger.error(f"❌ Error analyzing effectiveness for {adr_id}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to analyze effectiveness")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to analyze effectiveness")
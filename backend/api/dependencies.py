@@ -0,0 +1,11 @@
+"""
+Shared API dependencies
+Access to application-level resources initialized in main.py.
+"""
+
+from fastapi import Request
+import asyncpg
+
+async def get_pool(request: Request) -> asyncpg.Pool:
+    """Get the shared connection pool for handlers that run queries concurrently"""
+    return request.app.state.db_pool
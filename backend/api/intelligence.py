@@ -9,9 +9,16 @@ from typing import List, Dict, Any, Optional
 import asyncpg
 import json
 import logging
+import uuid
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
+from api.dependencies import get_pool
+from services.query_runner import ConcurrentQueryRunner, QueryPlan
+from services.insights import insights_engine
+from services.context_cache import context_cache
+from services.cache import data_generations
+
 logger = logging.getLogger(__name__)
 
 intelligence_router = APIRouter()
@@ -62,111 +69,134 @@ async def generate_ai_context(
     Creates rich context for AI systems by combining ADRs, patterns, and organizational knowledge.
     """
     try:
-        # Generate unique context ID
-        context_id = f"ctx-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{request.ai_system}"
+        # Generate unique context ID (cache hits make same-second repeats common)
+        context_id = f"ctx-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{request.ai_system}"
         
-        sources = []
-        context_parts = []
+        # Repeated questions reuse the context built for the current ADR corpus
+        cache_key = context_cache.key(
+            request.query, request.context_type,
+            request.include_patterns, request.include_decisions, request.include_runbooks
+        )
+        cached = context_cache.get(cache_key)
         
-        # Include relevant ADRs if requested
-        if request.include_decisions:
-            adr_query = """
-                SELECT adr_id, title, context, decision, consequences, component, confidence_score
-                FROM adrs 
-                WHERE status = 'accepted'
-                AND (
-                    to_tsvector('english', title || ' ' || context || ' ' || decision) 
-                    @@ plainto_tsquery('english', $1)
-                )
-                ORDER BY confidence_score DESC NULLS LAST
-                LIMIT 5
-            """
+        if cached is None:
+            generation = context_cache.generation()
+            sources = []
+            context_parts = []
             
-            adr_rows = await db.fetch(adr_query, request.query)
+            # Include relevant ADRs if requested
+            if request.include_decisions:
+                adr_query = """
+                    SELECT adr_id, title, context, decision, consequences, component, confidence_score
+                    FROM adrs 
+                    WHERE status = 'accepted'
+                    AND (
+                        to_tsvector('english', title || ' ' || context || ' ' || decision) 
+                        @@ plainto_tsquery('english', $1)
+                    )
+                    ORDER BY confidence_score DESC NULLS LAST
+                    LIMIT 5
+                """
             
-            if adr_rows:
-                context_parts.append("## Relevant Architecture Decisions:\n")
-                for adr in adr_rows:
-                    context_parts.append(f"### {adr['title']} ({adr['adr_id']})")
-                    context_parts.append(f"**Component:** {adr['component']}")
-                    context_parts.append(f"**Context:** {adr['context'][:300]}...")
-                    context_parts.append(f"**Decision:** {adr['decision'][:300]}...")
-                    context_parts.append(f"**Confidence:** {adr['confidence_score'] or 'N/A'}\n")
+                adr_rows = await db.fetch(adr_query, request.query)
+            
+                if adr_rows:
+                    context_parts.append("## Relevant Architecture Decisions:\n")
+                    for adr in adr_rows:
+                        context_parts.append(f"### {adr['title']} ({adr['adr_id']})")
+                        context_parts.append(f"**Component:** {adr['component']}")
+                        context_parts.append(f"**Context:** {adr['context'][:300]}...")
+                        context_parts.append(f"**Decision:** {adr['decision'][:300]}...")
+                        context_parts.append(f"**Confidence:** {adr['confidence_score'] or 'N/A'}\n")
                     
-                    sources.append({
-                        "type": "adr",
-                        "id": adr['adr_id'],
-                        "title": adr['title'],
-                        "relevance": float(adr['confidence_score'] or 0.5)
-                    })
-        
-        # Include patterns if requested
-        if request.include_patterns:
-            # This would integrate with pattern library
-            # For now, add placeholder context
-            context_parts.append("## Organizational Code Patterns:\n")
-            context_parts.append("- Follow TypeScript strict mode for all new code")
-            context_parts.append("- Use Bun runtime for server applications") 
-            context_parts.append("- Implement comprehensive error handling with logging")
-            context_parts.append("- Document all public APIs with OpenAPI/JSDoc\n")
+                        sources.append({
+                            "type": "adr",
+                            "id": adr['adr_id'],
+                            "title": adr['title'],
+                            "relevance": float(adr['confidence_score'] or 0.5)
+                        })
             
-            sources.append({
-                "type": "patterns",
-                "id": "general-patterns",
-                "title": "Organizational Code Patterns",
-                "relevance": 0.8
-            })
-        
-        # Include runbooks if requested
-        if request.include_runbooks:
-            context_parts.append("## Operational Guidelines:\n")
-            context_parts.append("- All changes require TypeScript compilation without errors")
-            context_parts.append("- Run comprehensive tests before deployment")
-            context_parts.append("- Follow existing logging and monitoring patterns")
-            context_parts.append("- Document architectural decisions in ADR format\n")
+            # Include patterns if requested
+            if request.include_patterns:
+                # This would integrate with pattern library
+                # For now, add placeholder context
+                context_parts.append("## Organizational Code Patterns:\n")
+                context_parts.append("- Follow TypeScript strict mode for all new code")
+                context_parts.append("- Use Bun runtime for server applications") 
+                context_parts.append("- Implement comprehensive error handling with logging")
+                context_parts.append("- Document all public APIs with OpenAPI/JSDoc\n")
             
-            sources.append({
-                "type": "runbooks",
-                "id": "operational-runbooks",
-                "title": "Operational Guidelines", 
-                "relevance": 0.7
-            })
-        
-        # Add context-specific guidance
-        if request.context_type == "code-generation":
-            context_parts.append("## Code Generation Guidelines:\n")
-            context_parts.append("- Maintain consistency with existing codebase style")
-            context_parts.append("- Use established patterns and interfaces")
-            context_parts.append("- Include comprehensive error handling")
-            context_parts.append("- Add appropriate logging for debugging\n")
-        elif request.context_type == "architecture-review":
-            context_parts.append("## Architecture Review Focus:\n")
-            context_parts.append("- Evaluate decision against existing ADRs")
-            context_parts.append("- Consider long-term maintenance implications")
-            context_parts.append("- Assess integration complexity and risks")
-            context_parts.append("- Document new patterns for reuse\n")
-        
-        # Combine all context
-        generated_context = "\n".join(context_parts)
-        
-        # Calculate relevance score based on sources and content match
-        relevance_score = min(len(sources) / 5.0, 1.0) * 0.6 + 0.4  # Base relevance + source bonus
-        
-        # Store context generation in database
+                sources.append({
+                    "type": "patterns",
+                    "id": "general-patterns",
+                    "title": "Organizational Code Patterns",
+                    "relevance": 0.8
+                })
+            
+            # Include runbooks if requested
+            if request.include_runbooks:
+                context_parts.append("## Operational Guidelines:\n")
+                context_parts.append("- All changes require TypeScript compilation without errors")
+                context_parts.append("- Run comprehensive tests before deployment")
+                context_parts.append("- Follow existing logging and monitoring patterns")
+                context_parts.append("- Document architectural decisions in ADR format\n")
+            
+                sources.append({
+                    "type": "runbooks",
+                    "id": "operational-runbooks",
+                    "title": "Operational Guidelines", 
+                    "relevance": 0.7
+                })
+            
+            # Add context-specific guidance
+            if request.context_type == "code-generation":
+                context_parts.append("## Code Generation Guidelines:\n")
+                context_parts.append("- Maintain consistency with existing codebase style")
+                context_parts.append("- Use established patterns and interfaces")
+                context_parts.append("- Include comprehensive error handling")
+                context_parts.append("- Add appropriate logging for debugging\n")
+            elif request.context_type == "architecture-review":
+                context_parts.append("## Architecture Review Focus:\n")
+                context_parts.append("- Evaluate decision against existing ADRs")
+                context_parts.append("- Consider long-term maintenance implications")
+                context_parts.append("- Assess integration complexity and risks")
+                context_parts.append("- Document new patterns for reuse\n")
+            
+            # Combine all context
+            generated_context = "\n".join(context_parts)
+            
+            # Calculate relevance score based on sources and content match
+            relevance_score = min(len(sources) / 5.0, 1.0) * 0.6 + 0.4  # Base relevance + source bonus
+        else:
+            generated_context = cached["generated_context"]
+            sources = cached["sources"]
+            relevance_score = cached["relevance_score"]
+        
+        # Store context generation in database; cache hits log a reference to
+        # the context they reuse instead of another copy of it
         insert_query = """
             INSERT INTO ai_context_logs (
                 context_id, ai_system, context_type, query, generated_context, 
-                relevance_score, sources_count
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                relevance_score, sources_count, source_context_id
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             RETURNING created_at
         """
         
         created_at = await db.fetchval(
             insert_query,
             context_id, request.ai_system, request.context_type, request.query,
-            generated_context, relevance_score, len(sources)
+            None if cached else generated_context, relevance_score, len(sources),
+            cached["context_id"] if cached else None
         )
         
+        if cached is None:
+            context_cache.set(cache_key, {
+                "context_id": context_id,
+                "generated_context": generated_context,
+                "sources": sources,
+                "relevance_score": relevance_score
+            }, generation)
+        
         response = {
             "context_id": context_id,
             "ai_system": request.ai_system,
@@ -183,12 +213,16 @@ async def generate_ai_context(
                     "include_patterns": request.include_patterns,
                     "include_decisions": request.include_decisions,
                     "include_runbooks": request.include_runbooks
-                }
+                },
+                "cached": cached is not None,
+                "source_context_id": cached["context_id"] if cached else None
             },
             "created_at": created_at
         }
         
-        logger.info(f"🧠 Generated AI context {context_id} for {request.ai_system}")
+        logger.info(
+            f"🧠 {'Reused' if cached else 'Generated'} AI context {context_id} for {request.ai_system}"
+        )
         return response
         
     except Exception as e:
@@ -206,7 +240,13 @@ async def get_context(
     Gets a specific AI context generation result by ID.
     """
     try:
-        query = "SELECT * FROM ai_context_logs WHERE context_id = $1"
+        # Entries logged from the context cache point at the context they reused
+        query = """
+            SELECT l.*, COALESCE(l.generated_context, s.generated_context) AS resolved_context
+            FROM ai_context_logs l
+            LEFT JOIN ai_context_logs s ON s.context_id = l.source_context_id
+            WHERE l.context_id = $1
+        """
         row = await db.fetchrow(query, context_id)
         
         if not row:
@@ -217,7 +257,7 @@ async def get_context(
             "ai_system": row["ai_system"],
             "context_type": row["context_type"],
             "query": row["query"],
-            "generated_context": row["generated_context"],
+            "generated_context": row["resolved_context"],
             "relevance_score": float(row["relevance_score"]),
             "sources_count": row["sources_count"],
             "created_at": row["created_at"]
@@ -236,6 +276,7 @@ async def get_context(
 async def get_intelligence_insights(
     insight_type: Optional[str] = Query(None, regex="^(pattern|anomaly|trend|recommendation)$"),
     impact_level: Optional[str] = Query(None, regex="^(low|medium|high|critical)$"),
+    window_days: int = Query(30, ge=1, le=365, description="Analysis window in days"),
     limit: int = Query(20, ge=1, le=100),
     db: asyncpg.Connection = Depends(get_db)
 ):
@@ -243,129 +284,25 @@ async def get_intelligence_insights(
     🔍 Get organizational intelligence insights
     
     Returns AI-generated insights about patterns, anomalies, and trends in decision-making.
+    Signals are collected in one aggregate query, only the requested insight types are
+    built, and results are memoized per (window, filters) until ADRs or evidence change.
     """
     try:
-        # Generate insights based on current data
-        insights = []
-        
-        # Pattern insight: Most active components
-        active_components = await db.fetch("""
-            SELECT component, COUNT(*) as count, AVG(confidence_score) as avg_confidence
-            FROM adrs 
-            WHERE created_at >= NOW() - INTERVAL '30 days'
-            GROUP BY component
-            HAVING COUNT(*) >= 2
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        
-        if active_components:
-            top_component = active_components[0]
-            insights.append({
-                "insight_type": "pattern",
-                "title": f"High Activity in {top_component['component']} Component",
-                "description": f"The {top_component['component']} component has {top_component['count']} decisions in the last 30 days with average confidence of {float(top_component['avg_confidence'] or 0):.2f}",
-                "confidence": 0.85,
-                "impact_level": "medium" if top_component['count'] > 3 else "low",
-                "data_sources": ["adrs"],
-                "suggested_actions": [
-                    f"Review {top_component['component']} component architecture",
-                    "Consider if decisions can be consolidated",
-                    "Document emerging patterns in this component"
-                ]
-            })
-        
-        # Anomaly insight: Low confidence decisions
-        low_confidence = await db.fetchval("""
-            SELECT COUNT(*) FROM adrs 
-            WHERE confidence_score < 0.5 
-            AND created_at >= NOW() - INTERVAL '30 days'
-        """)
-        
-        if low_confidence and low_confidence > 0:
-            insights.append({
-                "insight_type": "anomaly",
-                "title": f"Low Confidence Decisions Detected",
-                "description": f"Found {low_confidence} decisions with confidence below 50% in the last 30 days. This may indicate insufficient information or analysis.",
-                "confidence": 0.9,
-                "impact_level": "high" if low_confidence > 3 else "medium",
-                "data_sources": ["adrs"],
-                "suggested_actions": [
-                    "Review low-confidence decisions for missing information",
-                    "Establish minimum confidence thresholds",
-                    "Improve decision documentation process"
-                ]
-            })
-        
-        # Trend insight: Decision velocity
-        recent_count = await db.fetchval("""
-            SELECT COUNT(*) FROM adrs 
-            WHERE created_at >= NOW() - INTERVAL '7 days'
-        """)
-        
-        previous_count = await db.fetchval("""
-            SELECT COUNT(*) FROM adrs 
-            WHERE created_at >= NOW() - INTERVAL '14 days'
-            AND created_at < NOW() - INTERVAL '7 days'
-        """)
-        
-        if recent_count is not None and previous_count is not None:
-            if recent_count > previous_count * 1.5:
-                insights.append({
-                    "insight_type": "trend",
-                    "title": "Accelerating Decision Pace",
-                    "description": f"Decision velocity has increased significantly: {recent_count} decisions this week vs {previous_count} last week (+{((recent_count - previous_count) / max(previous_count, 1)) * 100:.0f}%)",
-                    "confidence": 0.8,
-                    "impact_level": "medium",
-                    "data_sources": ["adrs"],
-                    "suggested_actions": [
-                        "Monitor decision quality during rapid pace",
-                        "Ensure adequate review time for decisions",
-                        "Consider if pace is sustainable"
-                    ]
-                })
-        
-        # Recommendation insight: Missing evidence
-        decisions_without_evidence = await db.fetchval("""
-            SELECT COUNT(*) FROM adrs a
-            LEFT JOIN decision_evidence de ON a.adr_id = de.adr_id
-            WHERE a.status = 'accepted' 
-            AND a.created_at <= NOW() - INTERVAL '30 days'
-            AND de.id IS NULL
-        """)
-        
-        if decisions_without_evidence and decisions_without_evidence > 0:
-            insights.append({
-                "insight_type": "recommendation", 
-                "title": "Evidence Collection Opportunity",
-                "description": f"{decisions_without_evidence} accepted decisions lack follow-up evidence. Collecting impact data could improve future decision-making.",
-                "confidence": 0.75,
-                "impact_level": "medium",
-                "data_sources": ["adrs", "decision_evidence"],
-                "suggested_actions": [
-                    "Implement evidence collection process",
-                    "Set reminders for post-decision impact measurement",
-                    "Create templates for common evidence types"
-                ]
-            })
-        
-        # Filter insights based on query parameters
-        if insight_type:
-            insights = [i for i in insights if i["insight_type"] == insight_type]
-        if impact_level:
-            insights = [i for i in insights if i["impact_level"] == impact_level]
+        result = await insights_engine.get_insights(db, window_days, insight_type, impact_level)
         
         # Limit results
-        insights = insights[:limit]
+        insights = result["insights"][:limit]
         
-        logger.info(f"🔍 Generated {len(insights)} intelligence insights")
+        logger.info(f"🔍 Generated {len(insights)} intelligence insights (cached={result['cached']})")
         return {
             "insights": insights,
             "total": len(insights),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": result["generated_at"],
+            "cached": result["cached"],
             "filters": {
                 "insight_type": insight_type,
                 "impact_level": impact_level,
+                "window_days": window_days,
                 "limit": limit
             }
         }
@@ -374,39 +311,107 @@ async def get_intelligence_insights(
         logger.error(f"❌ Error generating insights: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate insights")
 
+ANALYSIS_AI_SYSTEM = "intelligence-api"
+ANALYSIS_SOURCE_TABLES = ("adrs", "evidence")
+# Write generations restart at zero with the process; the epoch keeps analyses
+# stored by an earlier process from matching
+ANALYSIS_PROCESS_EPOCH = uuid.uuid4().hex
+
+def _analysis_query_plan(analysis_type: str, since_date: datetime) -> QueryPlan:
+    """Independent queries needed for each analysis type"""
+    if analysis_type == "health":
+        return {
+            "total_adrs": ("fetchval", "SELECT COUNT(*) FROM adrs", ()),
+            "recent_adrs": ("fetchval", "SELECT COUNT(*) FROM adrs WHERE created_at >= $1", (since_date,)),
+            "avg_confidence": ("fetchval", """
+                SELECT AVG(confidence_score) FROM adrs 
+                WHERE confidence_score IS NOT NULL AND created_at >= $1
+            """, (since_date,)),
+            "evidence_coverage": ("fetchval", """
+                SELECT COUNT(DISTINCT a.adr_id) * 100.0 / NULLIF(COUNT(*), 0)
+                FROM adrs a
+                LEFT JOIN decision_evidence de ON a.adr_id = de.adr_id
+                WHERE a.status = 'accepted' AND a.created_at >= $1
+            """, (since_date,)),
+        }
+    if analysis_type == "trends":
+        return {
+            "weekly_trends": ("fetch", """
+                SELECT 
+                    DATE_TRUNC('week', created_at) as week,
+                    COUNT(*) as decision_count,
+                    AVG(confidence_score) as avg_confidence
+                FROM adrs 
+                WHERE created_at >= $1
+                GROUP BY week 
+                ORDER BY week
+            """, (since_date,)),
+            "component_trends": ("fetch", """
+                SELECT 
+                    component,
+                    COUNT(*) as count,
+                    AVG(confidence_score) as avg_confidence
+                FROM adrs 
+                WHERE created_at >= $1
+                GROUP BY component
+                ORDER BY count DESC
+                LIMIT 10
+            """, (since_date,)),
+        }
+    return {}
+
 @intelligence_router.post("/analyze")
 async def analyze_organizational_intelligence(
     analysis_type: str = Query(..., regex="^(health|trends|effectiveness|gaps)$"),
     period_days: int = Query(30, ge=7, le=365),
-    db: asyncpg.Connection = Depends(get_db)
+    max_age_seconds: int = Query(300, ge=0, le=86400, description="Reuse a stored analysis up to this age (0 forces recompute)"),
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     📊 Comprehensive organizational intelligence analysis
     
     Performs deep analysis of organizational decision patterns and health.
+    Independent sub-queries run concurrently through the pool, and results are
+    stored so identical requests within `max_age_seconds` reuse them as long as no
+    ADRs or evidence have been written since. Connections are only held briefly,
+    so the sub-queries never wait on this request's own.
     """
     try:
-        since_date = datetime.now() - timedelta(days=period_days)
+        analysis_query = f"Analysis for {period_days} days"
+        # Taken before any data is read, so writes during the analysis invalidate it
+        generation = [ANALYSIS_PROCESS_EPOCH, *data_generations.snapshot(ANALYSIS_SOURCE_TABLES)]
+        
+        # Reuse a recent stored analysis for the same type and period
+        if max_age_seconds > 0:
+            async with pool.acquire() as db:
+                stored = await db.fetchval("""
+                    SELECT generated_context FROM ai_context_logs
+                    WHERE ai_system = $1 AND context_type = $2 AND query = $3
+                    AND created_at >= NOW() - make_interval(secs => $4)
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                """, ANALYSIS_AI_SYSTEM, analysis_type, analysis_query, float(max_age_seconds))
+            
+            analysis = (json.loads(stored) if isinstance(stored, str) else stored) if stored else None
+            # Only analyses this process stored since its last ADR or evidence write match
+            if analysis and analysis.pop("data_generation", None) == generation:
+                analysis["reused"] = True
+                logger.info(f"📊 Reused stored {analysis_type} analysis: {analysis['analysis_id']}")
+                return analysis
+        
+        plan = _analysis_query_plan(analysis_type, datetime.now() - timedelta(days=period_days))
+        if not plan:
+            raise HTTPException(status_code=501, detail=f"Analysis type '{analysis_type}' is not implemented yet")
+        
         analysis_id = f"analysis-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{analysis_type}"
+        results = await ConcurrentQueryRunner(pool).run(plan)
         
         if analysis_type == "health":
             # Organizational health analysis
-            total_adrs = await db.fetchval("SELECT COUNT(*) FROM adrs")
-            recent_adrs = await db.fetchval(
-                "SELECT COUNT(*) FROM adrs WHERE created_at >= $1", since_date
-            )
-            
-            avg_confidence = await db.fetchval("""
-                SELECT AVG(confidence_score) FROM adrs 
-                WHERE confidence_score IS NOT NULL AND created_at >= $1
-            """, since_date)
-            
-            evidence_coverage = await db.fetchval("""
-                SELECT COUNT(DISTINCT a.adr_id) * 100.0 / COUNT(*)
-                FROM adrs a
-                LEFT JOIN decision_evidence de ON a.adr_id = de.adr_id
-                WHERE a.status = 'accepted' AND a.created_at >= $1
-            """, since_date)
+            total_adrs = results["total_adrs"]
+            recent_adrs = results["recent_adrs"]
+            avg_confidence = results["avg_confidence"]
+            evidence_coverage = results["evidence_coverage"]
             
             health_score = (
                 min(recent_adrs / 10, 1.0) * 0.3 +  # Activity level
@@ -435,28 +440,8 @@ async def analyze_organizational_intelligence(
             
         elif analysis_type == "trends":
             # Trend analysis
-            weekly_trends = await db.fetch("""
-                SELECT 
-                    DATE_TRUNC('week', created_at) as week,
-                    COUNT(*) as decision_count,
-                    AVG(confidence_score) as avg_confidence
-                FROM adrs 
-                WHERE created_at >= $1
-                GROUP BY week 
-                ORDER BY week
-            """, since_date)
-            
-            component_trends = await db.fetch("""
-                SELECT 
-                    component,
-                    COUNT(*) as count,
-                    AVG(confidence_score) as avg_confidence
-                FROM adrs 
-                WHERE created_at >= $1
-                GROUP BY component
-                ORDER BY count DESC
-                LIMIT 10
-            """, since_date)
+            weekly_trends = results["weekly_trends"]
+            component_trends = results["component_trends"]
             
             analysis = {
                 "analysis_id": analysis_id,
@@ -484,17 +469,21 @@ async def analyze_organizational_intelligence(
                 ]
             }
         
-        # Store analysis results
-        await db.execute("""
-            INSERT INTO ai_context_logs (
-                context_id, ai_system, context_type, query, generated_context, relevance_score, sources_count
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """, analysis_id, "intelligence-api", analysis_type, f"Analysis for {period_days} days", 
-            json.dumps(analysis), 1.0, 1)
+        # Store analysis results for reuse
+        async with pool.acquire() as db:
+            await db.execute("""
+                INSERT INTO ai_context_logs (
+                    context_id, ai_system, context_type, query, generated_context, relevance_score, sources_count
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+            """, analysis_id, ANALYSIS_AI_SYSTEM, analysis_type, analysis_query, 
+                json.dumps({**analysis, "data_generation": generation}), 1.0, 1)
         
+        analysis["reused"] = False
         logger.info(f"📊 Completed {analysis_type} analysis: {analysis_id}")
         return analysis
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error performing intelligence analysis: {e}")
-        raise HTTPException(status_code=500, detail="Failed to perform analysis")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to perform analysis")
@@ -20,6 +20,9 @@ from api.intelligence import intelligence_router
 from api.analytics import analytics_router
 from api.auth import auth_router
 from auth.middleware import configure_middleware
+from services.schema import ensure_schema
+from services.docs_sync import docs_sync
+from services.serialization import register_json_codecs
 
 # Configure logging
 logging.basicConfig(
@@ -63,13 +66,23 @@ async def startup_database():
     """Initialize database connection pool on startup"""
     global db_pool
     try:
-        db_pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
+        db_pool = await asyncpg.create_pool(
+            DATABASE_URL, min_size=2, max_size=10, init=register_json_codecs
+        )
+        app.state.db_pool = db_pool
         logger.info("🗄️  Database connection pool established")
         
         # Test connection
         async with db_pool.acquire() as conn:
             result = await conn.fetchval("SELECT 1")
             logger.info("✅ Database connectivity verified")
+        
+        # Derived analytics columns, tables and indexes
+        await ensure_schema(db_pool)
+        
+        # Keep ADR, pattern and runbook rows in step with the markdown docs
+        if os.getenv("DOCS_SYNC_ENABLED", "false").lower() in ("1", "true", "yes"):
+            docs_sync.start(db_pool)
             
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
@@ -79,6 +92,7 @@ async def startup_database():
 async def shutdown_database():
     """Close database connection pool on shutdown"""
     global db_pool
+    await docs_sync.stop()
     if db_pool:
         await db_pool.close()
         logger.info("🔌 Database connection pool closed")
@@ -0,0 +1,153 @@
+"""
+📈 KRINS-Chronicle-Keeper Analytics Services
+Batch computation engines backing the decision and analytics APIs
+"""
+
+from .schema import ensure_schema, SCHEMA_STATEMENTS
+from .effectiveness import (
+    EffectivenessScorer, compute_effectiveness_scores, effectiveness_recommendation,
+    EFFECTIVENESS_WEIGHTS
+)
+from .export import (
+    EXPORT_DATASETS, EXPORT_CHUNK_ROWS, iter_record_chunks,
+    stream_csv, stream_parquet, parquet_available
+)
+from .ingest import EvidenceIngestor, iter_ndjson_records, iter_csv_records, INGEST_BATCH_ROWS
+from .rollups import EvidenceRollups, evidence_rollups, ROLLUP_GRANULARITIES
+from .timeseries import (
+    GRANULARITIES, fetch_decision_buckets, lttb_indices, summarize_buckets
+)
+from .cache import DataGenerations, GenerationCache, data_generations
+from .context_cache import ContextCache, context_cache, normalize_query
+from .insights import InsightsEngine, insights_engine, build_signals_query, INSIGHT_TYPES
+from .graph import DecisionGraph, decision_graph, RELATIONSHIP_TYPES
+from .graph_export import GRAPH_EXPORT_FORMATS, stream_graph, gzip_stream
+from .influence import InfluenceRanker, influence_ranker, weighted_pagerank
+from .conflicts import ConflictDetector, conflict_detector, find_similar_pairs
+from .supersession import SupersessionResolver, supersession_resolver
+from .etags import ROW_VERSION_SQL, make_etag, etag_matches_none_match, if_match_versions
+from .numbering import allocate_adr_id, allocate_adr_numbers, format_adr_id, adr_id_scope, reserve_adr_ids
+from .adr_import import ADRCorpusImporter, adr_importer, bulk_upsert_adrs, parse_adr_markdown, iter_adr_files
+from .docs_sync import DocsSync, docs_sync, parse_document_markdown
+from .serialization import FastJSONResponse, dumps, decode_json_list, register_json_codecs
+from .pagination import encode_cursor, decode_cursor, parse_fields, estimate_count
+from .query_runner import ConcurrentQueryRunner, QueryPlan, DEFAULT_QUERY_CONCURRENCY
+
+__all__ = [
+    # Schema
+    'ensure_schema',
+    'SCHEMA_STATEMENTS',
+
+    # Effectiveness scoring
+    'EffectivenessScorer',
+    'compute_effectiveness_scores',
+    'effectiveness_recommendation',
+    'EFFECTIVENESS_WEIGHTS',
+
+    # Dataset export
+    'EXPORT_DATASETS',
+    'EXPORT_CHUNK_ROWS',
+    'iter_record_chunks',
+    'stream_csv',
+    'stream_parquet',
+    'parquet_available',
+
+    # Bulk ingestion
+    'EvidenceIngestor',
+    'iter_ndjson_records',
+    'iter_csv_records',
+    'INGEST_BATCH_ROWS',
+
+    # ETags
+    'ROW_VERSION_SQL',
+    'make_etag',
+    'etag_matches_none_match',
+    'if_match_versions',
+
+    # ADR numbering
+    'allocate_adr_id',
+    'allocate_adr_numbers',
+    'format_adr_id',
+    'adr_id_scope',
+    'reserve_adr_ids',
+
+    # ADR import
+    'ADRCorpusImporter',
+    'adr_importer',
+    'bulk_upsert_adrs',
+    'parse_adr_markdown',
+    'iter_adr_files',
+
+    # Docs sync
+    'DocsSync',
+    'docs_sync',
+    'parse_document_markdown',
+
+    # Serialization
+    'FastJSONResponse',
+    'dumps',
+    'decode_json_list',
+    'register_json_codecs',
+
+    # Pagination
+    'encode_cursor',
+    'decode_cursor',
+    'parse_fields',
+    'estimate_count',
+
+    # Concurrent queries
+    'ConcurrentQueryRunner',
+    'QueryPlan',
+    'DEFAULT_QUERY_CONCURRENCY',
+
+    # Time series
+    'GRANULARITIES',
+    'fetch_decision_buckets',
+    'lttb_indices',
+    'summarize_buckets',
+
+    # Evidence rollups
+    'EvidenceRollups',
+    'evidence_rollups',
+    'ROLLUP_GRANULARITIES',
+
+    # Caching
+    'DataGenerations',
+    'GenerationCache',
+    'data_generations',
+
+    # AI context cache
+    'ContextCache',
+    'context_cache',
+    'normalize_query',
+
+    # Insights
+    'InsightsEngine',
+    'insights_engine',
+    'build_signals_query',
+    'INSIGHT_TYPES',
+
+    # Decision graph
+    'DecisionGraph',
+    'decision_graph',
+    'RELATIONSHIP_TYPES',
+
+    # Graph export
+    'GRAPH_EXPORT_FORMATS',
+    'stream_graph',
+    'gzip_stream',
+
+    # Influence ranking
+    'InfluenceRanker',
+    'influence_ranker',
+    'weighted_pagerank',
+
+    # Conflict detection
+    'ConflictDetector',
+    'conflict_detector',
+    'find_similar_pairs',
+
+    # Supersession
+    'SupersessionResolver',
+    'supersession_resolver',
+]
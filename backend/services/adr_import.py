@@ -0,0 +1,383 @@
+"""
+📚 KRINS-Chronicle-Keeper ADR Import
+Set-based ADR upserts and parallel import of the markdown ADR corpus
+"""
+
+import asyncio
+import asyncpg
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .cache import data_generations
+from .numbering import allocate_adr_numbers, adr_id_scope, format_adr_id, reserve_adr_ids
+
+logger = logging.getLogger(__name__)
+
+ADR_STATUSES = ("proposed", "accepted", "superseded", "deprecated")
+ADR_FILE_PATTERN = re.compile(r"^ADR-\d+.*\.md$")
+PARSE_CHUNK_FILES = 64
+IMPORT_BATCH_ROWS = 500
+
+# Defaults applied by create_adr, shared by every bulk write
+ADR_DEFAULT_SCORES = {"confidence_score": 0.8, "complexity_score": 0.6, "actionability_score": 0.9}
+
+BULK_UPSERT_COLUMNS = (
+    "adr_id", "title", "status", "context", "decision", "consequences", "component",
+    "decision_date", "confidence_score", "complexity_score", "actionability_score", "tags",
+    "source_path", "source_hash"
+)
+
+# Optional columns: defaulted on insert, kept as stored when omitted on update
+BULK_INSERT_DEFAULTS = {
+    "decision_date": "NOW()",
+    **{column: str(default) for column, default in ADR_DEFAULT_SCORES.items()},
+    "tags": "'[]'"
+}
+
+# Provenance of imported ADRs; only the importer writes these on update
+BULK_SOURCE_COLUMNS = ("source_path", "source_hash")
+
+# Staging table takes its column types from adrs, so tags bind exactly as in
+# create_adr; it is reused (and emptied) across batches of one transaction.
+BULK_STAGING_QUERY = f"""
+    CREATE TEMP TABLE IF NOT EXISTS adr_bulk_staging ON COMMIT DROP AS
+    SELECT {', '.join(BULK_UPSERT_COLUMNS)} FROM adrs WITH NO DATA;
+    CREATE INDEX IF NOT EXISTS adr_bulk_staging_adr_id ON adr_bulk_staging (adr_id);
+    TRUNCATE adr_bulk_staging;
+"""
+
+BULK_STAGE_INSERT = f"""
+    INSERT INTO adr_bulk_staging ({', '.join(BULK_UPSERT_COLUMNS)})
+    VALUES ({', '.join(f'${i}' for i in range(1, len(BULK_UPSERT_COLUMNS) + 1))})
+"""
+
+def _bulk_upsert_query(from_files: bool) -> str:
+    """
+    One upsert for the whole batch. Every CTE sees the pre-statement snapshot, so
+    "previous" holds the text before the update; ADRs that are new or whose text
+    changed are queued for re-embedding in the same statement.
+
+    EXCLUDED already carries the insert defaults, so omitted optional columns are
+    read back from the staging row. With ``from_files`` the provenance columns are
+    written and an existing ADR is only updated when it came from the same file;
+    other rows are left alone and missing from the result.
+    """
+    inserted = [
+        f"COALESCE({c}, {BULK_INSERT_DEFAULTS[c]})" if c in BULK_INSERT_DEFAULTS else c
+        for c in BULK_UPSERT_COLUMNS
+    ]
+    replaced = [
+        c for c in BULK_UPSERT_COLUMNS[1:]
+        if c not in BULK_INSERT_DEFAULTS and (from_files or c not in BULK_SOURCE_COLUMNS)
+    ]
+    optional = list(BULK_INSERT_DEFAULTS)
+    guard = "\n        WHERE adrs.source_path IS NOT DISTINCT FROM EXCLUDED.source_path" if from_files else ""
+    return f"""
+    WITH previous AS (
+        SELECT a.adr_id, a.title, a.context, a.decision, a.consequences
+        FROM adrs a
+        JOIN adr_bulk_staging s ON s.adr_id = a.adr_id
+    ), upserted AS (
+        INSERT INTO adrs ({', '.join(BULK_UPSERT_COLUMNS)})
+        SELECT {', '.join(inserted)} FROM adr_bulk_staging
+        ON CONFLICT (adr_id) DO UPDATE SET
+            {', '.join(f'{c} = EXCLUDED.{c}' for c in replaced)},
+            ({', '.join(optional)}) = (
+                SELECT {', '.join(f'COALESCE(s.{c}, adrs.{c})' for c in optional)}
+                FROM adr_bulk_staging s
+                WHERE s.adr_id = EXCLUDED.adr_id
+            ),
+            updated_at = NOW(){guard}
+        RETURNING id, adr_id, title, context, decision, consequences, (xmax = 0) AS inserted
+    ), queued AS (
+        INSERT INTO adr_embedding_queue (adr_id)
+        SELECT u.adr_id
+        FROM upserted u
+        LEFT JOIN previous p ON p.adr_id = u.adr_id
+        WHERE p.adr_id IS NULL
+        OR (p.title, p.context, p.decision, p.consequences)
+            IS DISTINCT FROM (u.title, u.context, u.decision, u.consequences)
+        ON CONFLICT (adr_id) DO UPDATE SET queued_at = NOW()
+        RETURNING adr_id
+    )
+    SELECT u.id, u.adr_id, u.inserted, q.adr_id IS NOT NULL AS embedding_queued
+    FROM upserted u
+    LEFT JOIN queued q ON q.adr_id = u.adr_id
+"""
+
+BULK_UPSERT_QUERY = _bulk_upsert_query(from_files=False)
+IMPORT_UPSERT_QUERY = _bulk_upsert_query(from_files=True)
+
+async def bulk_upsert_adrs(
+    db: asyncpg.Connection,
+    adrs: List[Dict[str, Any]],
+    from_files: bool = False
+) -> List[asyncpg.Record]:
+    """
+    Upsert ADR rows (dicts keyed by ``BULK_UPSERT_COLUMNS``) in one statement.
+
+    Must run inside a transaction. Supplied ``adr_id`` values must be unique;
+    rows without one get a new id per component (written back into the dict).
+    Missing or None optional columns (decision date, scores, tags) get the
+    create_adr defaults on insert and keep their stored values on update.
+    Returns (id, adr_id, inserted, embedding_queued) per written row; with
+    ``from_files`` ADRs that belong to another source file (or to none) are
+    skipped rather than overwritten.
+    """
+    # Reserve supplied numbers first so allocated ids never collide with them
+    supplied = [adr["adr_id"] for adr in adrs if adr.get("adr_id")]
+    if supplied:
+        await reserve_adr_ids(db, supplied)
+
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    for adr in adrs:
+        if not adr.get("adr_id"):
+            pending.setdefault(adr_id_scope(adr["component"]), []).append(adr)
+    for group in pending.values():
+        numbers = await allocate_adr_numbers(db, group[0]["component"], len(group))
+        for adr, number in zip(group, numbers):
+            adr["adr_id"] = format_adr_id(number, adr["component"])
+
+    rows = []
+    for adr in adrs:
+        row = {**adr, "tags": json.dumps(adr["tags"]) if adr.get("tags") is not None else None}
+        rows.append(tuple(row.get(column) for column in BULK_UPSERT_COLUMNS))
+
+    await db.execute(BULK_STAGING_QUERY)
+    await db.executemany(BULK_STAGE_INSERT, rows)
+    return await db.fetch(IMPORT_UPSERT_QUERY if from_files else BULK_UPSERT_QUERY)
+
+# Section headings (lowercased, without parentheticals) per ADR field
+SECTION_ALIASES = {
+    "context": ("problem", "context", "kontekst", "bakgrunn"),
+    "alternatives": ("alternativer", "alternatives", "considered options"),
+    "decision": ("beslutning", "decision"),
+    "consequences": ("konsekvenser", "consequences"),
+    "evidence": ("evidens", "evidence"),
+}
+
+META_ALIASES = {
+    "dato": "date", "date": "date",
+    "komponent": "component", "component": "component",
+    "status": "status",
+    "tags": "tags",
+    "id": "adr_id", "adr_id": "adr_id",
+}
+
+TITLE_RE = re.compile(r"^#\s+(?:ADR-(\d+)\s*[:—–-]\s*)?(.+?)\s*$", re.MULTILINE)
+# Values run until the next separator (•, or a stray quote/pipe in older files)
+META_RE = re.compile(r"\*\*([^*:]+):\*\*\s*([^•\"|*\n]*)")
+SECTION_RE = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
+FILE_NUMBER_RE = re.compile(r"^ADR-(\d+)")
+
+def _split_front_matter(text: str) -> Tuple[Dict[str, str], str]:
+    """Simple ``key: value`` front matter between leading ``---`` lines"""
+    if not text.startswith("---"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    meta = {}
+    for line in text[3:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip():
+            meta[key.strip().lower()] = value.strip().strip("'\"")
+    rest = text.find("\n", end + 1)
+    return meta, text[rest + 1:] if rest != -1 else ""
+
+def _parse_tags(value: str) -> List[str]:
+    return [tag.strip().strip("'\"") for tag in value.strip("[]").split(",") if tag.strip().strip("'\"")]
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.strip()[:10])
+    except ValueError:
+        return None
+
+def parse_adr_markdown(path: str) -> Dict[str, Any]:
+    """
+    Parse one ADR markdown file into an ADR row for ``bulk_upsert_adrs``.
+
+    Understands optional front matter, the ``# ADR-NNNN: Title`` heading, the
+    ``**Dato:** … • **Komponent:** …`` metadata line and ``##`` sections in
+    Norwegian or English. Raises ValueError if required parts are missing.
+    """
+    raw = Path(path).read_bytes()
+    if not raw.strip():
+        raise ValueError("Empty file")
+    text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+    front_matter, body = _split_front_matter(text)
+
+    title_match = TITLE_RE.search(body)
+    if not title_match:
+        raise ValueError("Missing '# ADR-NNNN: Title' heading")
+
+    sections = SECTION_RE.split(body)
+    preamble, sections = sections[0], sections[1:]
+
+    meta: Dict[str, str] = {}
+    for key, value in META_RE.findall(preamble):
+        if key.strip().lower() in META_ALIASES:
+            meta[META_ALIASES[key.strip().lower()]] = value.strip()
+    for key, value in front_matter.items():
+        if key in META_ALIASES:
+            meta[META_ALIASES[key]] = value
+
+    fields: Dict[str, List[str]] = {}
+    for heading, content in zip(sections[::2], sections[1::2]):
+        name = heading.split("(")[0].strip().lower()
+        for field, aliases in SECTION_ALIASES.items():
+            if name in aliases and content.strip():
+                fields.setdefault(field, []).append(content.strip())
+
+    component = meta.get("component")
+    if not component:
+        raise ValueError("Missing component")
+    if not fields.get("decision"):
+        raise ValueError("Missing decision section")
+
+    number = title_match.group(1)
+    if not number:
+        file_match = FILE_NUMBER_RE.match(Path(path).name)
+        number = file_match.group(1) if file_match else None
+    if not meta.get("adr_id") and not number:
+        raise ValueError("Missing ADR number")
+
+    status = (meta.get("status") or "accepted").lower()
+    return {
+        "adr_id": meta.get("adr_id") or format_adr_id(int(number), component),
+        "title": title_match.group(2),
+        "status": status if status in ADR_STATUSES else "accepted",
+        "context": "\n\n".join(fields.get("context", []) + fields.get("alternatives", [])),
+        "decision": "\n\n".join(fields["decision"]),
+        "consequences": "\n\n".join(fields.get("consequences", []) + fields.get("evidence", [])),
+        "component": component,
+        "decision_date": _parse_date(meta.get("date")),
+        "tags": _parse_tags(meta["tags"]) if meta.get("tags") else [],
+        "source_path": path,
+        "source_hash": hashlib.sha256(raw).hexdigest()
+    }
+
+def _parse_files(paths: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """Worker entry point: (path, row, error) per file"""
+    results = []
+    for path in paths:
+        try:
+            results.append((path, parse_adr_markdown(path), None))
+        except (OSError, ValueError) as e:
+            results.append((path, None, str(e)))
+    return results
+
+def iter_adr_files(roots: Iterable[str]) -> List[str]:
+    """ADR markdown files (``ADR-NNNN*.md``) under the given directories, sorted"""
+    paths = set()
+    for root in roots:
+        for directory, _, files in os.walk(root):
+            paths.update(os.path.join(directory, name) for name in files if ADR_FILE_PATTERN.match(name))
+    return sorted(paths)
+
+def default_adr_roots() -> List[str]:
+    """ADR_SOURCE_DIRS (os.pathsep-separated) or the repository's ADR directories"""
+    configured = os.getenv("ADR_SOURCE_DIRS")
+    if configured:
+        return [root for root in configured.split(os.pathsep) if root]
+    repo_root = Path(__file__).resolve().parents[2]
+    return [str(repo_root / "shared" / "docs" / "adr"), str(repo_root / "docs" / "adr")]
+
+class ADRCorpusImporter:
+    """
+    Imports markdown ADRs: files are parsed in a process pool, their content
+    hashes compared with ``adrs.source_hash`` in one query, and only new or
+    changed ADRs are upserted, ``batch_rows`` per transaction.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_rows: int = IMPORT_BATCH_ROWS):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_rows = batch_rows
+
+    async def parse(self, paths: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """Parse files, fanning out over processes when there is more than one chunk"""
+        loop = asyncio.get_running_loop()
+        chunks = [paths[i:i + PARSE_CHUNK_FILES] for i in range(0, len(paths), PARSE_CHUNK_FILES)]
+        if len(chunks) <= 1 or self.workers == 1:
+            return await loop.run_in_executor(None, _parse_files, paths)
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+            parts = await asyncio.gather(*(loop.run_in_executor(pool, _parse_files, chunk) for chunk in chunks))
+        return [result for part in parts for result in part]
+
+    async def import_paths(self, db: asyncpg.Connection, paths: List[str], force: bool = False) -> Dict[str, Any]:
+        """Import the given files; unchanged ADRs are skipped unless ``force``"""
+        started = datetime.now()
+        errors: List[Dict[str, str]] = []
+        rows: Dict[str, Dict[str, Any]] = {}
+
+        for path, row, error in await self.parse(sorted(paths)):
+            if error:
+                errors.append({"path": path, "error": error})
+            elif row["adr_id"] in rows:
+                errors.append({"path": path, "error": f"Duplicate of {rows[row['adr_id']]['source_path']}"})
+            else:
+                rows[row["adr_id"]] = row
+
+        stored = {
+            record["adr_id"]: record["source_hash"]
+            for record in await db.fetch(
+                "SELECT adr_id, source_hash FROM adrs WHERE adr_id = ANY($1::text[])", list(rows)
+            )
+        }
+        changed = [row for adr_id, row in rows.items() if force or stored.get(adr_id) != row["source_hash"]]
+
+        imported = []
+        for start in range(0, len(changed), self.batch_rows):
+            async with db.transaction():
+                imported.extend(await bulk_upsert_adrs(db, changed[start:start + self.batch_rows], from_files=True))
+        if imported:
+            data_generations.bump("adrs")
+
+        # Ids already used by an ADR from another file or from the API are not overwritten
+        written = {record["adr_id"] for record in imported}
+        conflicts = [
+            {"path": row["source_path"], "adr_id": row["adr_id"], "error": "ADR id belongs to another ADR"}
+            for row in changed if row["adr_id"] not in written
+        ]
+
+        created = sum(1 for record in imported if record["inserted"])
+        duration_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+        logger.info(
+            f"📚 ADR import: {len(paths)} files, {created} created, {len(imported) - created} updated, "
+            f"{len(conflicts)} conflicts, {len(errors)} errors ({duration_ms}ms)"
+        )
+        return {
+            "files": len(paths),
+            "created": created,
+            "updated": len(imported) - created,
+            "unchanged": len(rows) - len(changed),
+            "embedding_queued": sum(1 for record in imported if record["embedding_queued"]),
+            "duration_ms": duration_ms,
+            "conflicts": conflicts,
+            "errors": errors
+        }
+
+    async def import_directories(
+        self,
+        db: asyncpg.Connection,
+        roots: Optional[List[str]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """Walk ADR directories (default: ``default_adr_roots()``) and import every ADR file"""
+        roots = roots or default_adr_roots()
+        paths = await asyncio.get_running_loop().run_in_executor(None, iter_adr_files, roots)
+        return await self.import_paths(db, paths, force=force)
+
+# Global ADR corpus importer instance
+adr_importer = ADRCorpusImporter()
@@ -0,0 +1,74 @@
+"""
+🗃️ KRINS-Chronicle-Keeper Derived Data Caches
+Write-invalidated in-memory caches for computed analytics
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple, Hashable
+
+class DataGenerations:
+    """
+    Monotonic per-table write counters.
+
+    Write endpoints bump the tables they modify; caches remember the counters
+    their entries were computed under and drop entries once any has moved.
+    Counters are per process, so the TTL still bounds staleness across workers.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+
+    def bump(self, *tables: str):
+        """Record a write to the given tables"""
+        for table in tables:
+            self.counters[table] = self.counters.get(table, 0) + 1
+
+    def snapshot(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Current counters for the given tables"""
+        return tuple(self.counters.get(table, 0) for table in tables)
+
+class GenerationCache:
+    """TTL cache whose entries are invalidated by writes to their source tables"""
+
+    def __init__(self, tables: Tuple[str, ...], ttl_seconds: int = 300, max_entries: int = 256):
+        self.tables = tables
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.cache: Dict[Hashable, Tuple[Tuple[int, ...], datetime, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value if it is fresh and no source table has been written since"""
+        entry = self.cache.get(key)
+
+        if entry:
+            generation, computed_at, value = entry
+            age = (datetime.now(timezone.utc) - computed_at).total_seconds()
+            if age < self.ttl_seconds and generation == data_generations.snapshot(self.tables):
+                return value
+            # Remove stale entry
+            del self.cache[key]
+
+        return None
+
+    def generation(self) -> Tuple[int, ...]:
+        """Current generations of the source tables; take this before reading them"""
+        return data_generations.snapshot(self.tables)
+
+    def set(self, key: Hashable, value: Any, generation: Tuple[int, ...]):
+        """
+        Cache a value computed from data read after ``generation()`` returned
+        ``generation``. A write that lands while the value is being computed
+        then leaves the entry already stale instead of marking it current.
+        """
+        if len(self.cache) >= self.max_entries:
+            # Evict the oldest entry
+            oldest = min(self.cache, key=lambda k: self.cache[k][1])
+            del self.cache[oldest]
+        self.cache[key] = (generation, datetime.now(timezone.utc), value)
+
+    def clear(self):
+        """Clear all cached values"""
+        self.cache.clear()
+
+# Global write counters shared by all caches
+data_generations = DataGenerations()
@@ -0,0 +1,184 @@
+"""
+⚔️ KRINS-Chronicle-Keeper Conflict Detection
+Blocked all-pairs embedding similarity to surface candidate conflicts and duplicates
+"""
+
+import asyncio
+import asyncpg
+import logging
+import numpy as np
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+from .export import iter_record_chunks
+
+logger = logging.getLogger(__name__)
+
+CONFLICT_SIMILARITY_THRESHOLD = 0.88  # Same component, closely related: possible conflict
+DUPLICATE_SIMILARITY_THRESHOLD = 0.96  # Nearly identical wording: likely duplicate
+SIMILARITY_TILE_ROWS = 2048
+MAX_CANDIDATE_PAIRS = 100000
+
+# Sorted by component so each component is a contiguous block of the matrix
+ACCEPTED_EMBEDDINGS_QUERY = """
+    SELECT adr_id, component, embedding::real[] AS embedding
+    FROM adrs
+    WHERE status = 'accepted' AND embedding IS NOT NULL
+    ORDER BY component, adr_id
+"""
+
+def component_blocks(components: List[str]) -> List[Tuple[int, int]]:
+    """(start, end) row ranges of equal components in a component-sorted list"""
+    blocks = []
+    start = 0
+    for i in range(1, len(components) + 1):
+        if i == len(components) or components[i] != components[start]:
+            if i - start > 1:
+                blocks.append((start, i))
+            start = i
+    return blocks
+
+def find_similar_pairs(
+    matrix: np.ndarray,
+    blocks: List[Tuple[int, int]],
+    threshold: float,
+    tile_rows: int = SIMILARITY_TILE_ROWS,
+    max_pairs: int = MAX_CANDIDATE_PAIRS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+    """
+    Cosine similarity pairs at or above ``threshold`` within each row block.
+
+    ``matrix`` rows must be L2-normalized. Each block is compared tile by tile
+    (upper triangle only), so memory is bounded by ``tile_rows``² floats.
+    Returns (row a, row b, similarity, truncated).
+    """
+    found_a, found_b, found_sim = [], [], []
+    total = 0
+
+    for start, end in blocks:
+        for i0 in range(start, end, tile_rows):
+            i1 = min(i0 + tile_rows, end)
+            left = matrix[i0:i1]
+            for j0 in range(i0, end, tile_rows):
+                j1 = min(j0 + tile_rows, end)
+                similarity = left @ matrix[j0:j1].T
+                hits = similarity >= threshold
+                if j0 == i0:
+                    hits = np.triu(hits, k=1)
+                rows, cols = np.nonzero(hits)
+                if rows.size == 0:
+                    continue
+
+                found_a.append(rows + i0)
+                found_b.append(cols + j0)
+                found_sim.append(similarity[rows, cols])
+                total += rows.size
+                if total >= max_pairs:
+                    return _concat_pairs(found_a, found_b, found_sim, max_pairs) + (True,)
+
+    return _concat_pairs(found_a, found_b, found_sim, max_pairs) + (False,)
+
+def _concat_pairs(a, b, sim, limit: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not a:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    return np.concatenate(a)[:limit], np.concatenate(b)[:limit], np.concatenate(sim)[:limit]
+
+class ConflictDetector:
+    """
+    Scans accepted ADR embeddings for same-component pairs that look like
+    conflicts or duplicates and stores them in decision_conflict_candidates.
+    """
+
+    def __init__(
+        self,
+        threshold: float = CONFLICT_SIMILARITY_THRESHOLD,
+        duplicate_threshold: float = DUPLICATE_SIMILARITY_THRESHOLD
+    ):
+        self.threshold = threshold
+        self.duplicate_threshold = duplicate_threshold
+        self.running = False
+        self.last_scan: Optional[Dict[str, Any]] = None
+
+    async def load_embeddings(self, db: asyncpg.Connection) -> Tuple[List[str], List[str], np.ndarray]:
+        """Accepted ADR ids, components and L2-normalized embedding matrix"""
+        adr_ids: List[str] = []
+        components: List[str] = []
+        vectors: List[np.ndarray] = []
+        dimensions = None
+
+        async for chunk in iter_record_chunks(db, ACCEPTED_EMBEDDINGS_QUERY):
+            for record in chunk:
+                vector = np.asarray(record["embedding"], dtype=np.float32)
+                if dimensions is None:
+                    dimensions = vector.size
+                norm = np.linalg.norm(vector)
+                if vector.size != dimensions or norm == 0:
+                    continue
+                adr_ids.append(record["adr_id"])
+                components.append(record["component"])
+                vectors.append(vector / norm)
+
+        matrix = np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+        return adr_ids, components, matrix
+
+    async def scan(self, db: asyncpg.Connection, threshold: Optional[float] = None) -> Dict[str, Any]:
+        """Run a full scan and replace the stored candidates"""
+        threshold = threshold if threshold is not None else self.threshold
+        started = datetime.now(timezone.utc)
+
+        adr_ids, components, matrix = await self.load_embeddings(db)
+        blocks = component_blocks(components)
+
+        # Matrix products release the GIL; keep the event loop responsive
+        loop = asyncio.get_running_loop()
+        rows_a, rows_b, similarity, truncated = await loop.run_in_executor(
+            None, find_similar_pairs, matrix, blocks, threshold
+        )
+
+        records = [
+            (
+                adr_ids[a], adr_ids[b], components[a], float(sim),
+                "duplicate" if sim >= self.duplicate_threshold else "conflict", started
+            )
+            for a, b, sim in zip(rows_a.tolist(), rows_b.tolist(), similarity.tolist())
+        ]
+
+        async with db.transaction():
+            await db.execute("DELETE FROM decision_conflict_candidates")
+            if records:
+                await db.copy_records_to_table(
+                    "decision_conflict_candidates",
+                    records=records,
+                    columns=["adr_a", "adr_b", "component", "similarity", "candidate_type", "detected_at"]
+                )
+
+        duration_ms = round((datetime.now(timezone.utc) - started).total_seconds() * 1000, 1)
+        summary = {
+            "started_at": started.isoformat(),
+            "duration_ms": duration_ms,
+            "decisions_scanned": len(adr_ids),
+            "components_compared": len(blocks),
+            "threshold": threshold,
+            "candidates": len(records),
+            "duplicates": sum(1 for record in records if record[4] == "duplicate"),
+            "truncated": truncated
+        }
+        logger.info(
+            f"⚔️ Conflict scan: {len(adr_ids)} decisions, {len(records)} candidates ({duration_ms}ms)"
+        )
+        return summary
+
+    async def run_in_background(self, pool: asyncpg.Pool, threshold: Optional[float] = None):
+        """Scan using a pooled connection, recording the outcome in ``last_scan``"""
+        self.running = True
+        try:
+            async with pool.acquire() as db:
+                self.last_scan = {"status": "completed", **await self.scan(db, threshold)}
+        except Exception as e:
+            logger.error(f"❌ Conflict scan failed: {e}")
+            self.last_scan = {"status": "failed", "error": str(e), "failed_at": datetime.now(timezone.utc).isoformat()}
+        finally:
+            self.running = False
+
+# Global conflict detector instance
+conflict_detector = ConflictDetector()
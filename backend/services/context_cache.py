@@ -0,0 +1,56 @@
+"""
+🧠 KRINS-Chronicle-Keeper AI Context Cache
+Reuses generated AI context for repeated questions until the ADR corpus changes
+"""
+
+import re
+from typing import Dict, Any, Optional, Tuple
+
+from .cache import GenerationCache
+
+CONTEXT_CACHE_TTL_SECONDS = 600
+
+_WORD_RE = re.compile(r"\w+")
+
+def normalize_query(query: str) -> str:
+    """
+    Case- and punctuation-insensitive form of a context query.
+
+    The ADR lookup uses plainto_tsquery, which only sees the words, so queries
+    that normalize alike retrieve the same decisions.
+    """
+    return " ".join(_WORD_RE.findall(query.lower()))
+
+class ContextCache:
+    """
+    Generated AI context per (normalized query, context type, include flags).
+
+    Entries carry the ADR write generation they were built under, so any ADR
+    write (including changes to the accepted set) invalidates them; the TTL
+    bounds staleness from writes made by other workers.
+    """
+
+    def __init__(self, ttl_seconds: int = CONTEXT_CACHE_TTL_SECONDS, max_entries: int = 512):
+        self.cache = GenerationCache(("adrs",), ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    @staticmethod
+    def key(
+        query: str,
+        context_type: str,
+        include_patterns: bool,
+        include_decisions: bool,
+        include_runbooks: bool
+    ) -> Tuple[Any, ...]:
+        return (normalize_query(query), context_type, include_patterns, include_decisions, include_runbooks)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        return self.cache.get(key)
+
+    def generation(self) -> Tuple[int, ...]:
+        return self.cache.generation()
+
+    def set(self, key: Tuple[Any, ...], context: Dict[str, Any], generation: Tuple[int, ...]):
+        self.cache.set(key, context, generation)
+
+# Global AI context cache instance
+context_cache = ContextCache()
@@ -0,0 +1,301 @@
+"""
+🔄 KRINS-Chronicle-Keeper Docs Sync
+Watches ADR, pattern and runbook markdown and syncs only the touched files
+"""
+
+import asyncio
+import asyncpg
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
+
+from .adr_import import ADR_FILE_PATTERN, adr_importer, default_adr_roots
+from .cache import data_generations
+
+try:
+    from watchfiles import awatch
+except ImportError:  # Falls back to polling file stats
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_SECONDS = 0.5
+MAX_DEBOUNCE_SECONDS = 5.0
+POLL_INTERVAL_SECONDS = 2.0
+
+DOCUMENT_KINDS = ("pattern", "runbook")
+
+TITLE_RE = re.compile(r"^#\s+(?:(?:Pattern|Runbook):\s*)?(.+?)\s*$", re.MULTILINE)
+
+# Unchanged documents are left untouched and not returned
+DOCUMENT_UPSERT_QUERY = """
+    INSERT INTO knowledge_documents AS d (
+        source_path, kind, title, category, content, source_hash, embedding_queued_at
+    )
+    SELECT t.*, NOW()
+    FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+        AS t(source_path, kind, title, category, content, source_hash)
+    ON CONFLICT (source_path) DO UPDATE SET
+        kind = EXCLUDED.kind,
+        title = EXCLUDED.title,
+        category = EXCLUDED.category,
+        content = EXCLUDED.content,
+        source_hash = EXCLUDED.source_hash,
+        updated_at = NOW(),
+        embedding_queued_at = NOW()
+    WHERE d.source_hash IS DISTINCT FROM EXCLUDED.source_hash
+    RETURNING source_path, (xmax = 0) AS inserted
+"""
+
+# Paths synced from files before, so the startup reconcile also sees deleted files
+KNOWN_SOURCE_PATHS_QUERY = """
+    SELECT source_path FROM knowledge_documents
+    UNION
+    SELECT source_path FROM adrs WHERE source_path IS NOT NULL AND source_hash IS NOT NULL
+"""
+
+def _source_dirs(env_var: str, *default: str) -> List[str]:
+    configured = os.getenv(env_var)
+    if configured:
+        return [root for root in configured.split(os.pathsep) if root]
+    return [str(Path(__file__).resolve().parents[2].joinpath(*default))]
+
+def default_doc_roots() -> Dict[str, List[str]]:
+    """Watched directories per document kind (overridable with *_SOURCE_DIRS)"""
+    return {
+        "adr": default_adr_roots(),
+        "pattern": _source_dirs("PATTERN_SOURCE_DIRS", "docs", "patterns"),
+        "runbook": _source_dirs("RUNBOOK_SOURCE_DIRS", "docs", "runbooks"),
+    }
+
+def parse_document_markdown(path: str, root: str, kind: str) -> Tuple[str, ...]:
+    """Pattern/runbook row: title from the first heading, category from the subdirectory"""
+    raw = Path(path).read_bytes()
+    text = raw.decode("utf-8", errors="replace")
+    title_match = TITLE_RE.search(text)
+    relative = Path(path).relative_to(root)
+    category = relative.parts[0] if len(relative.parts) > 1 else None
+    return (
+        path, kind, title_match.group(1) if title_match else relative.stem,
+        category, text, hashlib.sha256(raw).hexdigest()
+    )
+
+class DocsSync:
+    """
+    Keeps database rows in step with the markdown docs.
+
+    On start every watched file is reconciled once, then filesystem events
+    (inotify via watchfiles, or stat polling without it) are debounced into
+    batches; each batch reparses only the touched files and writes only those
+    whose content hash changed. ADRs go through the ADR importer, which queues
+    them in adr_embedding_queue; patterns and runbooks are stored in
+    knowledge_documents with ``embedding_queued_at`` set when they change.
+    Generating the embeddings is left to the worker that drains those queues.
+    """
+
+    def __init__(
+        self,
+        roots: Optional[Dict[str, List[str]]] = None,
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        poll_interval: float = POLL_INTERVAL_SECONDS
+    ):
+        self.roots = roots
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self.task: Optional[asyncio.Task] = None
+        self.last_sync: Optional[Dict[str, Any]] = None
+
+    def _roots(self) -> Dict[str, List[str]]:
+        if self.roots is None:
+            self.roots = default_doc_roots()
+        return self.roots
+
+    def classify(self, path: str) -> Optional[Tuple[str, str]]:
+        """(kind, root) for a watched document path, None for anything else"""
+        name = os.path.basename(path)
+        if not name.endswith(".md") or name.startswith("TEMPLATE-"):
+            return None
+        for kind, roots in self._roots().items():
+            for root in roots:
+                if os.path.commonpath([os.path.abspath(path), os.path.abspath(root)]) == os.path.abspath(root):
+                    if kind == "adr" and not ADR_FILE_PATTERN.match(name):
+                        return None
+                    return kind, root
+        return None
+
+    async def sync_paths(self, db: asyncpg.Connection, paths: Set[str]) -> Dict[str, Any]:
+        """Reparse and upsert the given files; rows of deleted files are detached or removed"""
+        started = datetime.now()
+        loop = asyncio.get_running_loop()
+        touched = {path: self.classify(path) for path in paths}
+        touched = {path: target for path, target in touched.items() if target}
+        present = {path for path in touched if os.path.isfile(path)}
+        removed = [path for path in touched if path not in present]
+
+        summary: Dict[str, Any] = {"files": len(touched), "removed": len(removed)}
+
+        adr_paths = [path for path in present if touched[path][0] == "adr"]
+        if adr_paths:
+            summary["adrs"] = await adr_importer.import_paths(db, adr_paths)
+
+        documents, errors = [], []
+        for path in sorted(present):
+            kind, root = touched[path]
+            if kind in DOCUMENT_KINDS:
+                try:
+                    documents.append(await loop.run_in_executor(None, parse_document_markdown, path, root, kind))
+                except OSError as e:
+                    errors.append({"path": path, "error": str(e)})
+
+        async with db.transaction():
+            changed = []
+            if documents:
+                changed = await db.fetch(DOCUMENT_UPSERT_QUERY, *(list(column) for column in zip(*documents)))
+            if removed:
+                await db.execute("DELETE FROM knowledge_documents WHERE source_path = ANY($1::text[])", removed)
+                # ADR rows outlive their files; forget the hash so a restored file re-imports
+                await db.execute(
+                    "UPDATE adrs SET source_hash = NULL WHERE source_path = ANY($1::text[])",
+                    removed
+                )
+        if changed or removed:
+            data_generations.bump("knowledge_documents")
+
+        summary.update({
+            "documents_changed": len(changed),
+            "errors": errors,
+            "duration_ms": round((datetime.now() - started).total_seconds() * 1000, 1)
+        })
+        self.last_sync = {**summary, "synced_at": datetime.now()}
+        logger.info(
+            f"🔄 Docs sync: {len(touched)} files, {len(changed)} documents changed, "
+            f"{len(removed)} removed ({summary['duration_ms']}ms)"
+        )
+        return summary
+
+    async def reconcile(self, db: asyncpg.Connection) -> Dict[str, Any]:
+        """Full diff pass over every watched file and every previously synced path"""
+        loop = asyncio.get_running_loop()
+        on_disk = await loop.run_in_executor(None, self._snapshot)
+        known = {row["source_path"] for row in await db.fetch(KNOWN_SOURCE_PATHS_QUERY)}
+        return await self.sync_paths(db, set(on_disk) | known)
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime, size) of every watched file, for the polling fallback"""
+        stats = {}
+        for roots in self._roots().values():
+            for root in roots:
+                for directory, _, files in os.walk(root):
+                    for name in files:
+                        path = os.path.join(directory, name)
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
+                            continue
+                        stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    async def _poll(self) -> AsyncIterator[Set[str]]:
+        loop = asyncio.get_running_loop()
+        previous = await loop.run_in_executor(None, self._snapshot)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await loop.run_in_executor(None, self._snapshot)
+            changed = {path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)}
+            previous = current
+            if changed:
+                yield changed
+
+    async def _changes(self) -> AsyncIterator[Set[str]]:
+        """Raw batches of changed paths from inotify or polling"""
+        roots = [root for roots in self._roots().values() for root in roots if os.path.isdir(root)]
+        if not roots:
+            logger.warning("⚠️ Docs sync has no existing directories to watch")
+            return
+        if awatch is not None:
+            logger.info(f"🔄 Watching {len(roots)} docs directories (inotify)")
+            async for changes in awatch(*roots, step=50):
+                yield {path for _, path in changes}
+        else:
+            logger.info(f"🔄 Polling {len(roots)} docs directories every {self.poll_interval}s")
+            async for changed in self._poll():
+                yield changed
+
+    async def _debounced(
+        self,
+        on_start: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> AsyncIterator[Set[str]]:
+        """
+        Merge bursts: flush once no event arrived for ``debounce_seconds`` (or
+        after MAX_DEBOUNCE_SECONDS). ``on_start`` runs once watching has begun,
+        so changes made while it runs are still delivered afterwards.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            async for changed in self._changes():
+                await queue.put(changed)
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        loop = asyncio.get_running_loop()
+        try:
+            if on_start is not None:
+                await on_start()
+            while True:
+                pending = await queue.get()
+                if pending is None:
+                    return
+                deadline = loop.time() + MAX_DEBOUNCE_SECONDS
+                while loop.time() < deadline:
+                    try:
+                        more = await asyncio.wait_for(
+                            queue.get(), min(self.debounce_seconds, deadline - loop.time())
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                    if more is None:
+                        yield pending
+                        return
+                    pending |= more
+                yield pending
+        finally:
+            producer.cancel()
+
+    async def _sync(self, pool: asyncpg.Pool, paths: Optional[Set[str]] = None):
+        """Sync the given paths, or reconcile everything without them; failures are logged"""
+        try:
+            async with pool.acquire() as db:
+                if paths is None:
+                    await self.reconcile(db)
+                else:
+                    await self.sync_paths(db, paths)
+        except Exception as e:
+            logger.error(f"❌ Docs sync failed: {e}")
+
+    async def run(self, pool: asyncpg.Pool):
+        """Reconcile all watched files, then sync touched files until cancelled"""
+        async for paths in self._debounced(on_start=lambda: self._sync(pool)):
+            if any(self.classify(path) for path in paths):
+                await self._sync(pool, paths)
+
+    def start(self, pool: asyncpg.Pool):
+        """Start watching in the background"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run(pool))
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+# Global docs sync instance
+docs_sync = DocsSync()
@@ -0,0 +1,171 @@
+"""
+🎯 KRINS-Chronicle-Keeper Effectiveness Scoring
+Batch decision effectiveness scoring with NumPy over the whole ADR set
+"""
+
+import asyncpg
+import logging
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+from .rollups import evidence_rollups
+
+logger = logging.getLogger(__name__)
+
+# Score weights - must sum to 1.0
+EFFECTIVENESS_WEIGHTS = {
+    "base_confidence": 0.3,
+    "evidence_completeness": 0.2,
+    "confidence_level": 0.2,
+    "success_rate": 0.2,
+    "influence": 0.1,
+}
+
+EVIDENCE_SATURATION = 5.0  # Up to 5 evidence entries for full score
+INFLUENCE_SATURATION = 3.0  # Up to 3 links for full influence score
+
+# One round trip: per-ADR evidence (from the daily rollups) and link aggregates
+# joined onto the ADR set. Impacts only count when both values are present and
+# non-zero, and links are deduplicated per (link, endpoint) so a self-link counts once.
+EFFECTIVENESS_INPUTS_QUERY = """
+    WITH evidence_stats AS (
+        SELECT
+            adr_id,
+            SUM(evidence_count) AS evidence_count,
+            SUM(confidence_sum) / NULLIF(SUM(confidence_count), 0) AS avg_confidence,
+            SUM(positive_impact_count) AS positive_impacts,
+            SUM(impact_count) AS total_impacts
+        FROM decision_evidence_rollups
+        WHERE granularity = 'day'
+        AND ($1::text[] IS NULL OR adr_id = ANY($1))
+        GROUP BY adr_id
+    ),
+    link_stats AS (
+        SELECT adr_id, COUNT(*) AS links_count
+        FROM (
+            SELECT id, from_adr AS adr_id FROM decision_links
+            UNION
+            SELECT id, to_adr AS adr_id FROM decision_links
+        ) endpoints
+        WHERE ($1::text[] IS NULL OR adr_id = ANY($1))
+        GROUP BY adr_id
+    )
+    SELECT
+        a.adr_id, a.title, a.status, a.component, a.confidence_score,
+        COALESCE(es.evidence_count, 0) AS evidence_count,
+        COALESCE(es.avg_confidence, 0) AS avg_confidence,
+        COALESCE(es.positive_impacts, 0) AS positive_impacts,
+        COALESCE(es.total_impacts, 0) AS total_impacts,
+        COALESCE(ls.links_count, 0) AS links_count
+    FROM adrs a
+    LEFT JOIN evidence_stats es ON es.adr_id = a.adr_id
+    LEFT JOIN link_stats ls ON ls.adr_id = a.adr_id
+    WHERE ($1::text[] IS NULL OR a.adr_id = ANY($1))
+"""
+
+def compute_effectiveness_scores(inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Vectorized effectiveness formula.
+
+    ``inputs`` holds equal-length arrays: confidence (0 for NULL), evidence_count,
+    avg_confidence, positive_impacts, total_impacts and links_count.
+    """
+    confidence = inputs["confidence"]
+    evidence_count = inputs["evidence_count"].astype(np.float64)
+    positive = inputs["positive_impacts"].astype(np.float64)
+    total = inputs["total_impacts"].astype(np.float64)
+    links = inputs["links_count"].astype(np.float64)
+
+    success_rate = np.divide(positive * 100.0, total, out=np.zeros_like(total), where=total > 0)
+
+    # A missing or zero confidence score falls back to a neutral 0.5
+    base_score = np.where(confidence > 0, confidence, 0.5) * EFFECTIVENESS_WEIGHTS["base_confidence"]
+    evidence_score = np.minimum(evidence_count / EVIDENCE_SATURATION, 1.0) * EFFECTIVENESS_WEIGHTS["evidence_completeness"]
+    confidence_score = inputs["avg_confidence"] * EFFECTIVENESS_WEIGHTS["confidence_level"]
+    success_score = (success_rate / 100.0) * EFFECTIVENESS_WEIGHTS["success_rate"]
+    influence_score = np.minimum(links / INFLUENCE_SATURATION, 1.0) * EFFECTIVENESS_WEIGHTS["influence"]
+
+    return {
+        "effectiveness_score": base_score + evidence_score + confidence_score + success_score + influence_score,
+        "base_confidence": base_score,
+        "evidence_completeness": evidence_score,
+        "confidence_level": confidence_score,
+        "success_rate_score": success_score,
+        "influence_score": influence_score,
+        "success_rate": success_rate,
+        "negative_impacts": total - positive,
+    }
+
+def effectiveness_recommendation(score: float) -> str:
+    """Human readable recommendation for an effectiveness score"""
+    if score > 0.7:
+        return "High effectiveness"
+    if score > 0.4:
+        return "Moderate effectiveness"
+    return "Low effectiveness - consider review"
+
+class EffectivenessScorer:
+    """Batch effectiveness scoring and persistence"""
+
+    def __init__(self, db: asyncpg.Connection):
+        self.db = db
+
+    async def load_inputs(self, adr_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Load scoring inputs for the given ADRs (or all ADRs) as column arrays"""
+        await evidence_rollups.ensure_current(self.db)
+        rows = await self.db.fetch(EFFECTIVENESS_INPUTS_QUERY, adr_ids)
+        count = len(rows)
+
+        return {
+            "adr_id": [row["adr_id"] for row in rows],
+            "title": [row["title"] for row in rows],
+            "status": [row["status"] for row in rows],
+            "component": [row["component"] for row in rows],
+            "confidence": np.fromiter(
+                (float(row["confidence_score"] or 0) for row in rows), dtype=np.float64, count=count
+            ),
+            "evidence_count": np.fromiter((row["evidence_count"] for row in rows), dtype=np.int64, count=count),
+            "avg_confidence": np.fromiter(
+                (float(row["avg_confidence"]) for row in rows), dtype=np.float64, count=count
+            ),
+            "positive_impacts": np.fromiter((row["positive_impacts"] for row in rows), dtype=np.int64, count=count),
+            "total_impacts": np.fromiter((row["total_impacts"] for row in rows), dtype=np.int64, count=count),
+            "links_count": np.fromiter((row["links_count"] for row in rows), dtype=np.int64, count=count),
+        }
+
+    async def score(self, adr_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Load inputs and compute effectiveness scores for the given ADRs (or all ADRs)"""
+        inputs = await self.load_inputs(adr_ids)
+        return {**inputs, **compute_effectiveness_scores(inputs)}
+
+    async def store_scores(self, scored: Dict[str, Any]) -> int:
+        """Persist computed scores to adrs.effectiveness_score in a single statement"""
+        if not scored["adr_id"]:
+            return 0
+
+        result = await self.db.execute("""
+            UPDATE adrs
+            SET effectiveness_score = s.score, effectiveness_scored_at = NOW()
+            FROM unnest($1::text[], $2::float8[]) AS s(adr_id, score)
+            WHERE adrs.adr_id = s.adr_id
+        """, scored["adr_id"], np.round(scored["effectiveness_score"], 2).tolist())
+
+        return int(result.split()[-1])
+
+    async def recompute_all(self) -> Dict[str, Any]:
+        """Score every ADR and store the results"""
+        scored = await self.score()
+        stored = await self.store_scores(scored)
+        scores = scored["effectiveness_score"]
+
+        logger.info(f"🎯 Recomputed effectiveness for {len(scored['adr_id'])} ADRs ({stored} stored)")
+        return {
+            "scored": len(scored["adr_id"]),
+            "stored": stored,
+            "average_score": round(float(scores.mean()), 2) if scores.size else 0,
+            "distribution": {
+                "high": int(np.count_nonzero(scores > 0.7)),
+                "moderate": int(np.count_nonzero((scores > 0.4) & (scores <= 0.7))),
+                "low": int(np.count_nonzero(scores <= 0.4)),
+            }
+        }
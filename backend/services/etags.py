@@ -0,0 +1,57 @@
+"""
+🏷️ KRINS-Chronicle-Keeper Entity Tags
+Row-version ETags for conditional GETs and optimistic-concurrency updates
+"""
+
+import hashlib
+from typing import List, Optional, Sequence
+
+# Microseconds since epoch of updated_at; cheap to select and compare in SQL
+ROW_VERSION_SQL = "(extract(epoch FROM updated_at) * 1000000)::bigint"
+
+DETAIL_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+def make_etag(row_version: int, variant: Optional[Sequence[str]] = None) -> str:
+    """
+    Strong ETag for a row version.
+
+    ``variant`` (e.g. a field projection) is folded in so different
+    representations of the same row never share a tag.
+    """
+    tag = format(row_version, "x")
+    if variant:
+        tag += "-" + hashlib.sha1(",".join(variant).encode("utf-8")).hexdigest()[:8]
+    return f'"{tag}"'
+
+def _split_tags(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+def etag_matches_none_match(header: Optional[str], etag: str) -> bool:
+    """Whether If-None-Match matches ``etag`` (weak comparison, per RFC 9110)"""
+    if not header:
+        return False
+    tags = _split_tags(header)
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+def if_match_versions(header: Optional[str]) -> Optional[List[int]]:
+    """
+    Row versions accepted by an If-Match header.
+
+    Returns None when any version is acceptable (no header or ``*``); weak and
+    malformed tags never match, so they yield no versions.
+    """
+    if not header:
+        return None
+    tags = _split_tags(header)
+    if "*" in tags:
+        return None
+
+    versions = []
+    for tag in tags:
+        if tag.startswith("W/") or len(tag) < 2 or tag[0] != '"' or tag[-1] != '"':
+            continue
+        try:
+            versions.append(int(tag[1:-1].split("-")[0], 16))
+        except ValueError:
+            continue
+    return versions
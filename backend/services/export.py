@@ -0,0 +1,186 @@
+"""
+📤 KRINS-Chronicle-Keeper Dataset Export
+Constant-memory CSV/Parquet streaming from server-side asyncpg cursors
+"""
+
+import asyncpg
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, List, Tuple
+
+from .rollups import ADR_EVIDENCE_STATS_QUERY
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_ROWS = 5000
+
+# Column name -> logical type. Numerics are cast to float8 in SQL so both
+# writers see plain Python floats.
+EXPORT_DATASETS: Dict[str, Dict[str, Any]] = {
+    "effectiveness-matrix": {
+        "columns": [
+            ("adr_id", "text"), ("title", "text"), ("component", "text"), ("status", "text"),
+            ("confidence_score", "float"), ("complexity_score", "float"), ("actionability_score", "float"),
+            ("effectiveness_score", "float"), ("influence_score", "float"), ("evidence_count", "int"),
+            ("success_rate", "float"), ("link_count", "int"), ("created_at", "timestamp"),
+        ],
+        # Evidence totals come from the daily rollups, like the matrix endpoint
+        "rollups": True,
+        "query": f"""
+            WITH evidence_stats AS ({ADR_EVIDENCE_STATS_QUERY}),
+            link_stats AS (
+                SELECT adr_id, COUNT(*) AS link_count
+                FROM (
+                    SELECT id, from_adr AS adr_id FROM decision_links
+                    UNION
+                    SELECT id, to_adr AS adr_id FROM decision_links
+                ) endpoints
+                GROUP BY adr_id
+            )
+            SELECT
+                a.adr_id, a.title, a.component, a.status,
+                a.confidence_score::float8, a.complexity_score::float8, a.actionability_score::float8,
+                a.effectiveness_score::float8, a.influence_score::float8,
+                COALESCE(es.evidence_count, 0)::int8 AS evidence_count,
+                es.success_rate::float8 AS success_rate,
+                COALESCE(ls.link_count, 0)::int8 AS link_count,
+                a.created_at
+            FROM adrs a
+            LEFT JOIN evidence_stats es ON es.adr_id = a.adr_id
+            LEFT JOIN link_stats ls ON ls.adr_id = a.adr_id
+            WHERE a.created_at >= $1
+            ORDER BY a.created_at DESC
+        """
+    },
+    "evidence": {
+        "columns": [
+            ("id", "text"), ("adr_id", "text"), ("component", "text"), ("evidence_type", "text"),
+            ("description", "text"), ("value_before", "float"), ("value_after", "float"),
+            ("metric_unit", "text"), ("confidence_level", "float"),
+            ("collection_date", "timestamp"), ("created_at", "timestamp"),
+        ],
+        "query": """
+            SELECT
+                de.id::text, de.adr_id, a.component, de.evidence_type, de.description,
+                de.value_before::float8, de.value_after::float8, de.metric_unit,
+                de.confidence_level::float8, de.collection_date, de.created_at
+            FROM decision_evidence de
+            JOIN adrs a ON a.adr_id = de.adr_id
+            WHERE de.collection_date >= $1
+            ORDER BY de.collection_date DESC
+        """
+    },
+}
+
+def parquet_available() -> bool:
+    """Whether the optional pyarrow dependency is installed"""
+    return pa is not None
+
+async def iter_record_chunks(
+    db: asyncpg.Connection,
+    query: str,
+    *args,
+    chunk_size: int = EXPORT_CHUNK_ROWS
+) -> AsyncIterator[List[asyncpg.Record]]:
+    """Yield lists of records from a server-side cursor, never holding more than one chunk"""
+    async with db.transaction():
+        chunk = []
+        async for record in db.cursor(query, *args, prefetch=chunk_size):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def _csv_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+async def stream_csv(
+    db: asyncpg.Connection,
+    columns: List[Tuple[str, str]],
+    query: str,
+    *args
+) -> AsyncIterator[bytes]:
+    """Stream a query as CSV, one encoded chunk per cursor batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+
+    async for chunk in iter_record_chunks(db, query, *args):
+        writer.writerows([_csv_value(value) for value in record.values()] for record in chunk)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Header-only output for empty result sets
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the streaming loop"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+def _arrow_schema(columns: List[Tuple[str, str]]):
+    arrow_types = {
+        "text": pa.string(),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, arrow_types[kind]) for name, kind in columns])
+
+async def stream_parquet(
+    db: asyncpg.Connection,
+    columns: List[Tuple[str, str]],
+    query: str,
+    *args
+) -> AsyncIterator[bytes]:
+    """Stream a query as Parquet, writing one row group per cursor batch"""
+    if pa is None:
+        raise RuntimeError("Parquet export requires pyarrow")
+
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for chunk in iter_record_chunks(db, query, *args):
+            arrays = [
+                pa.array([record[index] for record in chunk], type=field.type)
+                for index, field in enumerate(schema)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
@@ -0,0 +1,360 @@
+"""
+🕸️ KRINS-Chronicle-Keeper Decision Graph Engine
+In-memory CSR adjacency over decision_links for multi-hop relationship queries
+"""
+
+import asyncio
+import asyncpg
+import logging
+import numpy as np
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+from .cache import data_generations
+
+logger = logging.getLogger(__name__)
+
+RELATIONSHIP_TYPES = ("extends", "supersedes", "conflicts", "depends", "influences")
+RELATIONSHIP_CODES = {name: code for code, name in enumerate(RELATIONSHIP_TYPES)}
+
+DIRECTIONS = ("out", "in", "both")
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+def _gather(indptr: np.ndarray, edges: np.ndarray, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized CSR row gather: (origin node per entry, edge index per entry)"""
+    nodes = nodes[nodes < len(indptr) - 1]
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return _EMPTY, _EMPTY
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+    return np.repeat(nodes, lengths), edges[offsets]
+
+def _build_index(keys: np.ndarray, node_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR row pointer and edge order for edges grouped by ``keys``"""
+    order = np.argsort(keys, kind="stable").astype(np.int64)
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=node_count), out=indptr[1:])
+    return indptr, order
+
+class DecisionGraph:
+    """
+    Decision relationship graph held as compressed sparse rows.
+
+    Links created through the API are appended to a small pending buffer and
+    folded into the CSR arrays once the buffer passes ``rebuild_threshold``.
+    Any other links write (or age past ``max_age_seconds``) triggers a reload.
+    """
+
+    def __init__(self, rebuild_threshold: int = 1024, max_age_seconds: int = 600):
+        self.rebuild_threshold = rebuild_threshold
+        self.max_age_seconds = max_age_seconds
+        self.lock = asyncio.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.link_ids: List[Any] = []
+
+        # Edge columns covered by the CSR index
+        self.src = np.empty(0, dtype=np.int64)
+        self.dst = np.empty(0, dtype=np.int64)
+        self.strength = np.empty(0, dtype=np.float32)
+        self.rel = np.empty(0, dtype=np.int8)
+
+        # Edges appended since the last CSR build
+        self.p_src = np.empty(0, dtype=np.int64)
+        self.p_dst = np.empty(0, dtype=np.int64)
+        self.p_strength = np.empty(0, dtype=np.float32)
+        self.p_rel = np.empty(0, dtype=np.int8)
+
+        self.out_indptr = np.zeros(1, dtype=np.int64)
+        self.out_edges = _EMPTY
+        self.in_indptr = np.zeros(1, dtype=np.int64)
+        self.in_edges = _EMPTY
+
+        self.loaded_at: Optional[datetime] = None
+        self.generation: Optional[Tuple[int, ...]] = None
+        self._labels: Optional[np.ndarray] = None
+
+    # ============= LOADING & MAINTENANCE =============
+
+    def is_current(self) -> bool:
+        """Whether the in-memory graph reflects every links write seen by this process"""
+        if self.loaded_at is None or self.generation != data_generations.snapshot(("links",)):
+            return False
+        age = (datetime.now(timezone.utc) - self.loaded_at).total_seconds()
+        return age < self.max_age_seconds
+
+    async def ensure_loaded(self, db: asyncpg.Connection):
+        """Load (or reload) the graph if it is missing or stale"""
+        if self.is_current():
+            return
+        async with self.lock:
+            if not self.is_current():
+                await self.load(db)
+
+    async def load(self, db: asyncpg.Connection):
+        """Load every decision link into CSR arrays"""
+        # Snapshot first so writes racing the load cause another reload
+        generation = data_generations.snapshot(("links",))
+        rows = await db.fetch("SELECT id, from_adr, to_adr, relationship_type, strength FROM decision_links")
+
+        self._reset()
+        count = len(rows)
+        self.src = np.fromiter((self._node(row["from_adr"]) for row in rows), dtype=np.int64, count=count)
+        self.dst = np.fromiter((self._node(row["to_adr"]) for row in rows), dtype=np.int64, count=count)
+        self.strength = np.fromiter((float(row["strength"] or 0) for row in rows), dtype=np.float32, count=count)
+        self.rel = np.fromiter(
+            (RELATIONSHIP_CODES.get(row["relationship_type"], -1) for row in rows), dtype=np.int8, count=count
+        )
+        self.link_ids = [row["id"] for row in rows]
+
+        self._build_csr()
+        self.loaded_at = datetime.now(timezone.utc)
+        self.generation = generation
+        logger.info(f"🕸️ Loaded decision graph: {len(self.node_ids)} nodes, {count} edges")
+
+    def record_created_link(self, row: Dict[str, Any]):
+        """Record a newly inserted link (see ``record_created_links``)"""
+        self.record_created_links([row])
+
+    def record_created_links(self, rows: List[Dict[str, Any]]):
+        """
+        Record newly inserted links.
+
+        Bumps the links generation and, when the graph was current, applies the
+        edges incrementally instead of forcing a reload.
+        """
+        if not rows:
+            return
+        was_current = self.is_current()
+        data_generations.bump("links")
+        if not was_current:
+            return
+
+        count = len(rows)
+        self.p_src = np.concatenate([
+            self.p_src, np.fromiter((self._node(row["from_adr"]) for row in rows), dtype=np.int64, count=count)
+        ])
+        self.p_dst = np.concatenate([
+            self.p_dst, np.fromiter((self._node(row["to_adr"]) for row in rows), dtype=np.int64, count=count)
+        ])
+        self.p_strength = np.concatenate([
+            self.p_strength, np.fromiter((float(row["strength"] or 0) for row in rows), dtype=np.float32, count=count)
+        ])
+        self.p_rel = np.concatenate([
+            self.p_rel,
+            np.fromiter(
+                (RELATIONSHIP_CODES.get(row["relationship_type"], -1) for row in rows), dtype=np.int8, count=count
+            )
+        ])
+        self.link_ids.extend(row["id"] for row in rows)
+        self.generation = data_generations.snapshot(("links",))
+        self._labels = None
+
+        if len(self.p_src) >= self.rebuild_threshold:
+            self._build_csr()
+
+    def _node(self, adr_id: str) -> int:
+        index = self.node_index.get(adr_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_index[adr_id] = index
+            self.node_ids.append(adr_id)
+        return index
+
+    def _build_csr(self):
+        """Fold pending edges into the edge columns and rebuild both CSR indexes"""
+        if len(self.p_src):
+            self.src = np.concatenate([self.src, self.p_src])
+            self.dst = np.concatenate([self.dst, self.p_dst])
+            self.strength = np.concatenate([self.strength, self.p_strength])
+            self.rel = np.concatenate([self.rel, self.p_rel])
+            self.p_src = self.p_dst = np.empty(0, dtype=np.int64)
+            self.p_strength = np.empty(0, dtype=np.float32)
+            self.p_rel = np.empty(0, dtype=np.int8)
+
+        node_count = len(self.node_ids)
+        self.out_indptr, self.out_edges = _build_index(self.src, node_count)
+        self.in_indptr, self.in_edges = _build_index(self.dst, node_count)
+        self._labels = None
+
+    # ============= TRAVERSAL PRIMITIVES =============
+
+    def _expand(self, nodes: np.ndarray, direction: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Adjacent (origin, edge index, neighbor, is_outgoing) for every node in ``nodes``"""
+        base = len(self.src)
+        parts = []
+
+        if direction in ("out", "both"):
+            origin, edges = _gather(self.out_indptr, self.out_edges, nodes)
+            parts.append((origin, edges, self.dst[edges], True))
+            mask = np.isin(self.p_src, nodes)
+            parts.append((self.p_src[mask], np.flatnonzero(mask) + base, self.p_dst[mask], True))
+
+        if direction in ("in", "both"):
+            origin, edges = _gather(self.in_indptr, self.in_edges, nodes)
+            parts.append((origin, edges, self.src[edges], False))
+            mask = np.isin(self.p_dst, nodes)
+            parts.append((self.p_dst[mask], np.flatnonzero(mask) + base, self.p_src[mask], False))
+
+        return (
+            np.concatenate([p[0] for p in parts]),
+            np.concatenate([p[1] for p in parts]),
+            np.concatenate([p[2] for p in parts]),
+            np.concatenate([np.full(len(p[0]), p[3]) for p in parts]),
+        )
+
+    def _edge_column(self, edges: np.ndarray, column: np.ndarray, pending: np.ndarray) -> np.ndarray:
+        base = len(column)
+        values = np.empty(len(edges), dtype=column.dtype)
+        in_csr = edges < base
+        values[in_csr] = column[edges[in_csr]]
+        values[~in_csr] = pending[edges[~in_csr] - base]
+        return values
+
+    def _bfs(self, start: int, direction: str, max_depth: int, target: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Breadth-first search returning (distance, parent) arrays; -1 means unreached"""
+        node_count = len(self.node_ids)
+        distance = np.full(node_count, -1, dtype=np.int64)
+        parent = np.full(node_count, -1, dtype=np.int64)
+        distance[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+
+        for depth in range(1, max_depth + 1):
+            origin, _, neighbor, _ = self._expand(frontier, direction)
+            unseen = distance[neighbor] < 0
+            neighbor, origin = neighbor[unseen], origin[unseen]
+            if neighbor.size == 0:
+                break
+            frontier, first = np.unique(neighbor, return_index=True)
+            distance[frontier] = depth
+            parent[frontier] = origin[first]
+            if target is not None and distance[target] >= 0:
+                break
+
+        return distance, parent
+
+    def _component_labels(self) -> np.ndarray:
+        """Weakly connected component label per node (min-label propagation with pointer jumping)"""
+        if self._labels is not None:
+            return self._labels
+
+        labels = np.arange(len(self.node_ids), dtype=np.int64)
+        src = np.concatenate([self.src, self.p_src])
+        dst = np.concatenate([self.dst, self.p_dst])
+
+        while True:
+            smallest = np.minimum(labels[src], labels[dst])
+            updated = labels.copy()
+            np.minimum.at(updated, src, smallest)
+            np.minimum.at(updated, dst, smallest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
+
+        self._labels = labels
+        return labels
+
+    # ============= QUERIES =============
+
+    def has_node(self, adr_id: str) -> bool:
+        return adr_id in self.node_index
+
+    def edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """All edges (including pending) as (src, dst, strength) node-index arrays"""
+        return (
+            np.concatenate([self.src, self.p_src]),
+            np.concatenate([self.dst, self.p_dst]),
+            np.concatenate([self.strength, self.p_strength]),
+        )
+
+    def neighbors(self, adr_id: str, direction: str = "both", relationship_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Directly linked decisions with the linking edge's attributes"""
+        node = self.node_index.get(adr_id)
+        if node is None:
+            return []
+
+        _, edges, neighbor, outgoing = self._expand(np.array([node], dtype=np.int64), direction)
+        rel = self._edge_column(edges, self.rel, self.p_rel)
+        if relationship_type is not None:
+            keep = rel == RELATIONSHIP_CODES.get(relationship_type, -2)
+            edges, neighbor, outgoing, rel = edges[keep], neighbor[keep], outgoing[keep], rel[keep]
+        strength = self._edge_column(edges, self.strength, self.p_strength)
+
+        return [
+            {
+                "adr_id": self.node_ids[n],
+                "direction": "out" if o else "in",
+                "relationship_type": RELATIONSHIP_TYPES[r] if r >= 0 else None,
+                "strength": round(float(s), 2),
+                "link_id": self.link_ids[e]
+            }
+            for n, o, r, s, e in zip(neighbor.tolist(), outgoing.tolist(), rel.tolist(), strength.tolist(), edges.tolist())
+        ]
+
+    def k_hop(self, adr_id: str, k: int, direction: str = "both") -> Dict[str, int]:
+        """Decisions reachable within ``k`` hops, mapped to their hop distance"""
+        node = self.node_index.get(adr_id)
+        if node is None:
+            return {}
+
+        distance, _ = self._bfs(node, direction, k)
+        reached = np.flatnonzero(distance > 0)
+        reached = reached[np.argsort(distance[reached], kind="stable")]
+        return {self.node_ids[n]: int(distance[n]) for n in reached.tolist()}
+
+    def shortest_path(self, from_adr: str, to_adr: str, direction: str = "both", max_depth: int = 32) -> Optional[List[str]]:
+        """Fewest-hop path between two decisions, or None if they are not connected"""
+        start = self.node_index.get(from_adr)
+        target = self.node_index.get(to_adr)
+        if start is None or target is None:
+            return None
+        if start == target:
+            return [from_adr]
+
+        distance, parent = self._bfs(start, direction, max_depth, target)
+        if distance[target] < 0:
+            return None
+
+        path = [target]
+        while path[-1] != start:
+            path.append(int(parent[path[-1]]))
+        return [self.node_ids[n] for n in reversed(path)]
+
+    def component_of(self, adr_id: str) -> List[str]:
+        """Every decision in the same weakly connected component"""
+        node = self.node_index.get(adr_id)
+        if node is None:
+            return []
+        labels = self._component_labels()
+        return [self.node_ids[n] for n in np.flatnonzero(labels == labels[node]).tolist()]
+
+    def components_summary(self, top_n: int = 10, min_size: int = 2) -> Dict[str, Any]:
+        """Component counts and the largest components with their members"""
+        labels = self._component_labels()
+        roots, sizes = np.unique(labels, return_counts=True)
+        keep = sizes >= min_size
+        roots, sizes = roots[keep], sizes[keep]
+        order = np.argsort(-sizes, kind="stable")[:top_n]
+
+        return {
+            "total_nodes": len(self.node_ids),
+            "total_edges": len(self.src) + len(self.p_src),
+            "component_count": int(len(roots)),
+            "largest_components": [
+                {
+                    "size": int(sizes[i]),
+                    "members": [self.node_ids[n] for n in np.flatnonzero(labels == roots[i])[:50].tolist()]
+                }
+                for i in order.tolist()
+            ]
+        }
+
+# Global decision graph instance
+decision_graph = DecisionGraph()
@@ -0,0 +1,161 @@
+"""
+🗺️ KRINS-Chronicle-Keeper Graph Export
+Streams the decision graph as JSON Graph, GraphML or an edge list from server-side cursors
+"""
+
+import asyncpg
+import json
+import logging
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .export import iter_record_chunks
+
+logger = logging.getLogger(__name__)
+
+# Format -> (media type, file extension)
+GRAPH_EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "json": ("application/vnd.jgf+json", "json"),
+    "graphml": ("application/graphml+xml", "graphml"),
+    "edgelist": ("text/tab-separated-values; charset=utf-8", "tsv"),
+}
+
+GRAPH_NODES_QUERY = """
+    SELECT adr_id, title, component, status, created_at
+    FROM adrs
+    WHERE ($1::text IS NULL OR component = $1)
+    AND ($2::text IS NULL OR status = $2)
+"""
+
+# Without filters edges are read straight off decision_links; with filters both
+# endpoints must be in the exported node set.
+GRAPH_EDGES_QUERY = """
+    SELECT dl.from_adr, dl.to_adr, dl.relationship_type, dl.strength::float8 AS strength
+    FROM decision_links dl
+"""
+
+GRAPH_FILTERED_EDGES_QUERY = """
+    SELECT dl.from_adr, dl.to_adr, dl.relationship_type, dl.strength::float8 AS strength
+    FROM decision_links dl
+    JOIN adrs fa ON fa.adr_id = dl.from_adr
+    JOIN adrs ta ON ta.adr_id = dl.to_adr
+    WHERE ($1::text IS NULL OR (fa.component = $1 AND ta.component = $1))
+    AND ($2::text IS NULL OR (fa.status = $2 AND ta.status = $2))
+"""
+
+GRAPHML_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <key id="title" for="node" attr.name="title" attr.type="string"/>
+  <key id="component" for="node" attr.name="component" attr.type="string"/>
+  <key id="status" for="node" attr.name="status" attr.type="string"/>
+  <key id="created_at" for="node" attr.name="created_at" attr.type="string"/>
+  <key id="relationship_type" for="edge" attr.name="relationship_type" attr.type="string"/>
+  <key id="strength" for="edge" attr.name="strength" attr.type="double"/>
+  <graph id="decisions" edgedefault="directed">
+"""
+
+GRAPHML_FOOTER = """  </graph>
+</graphml>
+"""
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def _json_nodes(chunk: List[asyncpg.Record], first: bool) -> str:
+    entries = [
+        f"{json.dumps(row['adr_id'])}:" + json.dumps({
+            "label": row["title"],
+            "metadata": {"component": row["component"], "status": row["status"], "created_at": _iso(row["created_at"])}
+        })
+        for row in chunk
+    ]
+    return ("" if first else ",") + ",".join(entries)
+
+def _json_edges(chunk: List[asyncpg.Record], first: bool) -> str:
+    entries = [
+        json.dumps({
+            "source": row["from_adr"],
+            "target": row["to_adr"],
+            "relation": row["relationship_type"],
+            "metadata": {"strength": row["strength"]}
+        })
+        for row in chunk
+    ]
+    return ("" if first else ",") + ",".join(entries)
+
+def _graphml_data(key: str, value: Any) -> str:
+    return f'<data key="{key}">{escape(str(value))}</data>' if value is not None else ""
+
+def _graphml_nodes(chunk: List[asyncpg.Record], first: bool) -> str:
+    return "".join(
+        f"    <node id={quoteattr(row['adr_id'])}>"
+        f"{_graphml_data('title', row['title'])}{_graphml_data('component', row['component'])}"
+        f"{_graphml_data('status', row['status'])}{_graphml_data('created_at', _iso(row['created_at']))}"
+        "</node>\n"
+        for row in chunk
+    )
+
+def _graphml_edges(chunk: List[asyncpg.Record], first: bool) -> str:
+    return "".join(
+        f"    <edge source={quoteattr(row['from_adr'])} target={quoteattr(row['to_adr'])}>"
+        f"{_graphml_data('relationship_type', row['relationship_type'])}{_graphml_data('strength', row['strength'])}"
+        "</edge>\n"
+        for row in chunk
+    )
+
+def _edgelist_edges(chunk: List[asyncpg.Record], first: bool) -> str:
+    return "".join(
+        f"{row['from_adr']}\t{row['to_adr']}\t{row['relationship_type']}\t"
+        f"{'' if row['strength'] is None else row['strength']}\n"
+        for row in chunk
+    )
+
+# Format -> (prefix, node writer, separator, edge writer, suffix)
+_WRITERS = {
+    "json": ('{"graph":{"directed":true,"nodes":{', _json_nodes, '},"edges":[', _json_edges, "]}}\n"),
+    "graphml": (GRAPHML_HEADER, _graphml_nodes, "", _graphml_edges, GRAPHML_FOOTER),
+    "edgelist": ("from_adr\tto_adr\trelationship_type\tstrength\n", None, "", _edgelist_edges, ""),
+}
+
+async def stream_graph(
+    db: asyncpg.Connection,
+    export_format: str,
+    component: Optional[str] = None,
+    status: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """Stream the (optionally filtered) decision graph, one encoded piece per cursor chunk"""
+    prefix, write_nodes, separator, write_edges, suffix = _WRITERS[export_format]
+    filtered = component is not None or status is not None
+    edges_query = GRAPH_FILTERED_EDGES_QUERY if filtered else GRAPH_EDGES_QUERY
+    edge_args = (component, status) if filtered else ()
+
+    node_count = edge_count = 0
+    # One snapshot for nodes and edges so every edge endpoint is in the node set
+    async with db.transaction(isolation="repeatable_read", readonly=True):
+        yield prefix.encode("utf-8")
+
+        if write_nodes:
+            async for chunk in iter_record_chunks(db, GRAPH_NODES_QUERY, component, status):
+                yield write_nodes(chunk, node_count == 0).encode("utf-8")
+                node_count += len(chunk)
+
+        yield separator.encode("utf-8")
+
+        async for chunk in iter_record_chunks(db, edges_query, *edge_args):
+            yield write_edges(chunk, edge_count == 0).encode("utf-8")
+            edge_count += len(chunk)
+
+        yield suffix.encode("utf-8")
+
+    logger.info(f"🗺️ Exported decision graph as {export_format}: {node_count} nodes, {edge_count} edges")
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
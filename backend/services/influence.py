@@ -0,0 +1,141 @@
+"""
+🌐 KRINS-Chronicle-Keeper Influence Ranking
+Weighted PageRank over the decision graph with warm-started incremental refresh
+"""
+
+import asyncio
+import asyncpg
+import logging
+import numpy as np
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+from .graph import decision_graph
+
+logger = logging.getLogger(__name__)
+
+DAMPING = 0.85
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 100
+CHANGE_EPSILON = 1e-9  # Scores that moved less than this are not rewritten
+
+def weighted_pagerank(
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: np.ndarray,
+    node_count: int,
+    damping: float = DAMPING,
+    initial: Optional[np.ndarray] = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS
+) -> Tuple[np.ndarray, int]:
+    """
+    Power iteration for weighted PageRank on an edge list.
+
+    Each node splits its rank across outgoing edges in proportion to edge
+    weight; rank of nodes without outgoing weight is spread uniformly.
+    Returns (ranks summing to 1, iterations used).
+    """
+    if node_count == 0:
+        return np.empty(0, dtype=np.float64), 0
+
+    weight = weight.astype(np.float64)
+    out_weight = np.bincount(src, weights=weight, minlength=node_count)
+    edge_out = out_weight[src]
+    transition = np.divide(weight, edge_out, out=np.zeros_like(weight), where=edge_out > 0)
+    dangling = out_weight == 0
+
+    if initial is not None and initial.sum() > 0:
+        ranks = initial / initial.sum()
+    else:
+        ranks = np.full(node_count, 1.0 / node_count)
+
+    teleport = (1.0 - damping) / node_count
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        updated = np.bincount(dst, weights=ranks[src] * transition, minlength=node_count)
+        updated = damping * (updated + ranks[dangling].sum() / node_count) + teleport
+        error = np.abs(updated - ranks).sum()
+        ranks = updated
+        if error < tolerance * node_count:
+            break
+
+    return ranks, iterations
+
+class InfluenceRanker:
+    """
+    Keeps adrs.influence_score in sync with the decision graph.
+
+    Refreshes warm-start from the previous ranks, so small link changes converge
+    in a few iterations, and only rewrite scores that actually moved.
+    """
+
+    def __init__(self):
+        self.ranks: Dict[str, float] = {}
+        self.generation: Optional[Tuple[int, ...]] = None
+        self.lock = asyncio.Lock()
+
+    def is_current(self) -> bool:
+        return self.generation is not None and self.generation == decision_graph.generation and decision_graph.is_current()
+
+    async def refresh(self, db: asyncpg.Connection, force: bool = False) -> Dict[str, Any]:
+        """Recompute influence scores if the graph changed (or always with ``force``)"""
+        async with self.lock:
+            await decision_graph.ensure_loaded(db)
+            if not force and self.is_current():
+                return {"refreshed": False, "updated": 0}
+
+            started = datetime.now()
+            node_ids = decision_graph.node_ids
+            src, dst, strength = decision_graph.edge_arrays()
+
+            full = force or not self.ranks
+            initial = None
+            if not full:
+                initial = np.fromiter(
+                    (self.ranks.get(adr_id, 0.0) for adr_id in node_ids), dtype=np.float64, count=len(node_ids)
+                )
+
+            ranks, iterations = weighted_pagerank(src, dst, strength, len(node_ids), initial=initial)
+
+            previous = np.fromiter(
+                (self.ranks.get(adr_id, -1.0) for adr_id in node_ids), dtype=np.float64, count=len(node_ids)
+            )
+            changed = np.flatnonzero(np.abs(ranks - previous) > CHANGE_EPSILON)
+
+            async with db.transaction():
+                # Decisions that dropped out of the graph lose their score
+                cleared = await db.execute("""
+                    UPDATE adrs SET influence_score = NULL, influence_scored_at = NOW()
+                    WHERE influence_score IS NOT NULL AND NOT adr_id = ANY($1::text[])
+                """, node_ids)
+                if changed.size:
+                    await db.execute("""
+                        UPDATE adrs
+                        SET influence_score = s.score, influence_scored_at = NOW()
+                        FROM unnest($1::text[], $2::float8[]) AS s(adr_id, score)
+                        WHERE adrs.adr_id = s.adr_id
+                    """, [node_ids[i] for i in changed.tolist()], ranks[changed].tolist())
+
+            cleared_count = int(cleared.split()[-1])
+            self.ranks = dict(zip(node_ids, ranks.tolist()))
+            self.generation = decision_graph.generation
+
+            duration_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+            logger.info(
+                f"🌐 Influence refresh: {len(node_ids)} nodes, {len(src)} edges, "
+                f"{iterations} iterations, {changed.size} scores updated, {cleared_count} cleared ({duration_ms}ms)"
+            )
+            return {
+                "refreshed": True,
+                "mode": "full" if full else "incremental",
+                "nodes": len(node_ids),
+                "edges": int(len(src)),
+                "iterations": iterations,
+                "updated": int(changed.size),
+                "cleared": cleared_count,
+                "duration_ms": duration_ms
+            }
+
+# Global influence ranker instance
+influence_ranker = InfluenceRanker()
@@ -0,0 +1,160 @@
+"""
+📥 KRINS-Chronicle-Keeper Bulk Ingestion
+Streaming NDJSON/CSV parsing and COPY-based loading of decision evidence
+"""
+
+import asyncpg
+import codecs
+import csv
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Any, List, Tuple
+
+from .rollups import evidence_rollups
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_ROWS = 5000
+MAX_REPORTED_ERRORS = 1000
+
+EVIDENCE_COPY_COLUMNS = [
+    "adr_id", "evidence_type", "description", "value_before", "value_after",
+    "metric_unit", "collection_date", "confidence_level"
+]
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines without buffering the whole body (a leading BOM is dropped)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+async def iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """Yield (line number, parsed object or ValueError) for each non-blank NDJSON line"""
+    line_number = 0
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e}")
+
+async def iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """Yield (line number, row dict) for each CSV data row; empty cells become None"""
+    header = None
+    line_number = 0
+    pending = ""
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        # Quoted fields may span lines; wait until quotes are balanced
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            continue
+        line, pending = pending, ""
+        if not line.strip():
+            continue
+        values = next(csv.reader([line.rstrip("\r")]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield line_number, {name: (value if value != "" else None) for name, value in zip(header, values)}
+
+def _describe_error(error: Exception) -> str:
+    """One-line message for validation errors (pydantic errors list every field)"""
+    if hasattr(error, "errors"):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+        )
+    return str(error)
+
+class EvidenceIngestor:
+    """
+    Validates evidence records in batches, checks ADR references with one
+    set-based query per batch and loads valid rows with COPY.
+    """
+
+    def __init__(self, validate: Callable[[Any], Any], batch_rows: int = INGEST_BATCH_ROWS):
+        self.validate = validate
+        self.batch_rows = batch_rows
+
+    async def ingest(self, db: asyncpg.Connection, records: AsyncIterator[Tuple[int, Any]]) -> Dict[str, Any]:
+        """Load every valid record; invalid ones are reported by line number"""
+        started = datetime.now()
+        stats = {"received": 0, "inserted": 0, "rejected": 0}
+        errors: List[Dict[str, Any]] = []
+        batch: List[Tuple[int, Any]] = []
+
+        def reject(line: int, message: str):
+            stats["rejected"] += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": line, "error": message})
+
+        async def flush():
+            if batch:
+                stats["inserted"] += await self._load_batch(db, batch, reject)
+                batch.clear()
+
+        async for line, payload in records:
+            stats["received"] += 1
+            if isinstance(payload, Exception):
+                reject(line, str(payload))
+                continue
+            try:
+                batch.append((line, self.validate(payload)))
+            except Exception as e:
+                reject(line, _describe_error(e))
+                continue
+            if len(batch) >= self.batch_rows:
+                await flush()
+        await flush()
+
+        duration_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+        logger.info(
+            f"📥 Evidence ingest: {stats['inserted']} inserted, {stats['rejected']} rejected ({duration_ms}ms)"
+        )
+        return {
+            **stats,
+            "duration_ms": duration_ms,
+            "errors": errors,
+            "errors_truncated": stats["rejected"] > len(errors)
+        }
+
+    async def _load_batch(
+        self,
+        db: asyncpg.Connection,
+        batch: List[Tuple[int, Any]],
+        reject: Callable[[int, str], None]
+    ) -> int:
+        adr_ids = list({evidence.adr_id for _, evidence in batch})
+        existing = {
+            row["adr_id"] for row in await db.fetch("SELECT adr_id FROM adrs WHERE adr_id = ANY($1::text[])", adr_ids)
+        }
+
+        now = datetime.now()
+        rows = []
+        for line, evidence in batch:
+            if evidence.adr_id not in existing:
+                reject(line, f"ADR {evidence.adr_id} not found")
+                continue
+            rows.append((
+                evidence.adr_id, evidence.evidence_type, evidence.description,
+                evidence.value_before, evidence.value_after, evidence.metric_unit,
+                evidence.collection_date or now, evidence.confidence_level
+            ))
+
+        if rows:
+            await db.copy_records_to_table("decision_evidence", records=rows, columns=EVIDENCE_COPY_COLUMNS)
+            await evidence_rollups.mark_pending(db, list({row[0] for row in rows}))
+        return len(rows)
@@ -0,0 +1,173 @@
+"""
+🔍 KRINS-Chronicle-Keeper Insights Engine
+Collects insight signals in one aggregate query and builds only the requested insights
+"""
+
+import asyncpg
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from .cache import GenerationCache
+
+logger = logging.getLogger(__name__)
+
+INSIGHT_TYPES = ("pattern", "anomaly", "trend", "recommendation")
+
+# Signal columns computed in a single scan of adrs; $1 is the window in days
+INSIGHT_SIGNALS = {
+    "anomaly": """
+        COUNT(*) FILTER (
+            WHERE a.confidence_score < 0.5 AND a.created_at >= NOW() - make_interval(days => $1)
+        ) AS low_confidence""",
+    "trend": """
+        COUNT(*) FILTER (WHERE a.created_at >= NOW() - INTERVAL '7 days') AS recent_count,
+        COUNT(*) FILTER (
+            WHERE a.created_at >= NOW() - INTERVAL '14 days' AND a.created_at < NOW() - INTERVAL '7 days'
+        ) AS previous_count""",
+    "recommendation": """
+        COUNT(*) FILTER (
+            WHERE a.status = 'accepted'
+            AND a.created_at <= NOW() - make_interval(days => $1)
+            AND NOT EXISTS (SELECT 1 FROM decision_evidence de WHERE de.adr_id = a.adr_id)
+        ) AS decisions_without_evidence""",
+}
+
+# Component concentration needs its own grouping, joined onto the signal row
+TOP_COMPONENT_CTE = """
+    top_component AS (
+        SELECT component, COUNT(*) AS count, AVG(confidence_score) AS avg_confidence
+        FROM adrs
+        WHERE created_at >= NOW() - make_interval(days => $1)
+        GROUP BY component
+        HAVING COUNT(*) >= 2
+        ORDER BY count DESC
+        LIMIT 1
+    )"""
+
+def build_signals_query(insight_types: List[str]) -> str:
+    """Build one aggregate query that collects only the signals for the given insight types"""
+    columns = [INSIGHT_SIGNALS[t] for t in insight_types if t in INSIGHT_SIGNALS] or ["COUNT(*) AS total"]
+    ctes = [f"signals AS (SELECT {','.join(columns)} FROM adrs a)"]
+    select = "SELECT s.*"
+    joins = ""
+
+    if "pattern" in insight_types:
+        ctes.append(TOP_COMPONENT_CTE)
+        select += ", tc.component AS top_component, tc.count AS top_component_count, tc.avg_confidence AS top_component_confidence"
+        joins = " LEFT JOIN top_component tc ON TRUE"
+
+    return f"WITH {', '.join(ctes)} {select} FROM signals s{joins}"
+
+def build_insights(signals: Dict[str, Any], insight_types: List[str], window_days: int = 30) -> List[Dict[str, Any]]:
+    """Turn collected signals into insight records for the requested types"""
+    insights = []
+
+    # Pattern insight: Most active components
+    if "pattern" in insight_types and signals.get("top_component") is not None:
+        component = signals["top_component"]
+        count = signals["top_component_count"]
+        insights.append({
+            "insight_type": "pattern",
+            "title": f"High Activity in {component} Component",
+            "description": f"The {component} component has {count} decisions in the last {window_days} days with average confidence of {float(signals['top_component_confidence'] or 0):.2f}",
+            "confidence": 0.85,
+            "impact_level": "medium" if count > 3 else "low",
+            "data_sources": ["adrs"],
+            "suggested_actions": [
+                f"Review {component} component architecture",
+                "Consider if decisions can be consolidated",
+                "Document emerging patterns in this component"
+            ]
+        })
+
+    # Anomaly insight: Low confidence decisions
+    low_confidence = signals.get("low_confidence")
+    if "anomaly" in insight_types and low_confidence:
+        insights.append({
+            "insight_type": "anomaly",
+            "title": "Low Confidence Decisions Detected",
+            "description": f"Found {low_confidence} decisions with confidence below 50% in the last {window_days} days. This may indicate insufficient information or analysis.",
+            "confidence": 0.9,
+            "impact_level": "high" if low_confidence > 3 else "medium",
+            "data_sources": ["adrs"],
+            "suggested_actions": [
+                "Review low-confidence decisions for missing information",
+                "Establish minimum confidence thresholds",
+                "Improve decision documentation process"
+            ]
+        })
+
+    # Trend insight: Decision velocity
+    if "trend" in insight_types:
+        recent_count = signals["recent_count"]
+        previous_count = signals["previous_count"]
+        if recent_count > previous_count * 1.5:
+            insights.append({
+                "insight_type": "trend",
+                "title": "Accelerating Decision Pace",
+                "description": f"Decision velocity has increased significantly: {recent_count} decisions this week vs {previous_count} last week (+{((recent_count - previous_count) / max(previous_count, 1)) * 100:.0f}%)",
+                "confidence": 0.8,
+                "impact_level": "medium",
+                "data_sources": ["adrs"],
+                "suggested_actions": [
+                    "Monitor decision quality during rapid pace",
+                    "Ensure adequate review time for decisions",
+                    "Consider if pace is sustainable"
+                ]
+            })
+
+    # Recommendation insight: Missing evidence
+    without_evidence = signals.get("decisions_without_evidence")
+    if "recommendation" in insight_types and without_evidence:
+        insights.append({
+            "insight_type": "recommendation",
+            "title": "Evidence Collection Opportunity",
+            "description": f"{without_evidence} accepted decisions lack follow-up evidence. Collecting impact data could improve future decision-making.",
+            "confidence": 0.75,
+            "impact_level": "medium",
+            "data_sources": ["adrs", "decision_evidence"],
+            "suggested_actions": [
+                "Implement evidence collection process",
+                "Set reminders for post-decision impact measurement",
+                "Create templates for common evidence types"
+            ]
+        })
+
+    return insights
+
+class InsightsEngine:
+    """Computes organizational insights with per-(window, filters) memoization"""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.cache = GenerationCache(("adrs", "evidence"), ttl_seconds=ttl_seconds)
+
+    async def get_insights(
+        self,
+        db: asyncpg.Connection,
+        window_days: int = 30,
+        insight_type: Optional[str] = None,
+        impact_level: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return insights for the window and filters, computing them only on a cache miss"""
+        key = (window_days, insight_type, impact_level)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        generation = self.cache.generation()
+        insight_types = [insight_type] if insight_type else list(INSIGHT_TYPES)
+        query = build_signals_query(insight_types)
+        row = await db.fetchrow(query, *((window_days,) if "$1" in query else ()))
+        insights = build_insights(dict(row) if row else {}, insight_types, window_days)
+
+        if impact_level:
+            insights = [i for i in insights if i["impact_level"] == impact_level]
+
+        result = {"insights": insights, "generated_at": datetime.now().isoformat()}
+        self.cache.set(key, result, generation)
+        logger.debug(f"🔍 Computed insights for window={window_days} type={insight_type} impact={impact_level}")
+        return {**result, "cached": False}
+
+# Global insights engine instance
+insights_engine = InsightsEngine()
@@ -0,0 +1,49 @@
+"""
+🔢 KRINS-Chronicle-Keeper ADR Numbering
+Atomic per-component ADR number allocation from a counter table
+"""
+
+import asyncpg
+from typing import List
+
+# One row per ADR id scope; the upsert takes a row lock only for its own scope,
+# so creates in different components never wait on each other.
+ALLOCATE_NUMBERS_QUERY = """
+    INSERT INTO adr_number_counters AS c (scope, last_number)
+    VALUES ($1, $2)
+    ON CONFLICT (scope) DO UPDATE SET last_number = c.last_number + EXCLUDED.last_number, updated_at = NOW()
+    RETURNING last_number
+"""
+
+# Advances counters past explicitly supplied ids (imports) so later allocations never collide
+RESERVE_NUMBERS_QUERY = r"""
+    INSERT INTO adr_number_counters AS c (scope, last_number)
+    SELECT substring(adr_id FROM '^ADR-\d+-(.+)$'), MAX(substring(adr_id FROM '^ADR-(\d+)-')::int)
+    FROM unnest($1::text[]) AS t(adr_id)
+    WHERE adr_id ~ '^ADR-\d+-.+$'
+    GROUP BY 1
+    ON CONFLICT (scope) DO UPDATE SET
+        last_number = GREATEST(c.last_number, EXCLUDED.last_number),
+        updated_at = NOW()
+"""
+
+def adr_id_scope(component: str) -> str:
+    """Component as it appears in ADR ids (components differing only in case share numbers)"""
+    return component.upper().replace(" ", "-")
+
+def format_adr_id(number: int, component: str) -> str:
+    return f"ADR-{str(number).zfill(4)}-{adr_id_scope(component)}"
+
+async def allocate_adr_numbers(db: asyncpg.Connection, component: str, count: int = 1) -> List[int]:
+    """Reserve ``count`` consecutive ADR numbers for a component in one statement"""
+    last = await db.fetchval(ALLOCATE_NUMBERS_QUERY, adr_id_scope(component), count)
+    return list(range(last - count + 1, last + 1))
+
+async def allocate_adr_id(db: asyncpg.Connection, component: str) -> str:
+    """Reserve the next ADR id for a component"""
+    number, = await allocate_adr_numbers(db, component)
+    return format_adr_id(number, component)
+
+async def reserve_adr_ids(db: asyncpg.Connection, adr_ids: List[str]) -> None:
+    """Keep counters ahead of ADR ids written with explicit numbers"""
+    await db.execute(RESERVE_NUMBERS_QUERY, adr_ids)
@@ -0,0 +1,74 @@
+"""
+📑 KRINS-Chronicle-Keeper Pagination & Projection
+Opaque keyset cursors and field projection helpers for list endpoints
+"""
+
+import asyncpg
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last returned row as an opaque URL-safe token"""
+    payload = [
+        {"t": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(token: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor`` into values of ``types``.
+
+    Raises ValueError if the token is malformed or a value has the wrong type,
+    so bad cursors surface as client errors rather than database errors.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except Exception:
+        raise ValueError("Malformed cursor")
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("Malformed cursor")
+
+    values = []
+    for value, expected in zip(payload, types):
+        if expected is datetime:
+            if not isinstance(value, dict) or not isinstance(value.get("t"), str):
+                raise ValueError("Malformed cursor")
+            try:
+                value = datetime.fromisoformat(value["t"])
+            except ValueError:
+                raise ValueError("Malformed cursor")
+        elif expected is float and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        elif not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            raise ValueError("Malformed cursor")
+        values.append(value)
+    return tuple(values)
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str], default: Sequence[str]) -> List[str]:
+    """
+    Resolve a comma-separated ``fields`` parameter against the allowed names.
+
+    Returns ``default`` when no fields are given; raises ValueError naming any
+    unknown fields. Order follows ``allowed`` so responses stay stable.
+    """
+    if not fields:
+        return list(default)
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in allowed if name in requested]
+
+async def estimate_count(db: asyncpg.Connection, query: str, *args) -> int:
+    """Planner row estimate for a query, without executing it"""
+    plan = await db.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
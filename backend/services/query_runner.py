@@ -0,0 +1,39 @@
+"""
+⚡ KRINS-Chronicle-Keeper Concurrent Query Runner
+Runs independent read queries in parallel through the connection pool
+"""
+
+import asyncio
+import asyncpg
+import logging
+import os
+from typing import Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on pool connections a single request may hold at once
+DEFAULT_QUERY_CONCURRENCY = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", "4"))
+
+# name -> (asyncpg method, SQL, args)
+QueryPlan = Dict[str, Tuple[str, str, tuple]]
+
+class ConcurrentQueryRunner:
+    """Execute a named set of independent queries concurrently under a concurrency cap"""
+
+    def __init__(self, pool: asyncpg.Pool, max_concurrency: int = DEFAULT_QUERY_CONCURRENCY):
+        self.pool = pool
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(self, method: str, query: str, args: tuple) -> Any:
+        async with self.semaphore:
+            async with self.pool.acquire() as conn:
+                return await getattr(conn, method)(query, *args)
+
+    async def run(self, plan: QueryPlan) -> Dict[str, Any]:
+        """Run every query in the plan and return results keyed by name"""
+        names = list(plan.keys())
+        results = await asyncio.gather(
+            *(self._run(method, query, args) for method, query, args in plan.values())
+        )
+        logger.debug(f"⚡ Ran {len(names)} queries concurrently")
+        return dict(zip(names, results))
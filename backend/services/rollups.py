@@ -0,0 +1,235 @@
+"""
+⏱️ KRINS-Chronicle-Keeper Evidence Rollups
+Hourly and daily pre-aggregates of decision evidence, refreshed incrementally
+"""
+
+import asyncio
+import asyncpg
+import logging
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+from .cache import data_generations
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_GRANULARITIES = ("hour", "day")
+ROLLUP_MAX_AGE_SECONDS = 300
+
+# Serializes refreshes across workers (transaction-scoped advisory lock)
+ROLLUP_LOCK_KEY = "decision_evidence_rollups"
+
+ROLLUP_COLUMNS = """
+    evidence_count, confidence_sum, confidence_count,
+    value_count, value_min, value_max, value_sum,
+    measured_count, improved_count, impact_count, positive_impact_count
+"""
+
+# Evidence writers record the ADRs they touched in evidence_rollup_pending in the
+# same transaction, so a marker becomes visible exactly when its evidence commits.
+# Upserting (rather than DO NOTHING) locks an existing marker, so a refresh cannot
+# consume it while the writer's evidence is still uncommitted.
+MARK_PENDING_QUERY = """
+    INSERT INTO evidence_rollup_pending (adr_id)
+    SELECT DISTINCT unnest($1::text[])
+    ON CONFLICT (adr_id) DO UPDATE SET marked_at = NOW()
+"""
+
+# Recompute every (granularity, adr_id, metric_unit, bucket) of the selected ADRs.
+# Rows without a collection_date are bucketed by created_at.
+REFRESH_ROLLUPS_QUERY = """
+    WITH touched AS (
+        SELECT DISTINCT
+            adr_id,
+            COALESCE(metric_unit, '') AS metric_unit,
+            date_trunc('{unit}', COALESCE(collection_date, created_at)) AS bucket_start
+        FROM decision_evidence
+        {where}
+    )
+    INSERT INTO decision_evidence_rollups (
+        granularity, adr_id, metric_unit, bucket_start, {columns}
+    )
+    SELECT
+        '{unit}', t.adr_id, t.metric_unit, t.bucket_start,
+        COUNT(*),
+        SUM(de.confidence_level),
+        COUNT(de.confidence_level),
+        COUNT(de.value_after),
+        MIN(de.value_after),
+        MAX(de.value_after),
+        SUM(de.value_after),
+        COUNT(*) FILTER (WHERE de.value_before IS NOT NULL AND de.value_after IS NOT NULL),
+        COUNT(*) FILTER (WHERE de.value_after > de.value_before),
+        COUNT(*) FILTER (WHERE de.value_before <> 0 AND de.value_after <> 0),
+        COUNT(*) FILTER (WHERE de.value_before <> 0 AND de.value_after <> 0 AND de.value_after > de.value_before)
+    FROM touched t
+    JOIN decision_evidence de
+        ON de.adr_id = t.adr_id
+        AND COALESCE(de.metric_unit, '') = t.metric_unit
+        AND COALESCE(de.collection_date, de.created_at) >= t.bucket_start
+        AND COALESCE(de.collection_date, de.created_at) < t.bucket_start + INTERVAL '1 {unit}'
+    GROUP BY t.adr_id, t.metric_unit, t.bucket_start
+    ON CONFLICT (granularity, adr_id, metric_unit, bucket_start) DO UPDATE SET
+        evidence_count = EXCLUDED.evidence_count,
+        confidence_sum = EXCLUDED.confidence_sum,
+        confidence_count = EXCLUDED.confidence_count,
+        value_count = EXCLUDED.value_count,
+        value_min = EXCLUDED.value_min,
+        value_max = EXCLUDED.value_max,
+        value_sum = EXCLUDED.value_sum,
+        measured_count = EXCLUDED.measured_count,
+        improved_count = EXCLUDED.improved_count,
+        impact_count = EXCLUDED.impact_count,
+        positive_impact_count = EXCLUDED.positive_impact_count
+"""
+
+# Per-ADR evidence totals from the daily rollups, shared by the effectiveness
+# matrix endpoint and its export
+ADR_EVIDENCE_STATS_QUERY = """
+    SELECT
+        adr_id,
+        SUM(evidence_count) AS evidence_count,
+        SUM(improved_count)::float8 / NULLIF(SUM(measured_count), 0) AS success_rate
+    FROM decision_evidence_rollups
+    WHERE granularity = 'day'
+    GROUP BY adr_id
+"""
+
+EVIDENCE_SERIES_QUERY = """
+    SELECT
+        r.bucket_start,
+        r.metric_unit,
+        SUM(r.evidence_count) AS evidence_count,
+        MIN(r.value_min) AS value_min,
+        MAX(r.value_max) AS value_max,
+        SUM(r.value_sum) / NULLIF(SUM(r.value_count), 0) AS value_avg,
+        SUM(r.improved_count)::float8 / NULLIF(SUM(r.measured_count), 0) AS success_rate,
+        SUM(r.confidence_sum) / NULLIF(SUM(r.confidence_count), 0) AS avg_confidence
+    FROM decision_evidence_rollups r
+    JOIN adrs a ON a.adr_id = r.adr_id
+    WHERE r.granularity = $1 AND r.bucket_start >= $2 {filters}
+    GROUP BY r.bucket_start, r.metric_unit
+    ORDER BY r.bucket_start, r.metric_unit
+"""
+
+class EvidenceRollups:
+    """
+    Maintains decision_evidence_rollups.
+
+    Each refresh recomputes only the ADRs whose evidence changed, as recorded
+    by ``mark_pending`` in the writing transaction; the first refresh builds
+    every bucket. Readers call ``ensure_current`` first, which refreshes after
+    local evidence writes or once the rollups are older than ``max_age_seconds``.
+    """
+
+    def __init__(self, max_age_seconds: int = ROLLUP_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self.generation: Optional[tuple] = None
+        self.refreshed_at: Optional[datetime] = None
+        self.lock = asyncio.Lock()
+
+    def is_current(self) -> bool:
+        if self.refreshed_at is None or self.generation != data_generations.snapshot(("evidence",)):
+            return False
+        age = (datetime.now(timezone.utc) - self.refreshed_at).total_seconds()
+        return age < self.max_age_seconds
+
+    async def mark_pending(self, db: asyncpg.Connection, adr_ids: List[str]):
+        """Queue ADRs for recompute; call inside the transaction that writes their evidence"""
+        if adr_ids:
+            await db.execute(MARK_PENDING_QUERY, list(adr_ids))
+
+    async def ensure_current(self, db: asyncpg.Connection):
+        """Refresh rollups if evidence was written since the last refresh"""
+        if self.is_current():
+            return
+        async with self.lock:
+            if not self.is_current():
+                await self.refresh(db)
+
+    async def refresh(self, db: asyncpg.Connection, full: bool = False) -> Dict[str, Any]:
+        """Recompute the buckets of pending ADRs (or every bucket with ``full``)"""
+        generation = data_generations.snapshot(("evidence",))
+        started = datetime.now(timezone.utc)
+
+        async with db.transaction():
+            await db.execute("SELECT pg_advisory_xact_lock(hashtext($1))", ROLLUP_LOCK_KEY)
+            # State is stored under 'pending' since rollups moved to pending markers,
+            # so rollups built by the old created_at watermark are rebuilt once
+            built_at = await db.fetchval("SELECT refreshed_at FROM evidence_rollup_state WHERE name = 'pending'")
+            full = full or built_at is None
+
+            # Markers are consumed before evidence is read: anything committed in
+            # between is either included in the recompute or still marked
+            adr_ids = [row["adr_id"] for row in await db.fetch("DELETE FROM evidence_rollup_pending RETURNING adr_id")]
+
+            if full:
+                await db.execute("DELETE FROM decision_evidence_rollups")
+                where, args = "", ()
+            else:
+                # Dropping the old buckets first also removes buckets left empty
+                await db.execute("DELETE FROM decision_evidence_rollups WHERE adr_id = ANY($1::text[])", adr_ids)
+                where, args = "WHERE adr_id = ANY($1::text[])", (adr_ids,)
+
+            if full or adr_ids:
+                for unit in ROLLUP_GRANULARITIES:
+                    await db.execute(
+                        REFRESH_ROLLUPS_QUERY.format(unit=unit, where=where, columns=ROLLUP_COLUMNS), *args
+                    )
+
+            await db.execute("""
+                INSERT INTO evidence_rollup_state (name, refreshed_at) VALUES ('pending', NOW())
+                ON CONFLICT (name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+            """)
+
+        self.generation = generation
+        self.refreshed_at = datetime.now(timezone.utc)
+
+        mode = "full" if full else "incremental"
+        duration_ms = round((self.refreshed_at - started).total_seconds() * 1000, 1)
+        logger.info(f"⏱️ Evidence rollups refreshed ({mode}, {len(adr_ids)} pending ADRs, {duration_ms}ms)")
+        return {"mode": mode, "pending_adrs": len(adr_ids), "duration_ms": duration_ms}
+
+    async def fetch_series(
+        self,
+        db: asyncpg.Connection,
+        granularity: str,
+        since_date: datetime,
+        adr_id: Optional[str] = None,
+        component: Optional[str] = None,
+        metric_unit: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Evidence metrics per bucket and metric unit from the rollups"""
+        await self.ensure_current(db)
+
+        filters = []
+        params: List[Any] = [granularity, since_date]
+        if adr_id:
+            params.append(adr_id)
+            filters.append(f"r.adr_id = ${len(params)}")
+        if component:
+            params.append(component)
+            filters.append(f"a.component = ${len(params)}")
+        if metric_unit is not None:
+            params.append(metric_unit)
+            filters.append(f"r.metric_unit = ${len(params)}")
+
+        query = EVIDENCE_SERIES_QUERY.format(filters="".join(f" AND {f}" for f in filters))
+        rows = await db.fetch(query, *params)
+
+        return [
+            {
+                "bucket_start": row["bucket_start"],
+                "metric_unit": row["metric_unit"] or None,
+                "evidence_count": row["evidence_count"],
+                "value_min": float(row["value_min"]) if row["value_min"] is not None else None,
+                "value_max": float(row["value_max"]) if row["value_max"] is not None else None,
+                "value_avg": float(row["value_avg"]) if row["value_avg"] is not None else None,
+                "success_rate": round(row["success_rate"], 4) if row["success_rate"] is not None else None,
+                "avg_confidence": float(row["avg_confidence"]) if row["avg_confidence"] is not None else None
+            }
+            for row in rows
+        ]
+
+# Global evidence rollups instance
+evidence_rollups = EvidenceRollups()
@@ -0,0 +1,327 @@
+"""
+🧱 KRINS-Chronicle-Keeper Analytics Schema
+Idempotent DDL for the derived tables and columns used by the analytics services
+"""
+
+import asyncpg
+import logging
+from typing import List, Dict
+
+logger = logging.getLogger(__name__)
+
+# Every statement must be safe to re-run on each startup
+SCHEMA_STATEMENTS: List[Dict[str, str]] = [
+    {
+        "name": "adrs.effectiveness_score",
+        "query": """
+            ALTER TABLE adrs
+                ADD COLUMN IF NOT EXISTS effectiveness_score DECIMAL(3,2),
+                ADD COLUMN IF NOT EXISTS effectiveness_scored_at TIMESTAMP WITH TIME ZONE
+        """
+    },
+    {
+        "name": "idx_adrs_effectiveness_score",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_effectiveness_score ON adrs (effectiveness_score DESC NULLS LAST)"
+    },
+    {
+        "name": "adrs.influence_score",
+        "query": """
+            ALTER TABLE adrs
+                ADD COLUMN IF NOT EXISTS influence_score DOUBLE PRECISION,
+                ADD COLUMN IF NOT EXISTS influence_scored_at TIMESTAMP WITH TIME ZONE
+        """
+    },
+    {
+        "name": "idx_adrs_influence_score",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_influence_score ON adrs (influence_score DESC NULLS LAST)"
+    },
+    {
+        "name": "adr_number_counters",
+        "query": """
+            CREATE TABLE IF NOT EXISTS adr_number_counters (
+                scope TEXT PRIMARY KEY,
+                last_number INTEGER NOT NULL,
+                updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+            )
+        """
+    },
+    {
+        # Keep counters ahead of ADR ids written outside the allocator (seeds, imports)
+        "name": "adr_number_counters.reconcile",
+        "query": r"""
+            INSERT INTO adr_number_counters AS c (scope, last_number)
+            SELECT substring(adr_id FROM '^ADR-\d+-(.+)$'), MAX(substring(adr_id FROM '^ADR-(\d+)-')::int)
+            FROM adrs
+            WHERE adr_id ~ '^ADR-\d+-.+$'
+            GROUP BY 1
+            ON CONFLICT (scope) DO UPDATE SET last_number = GREATEST(c.last_number, EXCLUDED.last_number)
+        """
+    },
+    {
+        # Markdown source of imported ADRs; the hash lets re-imports skip unchanged files
+        "name": "adrs.source",
+        "query": """
+            ALTER TABLE adrs
+                ADD COLUMN IF NOT EXISTS source_path TEXT,
+                ADD COLUMN IF NOT EXISTS source_hash TEXT
+        """
+    },
+    {
+        # Bulk upserts resolve conflicts on the public ADR id
+        "name": "uq_adrs_adr_id",
+        "query": "CREATE UNIQUE INDEX IF NOT EXISTS uq_adrs_adr_id ON adrs (adr_id)"
+    },
+    {
+        # ADRs whose text changed since their embedding was generated
+        "name": "adr_embedding_queue",
+        "query": """
+            CREATE TABLE IF NOT EXISTS adr_embedding_queue (
+                adr_id TEXT PRIMARY KEY,
+                queued_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+            )
+        """
+    },
+    {
+        # Pattern and runbook markdown synced from docs/
+        "name": "knowledge_documents",
+        "query": """
+            CREATE TABLE IF NOT EXISTS knowledge_documents (
+                source_path TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                title TEXT NOT NULL,
+                category TEXT,
+                content TEXT NOT NULL,
+                source_hash TEXT NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                embedding_queued_at TIMESTAMP WITH TIME ZONE
+            )
+        """
+    },
+    {
+        "name": "idx_knowledge_documents_kind",
+        "query": "CREATE INDEX IF NOT EXISTS idx_knowledge_documents_kind ON knowledge_documents (kind, category)"
+    },
+    {
+        # Validity period as a range so "in force at T" is one indexed containment test
+        "name": "adrs.validity",
+        "query": """
+            ALTER TABLE adrs
+                ADD COLUMN IF NOT EXISTS validity TSTZRANGE
+                GENERATED ALWAYS AS (tstzrange(
+                    COALESCE(valid_from, created_at),
+                    -- An end before the start would be rejected; treat it as an empty period
+                    CASE WHEN valid_to < COALESCE(valid_from, created_at)
+                        THEN COALESCE(valid_from, created_at) ELSE valid_to END,
+                    '[)'
+                )) STORED
+        """
+    },
+    {
+        "name": "idx_adrs_validity",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_validity ON adrs USING gist (validity)"
+    },
+    {
+        "name": "idx_adrs_created",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_created ON adrs (created_at DESC, id DESC)"
+    },
+    {
+        "name": "idx_adrs_status_created",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_status_created ON adrs (status, created_at DESC, id DESC)"
+    },
+    {
+        "name": "idx_adrs_component_created",
+        "query": "CREATE INDEX IF NOT EXISTS idx_adrs_component_created ON adrs (component, created_at DESC, id DESC)"
+    },
+    {
+        "name": "idx_adrs_status_component_created",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_adrs_status_component_created
+            ON adrs (status, component, created_at DESC, id DESC)
+        """
+    },
+    {
+        "name": "idx_decision_evidence_adr_id",
+        "query": "CREATE INDEX IF NOT EXISTS idx_decision_evidence_adr_id ON decision_evidence (adr_id)"
+    },
+    {
+        "name": "brin_decision_evidence_collection_date",
+        "query": """
+            CREATE INDEX IF NOT EXISTS brin_decision_evidence_collection_date
+            ON decision_evidence USING BRIN (collection_date)
+        """
+    },
+    {
+        "name": "brin_decision_evidence_created_at",
+        "query": """
+            CREATE INDEX IF NOT EXISTS brin_decision_evidence_created_at
+            ON decision_evidence USING BRIN (created_at)
+        """
+    },
+    {
+        "name": "idx_decision_evidence_adr_collection",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_evidence_adr_collection
+            ON decision_evidence (adr_id, collection_date)
+        """
+    },
+    {
+        "name": "decision_evidence_rollups",
+        "query": """
+            CREATE TABLE IF NOT EXISTS decision_evidence_rollups (
+                granularity TEXT NOT NULL,
+                adr_id TEXT NOT NULL,
+                metric_unit TEXT NOT NULL DEFAULT '',
+                bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+                evidence_count INTEGER NOT NULL,
+                confidence_sum DOUBLE PRECISION,
+                confidence_count INTEGER NOT NULL DEFAULT 0,
+                value_count INTEGER NOT NULL DEFAULT 0,
+                value_min DOUBLE PRECISION,
+                value_max DOUBLE PRECISION,
+                value_sum DOUBLE PRECISION,
+                measured_count INTEGER NOT NULL DEFAULT 0,
+                improved_count INTEGER NOT NULL DEFAULT 0,
+                impact_count INTEGER NOT NULL DEFAULT 0,
+                positive_impact_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, adr_id, metric_unit, bucket_start)
+            )
+        """
+    },
+    {
+        "name": "idx_decision_evidence_rollups_bucket",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_evidence_rollups_bucket
+            ON decision_evidence_rollups (granularity, bucket_start)
+        """
+    },
+    {
+        "name": "evidence_rollup_state",
+        "query": """
+            CREATE TABLE IF NOT EXISTS evidence_rollup_state (
+                name TEXT PRIMARY KEY,
+                refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL
+            )
+        """
+    },
+    {
+        "name": "evidence_rollup_pending",
+        "query": """
+            CREATE TABLE IF NOT EXISTS evidence_rollup_pending (
+                adr_id TEXT PRIMARY KEY,
+                marked_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+            )
+        """
+    },
+    {
+        # The pair index below cannot be built over duplicate pairs; keep the oldest
+        # link of each pair. Only runs while the index does not exist yet.
+        "name": "decision_links.dedupe_pairs",
+        "query": """
+            DELETE FROM decision_links
+            WHERE to_regclass('uq_decision_links_pair') IS NULL
+            AND id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY from_adr, to_adr ORDER BY created_at NULLS LAST, id
+                    ) AS pair_rank
+                    FROM decision_links
+                ) ranked
+                WHERE pair_rank > 1
+            )
+        """
+    },
+    {
+        "name": "uq_decision_links_pair",
+        "query": """
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_decision_links_pair
+            ON decision_links (from_adr, to_adr)
+        """
+    },
+    {
+        "name": "idx_decision_links_created",
+        "query": "CREATE INDEX IF NOT EXISTS idx_decision_links_created ON decision_links (created_at DESC, id DESC)"
+    },
+    {
+        "name": "idx_decision_links_from_created",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_links_from_created
+            ON decision_links (from_adr, created_at DESC, id DESC)
+        """
+    },
+    {
+        "name": "idx_decision_links_to_created",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_links_to_created
+            ON decision_links (to_adr, created_at DESC, id DESC)
+        """
+    },
+    {
+        "name": "idx_decision_links_supersedes_to",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_links_supersedes_to
+            ON decision_links (to_adr) WHERE relationship_type = 'supersedes'
+        """
+    },
+    {
+        "name": "idx_decision_links_supersedes_from",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_links_supersedes_from
+            ON decision_links (from_adr) WHERE relationship_type = 'supersedes'
+        """
+    },
+    {
+        # Context cache hits log a reference to the context they reused instead of a copy
+        "name": "ai_context_logs.source_context_id",
+        "query": """
+            ALTER TABLE ai_context_logs
+                ADD COLUMN IF NOT EXISTS source_context_id TEXT,
+                ALTER COLUMN generated_context DROP NOT NULL
+        """
+    },
+    {
+        "name": "idx_ai_context_logs_context_id",
+        "query": "CREATE INDEX IF NOT EXISTS idx_ai_context_logs_context_id ON ai_context_logs (context_id)"
+    },
+    {
+        "name": "idx_ai_context_logs_lookup",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_ai_context_logs_lookup
+            ON ai_context_logs (ai_system, context_type, query, created_at DESC)
+        """
+    },
+    {
+        "name": "decision_conflict_candidates",
+        "query": """
+            CREATE TABLE IF NOT EXISTS decision_conflict_candidates (
+                adr_a TEXT NOT NULL,
+                adr_b TEXT NOT NULL,
+                component TEXT,
+                similarity REAL NOT NULL,
+                candidate_type TEXT NOT NULL,
+                detected_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                PRIMARY KEY (adr_a, adr_b)
+            )
+        """
+    },
+    {
+        "name": "idx_decision_conflict_candidates_component",
+        "query": """
+            CREATE INDEX IF NOT EXISTS idx_decision_conflict_candidates_component
+            ON decision_conflict_candidates (component, similarity DESC)
+        """
+    },
+]
+
+async def ensure_schema(pool: asyncpg.Pool) -> None:
+    """Apply analytics schema statements, logging (not raising) on failure"""
+    async with pool.acquire() as conn:
+        for statement in SCHEMA_STATEMENTS:
+            try:
+                result = await conn.execute(statement["query"])
+                if result.startswith("DELETE") and int(result.split()[-1]):
+                    logger.warning(f"⚠️  Schema statement {statement['name']} deleted {result.split()[-1]} rows")
+                logger.debug(f"🧱 Schema statement applied: {statement['name']}")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not apply schema statement {statement['name']}: {e}")
+    logger.info(f"🧱 Analytics schema verified ({len(SCHEMA_STATEMENTS)} statements)")
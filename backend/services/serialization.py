@@ -0,0 +1,64 @@
+"""
+⚡ KRINS-Chronicle-Keeper Serialization
+Direct record-to-JSON rendering for list endpoints and asyncpg JSON codecs
+"""
+
+import asyncpg
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Falls back to the standard library encoder
+    orjson = None
+
+def _default(value: Any) -> Any:
+    """Encode types neither encoder handles natively the way FastAPI would"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+class FastJSONResponse(Response):
+    """
+    JSON response for trusted rows.
+
+    Returning it from a handler skips response_model validation, so only use it
+    for data read straight from the database in the documented shape.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def decode_json_list(value: Optional[Any]) -> list:
+    """JSON array column as a list, whether or not the JSON codec decoded it already"""
+    if not value:
+        return []
+    return json.loads(value) if isinstance(value, str) else value
+
+def _encode_json(value: Any) -> str:
+    # Already-encoded JSON text passes through, so json.dumps() call sites keep working
+    return value if isinstance(value, str) else json.dumps(value)
+
+async def register_json_codecs(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects on every pooled connection"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, encoder=_encode_json, decoder=json.loads, schema="pg_catalog"
+        )
@@ -0,0 +1,107 @@
+"""
+🧬 KRINS-Chronicle-Keeper Supersession Resolution
+Resolves the currently effective decision and full lineage for any ADR
+"""
+
+import asyncpg
+import logging
+from typing import List, Dict, Any, Optional
+
+from .cache import GenerationCache
+
+logger = logging.getLogger(__name__)
+
+MAX_CHAIN_DEPTH = 64
+
+# A `supersedes` link from_adr -> to_adr means from_adr replaces to_adr.
+# Successors walk towards newer decisions (depth > 0), predecessors towards
+# older ones (depth < 0). Paths guard against cycles.
+LINEAGE_QUERY = f"""
+    WITH RECURSIVE successors AS (
+        SELECT $1::text AS adr_id, 0 AS depth, ARRAY[$1::text] AS path
+        UNION ALL
+        SELECT dl.from_adr, s.depth + 1, s.path || dl.from_adr
+        FROM decision_links dl
+        JOIN successors s ON dl.to_adr = s.adr_id
+        WHERE dl.relationship_type = 'supersedes'
+        AND NOT dl.from_adr = ANY(s.path)
+        AND s.depth < {MAX_CHAIN_DEPTH}
+    ),
+    predecessors AS (
+        SELECT $1::text AS adr_id, 0 AS depth, ARRAY[$1::text] AS path
+        UNION ALL
+        SELECT dl.to_adr, p.depth - 1, p.path || dl.to_adr
+        FROM decision_links dl
+        JOIN predecessors p ON dl.from_adr = p.adr_id
+        WHERE dl.relationship_type = 'supersedes'
+        AND NOT dl.to_adr = ANY(p.path)
+        AND p.depth > -{MAX_CHAIN_DEPTH}
+    ),
+    lineage AS (
+        SELECT adr_id, MIN(depth) AS depth FROM successors GROUP BY adr_id
+        UNION ALL
+        SELECT adr_id, MAX(depth) AS depth FROM predecessors WHERE depth < 0 GROUP BY adr_id
+    )
+    SELECT
+        l.adr_id, l.depth, a.title, a.status, a.component, a.created_at,
+        NOT EXISTS (
+            SELECT 1 FROM decision_links x
+            WHERE x.to_adr = l.adr_id AND x.relationship_type = 'supersedes'
+        ) AS is_head
+    FROM lineage l
+    JOIN adrs a ON a.adr_id = l.adr_id
+    ORDER BY l.depth, a.created_at
+"""
+
+class SupersessionResolver:
+    """Lineage lookups with one recursive query per ADR, cached until ADRs or links change"""
+
+    def __init__(self, ttl_seconds: int = 600):
+        self.cache = GenerationCache(("adrs", "links"), ttl_seconds=ttl_seconds, max_entries=4096)
+
+    async def resolve(self, db: asyncpg.Connection, adr_id: str) -> Optional[Dict[str, Any]]:
+        """Effective decision and lineage for an ADR, or None if the ADR does not exist"""
+        cached = self.cache.get(adr_id)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        generation = self.cache.generation()
+        rows = await db.fetch(LINEAGE_QUERY, adr_id)
+
+        lineage: List[Dict[str, Any]] = []
+        seen = set()
+        for row in rows:
+            if row["adr_id"] in seen:
+                continue
+            seen.add(row["adr_id"])
+            lineage.append({
+                "adr_id": row["adr_id"],
+                "depth": row["depth"],
+                "title": row["title"],
+                "status": row["status"],
+                "component": row["component"],
+                "created_at": row["created_at"],
+                "is_current": row["is_head"]
+            })
+
+        if adr_id not in seen:
+            return None
+
+        # Newest unsuperseded successors; the deepest, then most recent, wins
+        heads = [entry for entry in lineage if entry["depth"] >= 0 and entry["is_current"]]
+        effective = max(heads, key=lambda e: (e["depth"], e["created_at"])) if heads else None
+
+        result = {
+            "adr_id": adr_id,
+            "effective_adr": effective,
+            "is_superseded": effective is None or effective["adr_id"] != adr_id,
+            "ambiguous": len(heads) > 1,
+            "lineage": lineage
+        }
+
+        self.cache.set(adr_id, result, generation)
+        logger.debug(f"🧬 Resolved supersession lineage for {adr_id} ({len(lineage)} decisions)")
+        return {**result, "cached": False}
+
+# Global resolver instance
+supersession_resolver = SupersessionResolver()
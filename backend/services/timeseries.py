@@ -0,0 +1,136 @@
+"""
+📈 KRINS-Chronicle-Keeper Time-Series Engine
+Gap-filled time buckets, LTTB downsampling and single-pass summaries for trend charts
+"""
+
+import asyncpg
+import logging
+from datetime import datetime
+from typing import List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("day", "week", "month")
+
+# Every bucket between the window start and now is returned, empty ones as zero rows
+DECISION_BUCKETS_QUERY = """
+    WITH buckets AS (
+        SELECT generate_series(
+            DATE_TRUNC('{unit}', $1::timestamptz),
+            DATE_TRUNC('{unit}', NOW()),
+            INTERVAL '1 {unit}'
+        ) AS period
+    ),
+    stats AS (
+        SELECT
+            DATE_TRUNC('{unit}', created_at)::timestamptz AS period,
+            COUNT(*) AS decision_count,
+            AVG(confidence_score) AS avg_confidence,
+            COUNT(*) FILTER (WHERE status = 'accepted') AS accepted_count,
+            COUNT(*) FILTER (WHERE status = 'proposed') AS proposed_count
+        FROM adrs
+        WHERE created_at >= $1
+        GROUP BY 1
+    )
+    SELECT
+        b.period,
+        COALESCE(s.decision_count, 0) AS decision_count,
+        s.avg_confidence,
+        COALESCE(s.accepted_count, 0) AS accepted_count,
+        COALESCE(s.proposed_count, 0) AS proposed_count
+    FROM buckets b
+    LEFT JOIN stats s ON s.period = b.period
+    ORDER BY b.period
+"""
+
+async def fetch_decision_buckets(
+    db: asyncpg.Connection,
+    since_date: datetime,
+    granularity: str
+) -> List[Dict[str, Any]]:
+    """Fetch gap-filled decision buckets for the window"""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+
+    rows = await db.fetch(DECISION_BUCKETS_QUERY.format(unit=granularity), since_date)
+    return [
+        {
+            "period": row["period"].isoformat(),
+            "decision_count": row["decision_count"],
+            "avg_confidence": round(float(row["avg_confidence"] or 0), 2),
+            "accepted_count": row["accepted_count"],
+            "proposed_count": row["proposed_count"],
+            "acceptance_rate": round((row["accepted_count"] / max(row["decision_count"], 1)) * 100, 1)
+        }
+        for row in rows
+    ]
+
+def lttb_indices(values: List[float], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling over evenly spaced points.
+
+    Returns the indices of the points to keep; first and last are always kept.
+    """
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    selected = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third triangle vertex
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_x = (next_start + next_end - 1) / 2.0
+        next_y = sum(values[next_start:next_end]) / max(next_end - next_start, 1)
+
+        previous_y = values[previous]
+        best_index, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs(
+                (previous - next_x) * (values[index] - previous_y)
+                - (previous - index) * (next_y - previous_y)
+            )
+            if area > best_area:
+                best_index, best_area = index, area
+
+        selected.append(best_index)
+        previous = best_index
+
+    selected.append(count - 1)
+    return selected
+
+def summarize_buckets(buckets: List[Dict[str, Any]], recent_window: int = 3) -> Dict[str, Any]:
+    """Compute totals and trend direction in a single pass over the buckets"""
+    total_periods = len(buckets)
+    recent_from = max(total_periods - recent_window, 0)
+    total_decisions = total_accepted = recent_sum = earlier_sum = 0
+
+    for index, bucket in enumerate(buckets):
+        total_decisions += bucket["decision_count"]
+        total_accepted += bucket["accepted_count"]
+        if index >= recent_from:
+            recent_sum += bucket["decision_count"]
+        else:
+            earlier_sum += bucket["decision_count"]
+
+    if total_periods >= 2:
+        recent_avg = recent_sum / min(recent_window, total_periods)
+        earlier_avg = earlier_sum / max(total_periods - recent_window, 1)
+        trend_direction = "increasing" if recent_avg > earlier_avg * 1.1 else \
+                         "decreasing" if recent_avg < earlier_avg * 0.9 else "stable"
+    else:
+        trend_direction = "insufficient_data"
+
+    return {
+        "trend_direction": trend_direction,
+        "total_periods": total_periods,
+        "total_decisions": total_decisions,
+        "avg_decisions_per_period": round(total_decisions / max(total_periods, 1), 1),
+        "overall_acceptance_rate": round(total_accepted * 100 / max(total_decisions, 1), 1)
+    }
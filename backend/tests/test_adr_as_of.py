@@ -0,0 +1,92 @@
+"""
+🕰️ As-of query tests
+Validity filtering on ADR listings and search, and closing periods on retirement
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from api.adrs import ADRUpdate, list_adrs, semantic_search, update_adr
+from services.pagination import encode_cursor
+from services.schema import SCHEMA_STATEMENTS
+
+AS_OF = datetime(2025, 6, 1, tzinfo=timezone.utc)
+CURSOR_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+class FakeConnection:
+    """Records every query with its arguments and returns no rows"""
+
+    def __init__(self, row=None):
+        self.row = row
+        self.calls = []
+
+    def _record(self, query, args):
+        self.calls.append((" ".join(query.split()), args))
+
+    async def fetch(self, query, *args):
+        self._record(query, args)
+        return []
+
+    async def fetchval(self, query, *args):
+        self._record(query, args)
+        return 0
+
+    async def fetchrow(self, query, *args):
+        self._record(query, args)
+        return self.row
+
+async def _list(db, **filters):
+    params = dict(
+        limit=10, cursor=None, skip=0, status=None, component=None, component_match="contains",
+        count="none", fields="adr_id", as_of=None
+    )
+    params.update(filters)
+    return await list_adrs(db=db, **params)
+
+@pytest.mark.asyncio
+async def test_without_as_of_the_query_is_unchanged():
+    db = FakeConnection()
+    await _list(db, status="accepted")
+    assert "validity" not in db.calls[0][0]
+
+@pytest.mark.asyncio
+async def test_as_of_filters_pages_and_counts():
+    db = FakeConnection()
+    await _list(db, status="accepted", as_of=AS_OF, cursor=encode_cursor(CURSOR_AT, 9), count="exact")
+
+    (page_query, page_args), (count_query, count_args) = db.calls
+    assert "status = $1 AND validity @> $2::timestamptz AND (created_at, id) < ($3, $4)" in page_query
+    assert page_args == ("accepted", AS_OF, CURSOR_AT, 9, 11)
+    # The total counts ADRs in force at as_of, independent of the page position
+    assert count_query == "SELECT COUNT(*) FROM adrs WHERE status = $1 AND validity @> $2::timestamptz"
+    assert count_args == ("accepted", AS_OF)
+
+@pytest.mark.asyncio
+async def test_search_as_of():
+    db = FakeConnection()
+    await semantic_search(query="pgvector", limit=5, threshold=0.7, as_of=AS_OF, db=db)
+    query, args = db.calls[0]
+    assert "AND validity @> $3::timestamptz" in query
+    assert args == ("pgvector", 5, AS_OF)
+
+    await semantic_search(query="pgvector", limit=5, threshold=0.7, as_of=None, db=db)
+    assert "validity" not in db.calls[1][0]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, closes", [("superseded", True), ("deprecated", True), ("accepted", False)])
+async def test_retiring_an_adr_closes_its_validity_period(status, closes):
+    db = FakeConnection(row={"adr_id": "ADR-0001-API", "status": status, "row_version": None})
+    request = Request({"type": "http", "headers": []})
+    await update_adr(request, Response(), "ADR-0001-API", ADRUpdate(status=status), "adr_id,status", db)
+
+    assert ("valid_to = COALESCE(valid_to, NOW())" in db.calls[0][0]) is closes
+
+def test_validity_column_tolerates_inverted_periods():
+    statement = next(s for s in SCHEMA_STATEMENTS if s["name"] == "adrs.validity")
+    query = " ".join(statement["query"].split())
+    assert "GENERATED ALWAYS AS (tstzrange( COALESCE(valid_from, created_at)" in query
+    assert "CASE WHEN valid_to < COALESCE(valid_from, created_at)" in query
+    assert "'[)'" in query
@@ -0,0 +1,97 @@
+"""
+📦 Batch multi-get tests
+One query per include, request ordering and evidence summaries
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from api import adrs as adrs_api
+from api.adrs import BATCH_EVIDENCE_QUERY, BATCH_LINKS_QUERY, ADRBatchRequest, batch_get_adrs
+
+class FakeRunner:
+    """Answers each plan entry from canned rows and records the plan"""
+
+    plans = []
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def run(self, plan):
+        FakeRunner.plans.append(plan)
+        return {name: self.pool[name] for name in plan}
+
+def _adr(adr_id):
+    return {
+        "adr_id": adr_id, "title": f"Decision {adr_id}", "status": "accepted", "tags": None,
+        "confidence_score": 0.9, "complexity_score": 0.3, "actionability_score": 0.7,
+        "effectiveness_score": 0.6, "influence_score": 0.02,
+    }
+
+def _evidence(adr_id, evidence_type, count, day):
+    return {
+        "adr_id": adr_id, "evidence_type": evidence_type, "count": count,
+        "latest_collection_date": datetime(2026, 1, day, tzinfo=timezone.utc),
+        "adr_avg_confidence": 0.75, "adr_success_rate": 0.5,
+    }
+
+POOL = {
+    "adrs": [_adr("ADR-2"), _adr("ADR-1")],
+    "links": [
+        {"id": 1, "from_adr": "ADR-1", "to_adr": "ADR-2", "relationship_type": "depends",
+         "strength": 0.5, "description": None, "created_at": None},
+        {"id": 2, "from_adr": "ADR-1", "to_adr": "ADR-1", "relationship_type": "extends",
+         "strength": 1.0, "description": None, "created_at": None},
+    ],
+    "evidence": [
+        _evidence("ADR-1", "metric", 3, 4), _evidence("ADR-1", "feedback", 2, 9),
+        # Evidence of an ADR deleted between the concurrent queries
+        _evidence("ADR-9", "metric", 1, 1),
+    ],
+}
+
+@pytest.fixture(autouse=True)
+def runner(monkeypatch):
+    FakeRunner.plans = []
+    monkeypatch.setattr(adrs_api, "ConcurrentQueryRunner", FakeRunner)
+
+async def _batch(**request):
+    response = await batch_get_adrs(ADRBatchRequest(**request), POOL)
+    return json.loads(response.body)
+
+@pytest.mark.asyncio
+async def test_results_follow_request_order_and_list_missing_ids():
+    result = await _batch(ids=["ADR-1", "ADR-404", "ADR-2", "ADR-1"], fields=["title"])
+
+    assert [adr["title"] for adr in result["adrs"]] == ["Decision ADR-1", "Decision ADR-2"]
+    assert result["missing"] == ["ADR-404"]
+    plan = FakeRunner.plans[0]
+    assert list(plan) == ["adrs"]
+    assert plan["adrs"][1] == "SELECT title, adr_id FROM adrs WHERE adr_id = ANY($1::text[])"
+    assert plan["adrs"][2] == (["ADR-1", "ADR-404", "ADR-2"],)
+
+@pytest.mark.asyncio
+async def test_includes():
+    result = await _batch(ids=["ADR-1", "ADR-2"], include=["links", "evidence", "scores"], fields=["adr_id"])
+    adr_1, adr_2 = result["adrs"]
+
+    plan = FakeRunner.plans[0]
+    assert (plan["links"][1], plan["evidence"][1]) == (BATCH_LINKS_QUERY, BATCH_EVIDENCE_QUERY)
+    assert [link["id"] for link in adr_1["links"]] == [1, 2]
+    assert [link["id"] for link in adr_2["links"]] == [1]
+    assert adr_1["evidence"] == {
+        "count": 5, "by_type": {"metric": 3, "feedback": 2}, "avg_confidence": 0.75,
+        "success_rate": 0.5, "latest_collection_date": "2026-01-09T00:00:00+00:00",
+    }
+    assert adr_2["evidence"]["count"] == 0
+    assert adr_2["scores"]["influence_score"] == 0.02
+
+@pytest.mark.asyncio
+async def test_unknown_include_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        await _batch(ids=["ADR-1"], include=["comments"])
+    assert error.value.status_code == 400
+    assert FakeRunner.plans == []
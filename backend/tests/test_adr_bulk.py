@@ -0,0 +1,127 @@
+"""
+📦 Bulk upsert tests
+Per-component numbering, staged rows and the endpoint summary
+"""
+
+import json
+import re
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from api.adrs import MAX_BATCH_SIZE, ADRBulkUpsert, upsert_adrs_bulk
+from services.adr_import import (
+    BULK_STAGE_INSERT, BULK_STAGING_QUERY, BULK_UPSERT_COLUMNS, BULK_UPSERT_QUERY, bulk_upsert_adrs
+)
+from services.numbering import ALLOCATE_NUMBERS_QUERY, RESERVE_NUMBERS_QUERY
+
+class FakeConnection:
+    """Keeps number counters and stored ADR ids the way the queries would"""
+
+    def __init__(self, counters=None, existing=(), queued=None):
+        self.counters = dict(counters or {})
+        self.existing = set(existing)
+        self.queued = queued
+        self.staged = []
+        self.statements = []
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def execute(self, query, *args):
+        self.statements.append(query)
+        if query == RESERVE_NUMBERS_QUERY:
+            for adr_id in args[0]:
+                match = re.match(r"^ADR-(\d+)-(.+)$", adr_id)
+                if match:
+                    scope, number = match.group(2), int(match.group(1))
+                    self.counters[scope] = max(self.counters.get(scope, 0), number)
+
+    async def fetchval(self, query, scope, count):
+        assert query == ALLOCATE_NUMBERS_QUERY
+        self.counters[scope] = self.counters.get(scope, 0) + count
+        return self.counters[scope]
+
+    async def executemany(self, query, rows):
+        assert query == BULK_STAGE_INSERT
+        self.staged = [dict(zip(BULK_UPSERT_COLUMNS, row)) for row in rows]
+
+    async def fetch(self, query):
+        assert query == BULK_UPSERT_QUERY
+        return [
+            {
+                "id": index,
+                "adr_id": row["adr_id"],
+                "inserted": row["adr_id"] not in self.existing,
+                "embedding_queued": self.queued is None or row["adr_id"] in self.queued
+            }
+            for index, row in enumerate(self.staged, start=1)
+        ]
+
+def _adr(component="Platform", **fields):
+    return {
+        "title": "Adopt a shared queue", "status": "accepted",
+        "context": "c" * 50, "decision": "d" * 50, "consequences": "q" * 20,
+        "component": component, **fields
+    }
+
+@pytest.mark.asyncio
+async def test_new_ids_are_allocated_after_supplied_ids_per_component():
+    db = FakeConnection(counters={"PLATFORM": 3})
+    adrs = [
+        _adr(), _adr(adr_id="ADR-0010-PLATFORM"), _adr(component="data lake"), _adr("platform")
+    ]
+
+    await bulk_upsert_adrs(db, adrs)
+
+    assert [adr["adr_id"] for adr in adrs] == [
+        "ADR-0011-PLATFORM", "ADR-0010-PLATFORM", "ADR-0001-DATA-LAKE", "ADR-0012-PLATFORM"
+    ]
+    assert db.statements[0] == RESERVE_NUMBERS_QUERY
+    assert BULK_STAGING_QUERY in db.statements
+
+@pytest.mark.asyncio
+async def test_staged_rows_encode_tags_and_leave_omitted_columns_null():
+    db = FakeConnection()
+
+    await bulk_upsert_adrs(db, [_adr(adr_id="ADR-0001-PLATFORM", tags=["queue"]), _adr(tags=None)])
+
+    first, second = db.staged
+    assert json.loads(first["tags"]) == ["queue"]
+    assert second["tags"] is None
+    assert first["confidence_score"] is None and first["decision_date"] is None
+    assert second["adr_id"] == "ADR-0002-PLATFORM"
+
+@pytest.mark.asyncio
+async def test_endpoint_reports_actions_and_summary():
+    db = FakeConnection(existing={"ADR-0001-PLATFORM"}, queued={"ADR-0002-PLATFORM"})
+    payload = ADRBulkUpsert(adrs=[_adr(adr_id="ADR-0001-PLATFORM"), _adr()])
+
+    response = await upsert_adrs_bulk(payload, db=db)
+
+    assert db.transactions == 1
+    assert [(adr["adr_id"], adr["action"], adr["embedding_queued"]) for adr in response["adrs"]] == [
+        ("ADR-0001-PLATFORM", "updated", False), ("ADR-0002-PLATFORM", "created", True)
+    ]
+    summary = response["summary"]
+    assert (summary["received"], summary["created"], summary["updated"], summary["embedding_queued"]) == (2, 1, 1, 1)
+
+@pytest.mark.asyncio
+async def test_endpoint_rejects_duplicate_adr_ids():
+    db = FakeConnection()
+    payload = ADRBulkUpsert(adrs=[_adr(adr_id="ADR-0001-PLATFORM"), _adr(adr_id="ADR-0001-PLATFORM")])
+
+    with pytest.raises(HTTPException) as error:
+        await upsert_adrs_bulk(payload, db=db)
+
+    assert error.value.status_code == 400
+    assert db.transactions == 0
+
+def test_payload_is_limited_to_max_batch_size():
+    with pytest.raises(ValidationError):
+        ADRBulkUpsert(adrs=[_adr() for _ in range(MAX_BATCH_SIZE + 1)])
@@ -0,0 +1,111 @@
+"""
+📚 ADR import tests
+Markdown ADR parsing and the bulk upsert statements
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from services.adr_import import (
+    BULK_UPSERT_QUERY, IMPORT_UPSERT_QUERY, default_adr_roots, iter_adr_files, parse_adr_markdown
+)
+
+NORWEGIAN_ADR = """# ADR-0007: Bruke pgvector for semantisk søk
+**Dato:** 2025-08-27  •  **Komponent:** platform/search  •  **Eier:** @owner
+
+## Problem
+Vi trenger semantisk søk.
+
+## Alternativer
+1) pgvector
+2) Elasticsearch
+
+## Beslutning
+Valgt: pgvector.
+
+## Konsekvenser
+Lav driftskost.
+
+## Evidens (før/etter)
+Recall 42% → 70%.
+"""
+
+def _write(tmp_path: Path, name: str, text: str) -> str:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_parses_norwegian_adr(tmp_path):
+    path = _write(tmp_path, "ADR-0007-pgvector.md", NORWEGIAN_ADR)
+    row = parse_adr_markdown(path)
+
+    assert row["adr_id"] == "ADR-0007-PLATFORM/SEARCH"
+    assert row["title"] == "Bruke pgvector for semantisk søk"
+    assert row["status"] == "accepted"
+    assert row["component"] == "platform/search"
+    assert row["decision_date"] == datetime(2025, 8, 27)
+    assert row["context"] == "Vi trenger semantisk søk.\n\n1) pgvector\n2) Elasticsearch"
+    assert row["decision"] == "Valgt: pgvector."
+    assert row["consequences"] == "Lav driftskost.\n\nRecall 42% → 70%."
+    assert row["tags"] == []
+    assert row["source_path"] == path
+    assert len(row["source_hash"]) == 64
+
+def test_front_matter_overrides_inline_metadata(tmp_path):
+    text = (
+        "---\nid: ADR-0100-LEGACY\nstatus: Superseded\ntags: [search, 'db']\ncomponent: platform\n---\n"
+        + NORWEGIAN_ADR
+    )
+    row = parse_adr_markdown(_write(tmp_path, "ADR-0007-pgvector.md", text))
+    assert row["adr_id"] == "ADR-0100-LEGACY"
+    assert row["status"] == "superseded"
+    assert row["tags"] == ["search", "db"]
+    assert row["component"] == "platform"
+
+def test_number_falls_back_to_file_name(tmp_path):
+    text = NORWEGIAN_ADR.replace("# ADR-0007: ", "# ", 1).replace("\n", "\r\n")
+    row = parse_adr_markdown(_write(tmp_path, "ADR-0012-search.md", text))
+    assert row["adr_id"] == "ADR-0012-PLATFORM/SEARCH"
+    assert row["title"] == "Bruke pgvector for semantisk søk"
+
+def test_unknown_status_and_date_are_tolerated(tmp_path):
+    text = NORWEGIAN_ADR.replace("**Dato:** 2025-08-27", "**Dato:** snart  •  **Status:** draft")
+    row = parse_adr_markdown(_write(tmp_path, "ADR-0007.md", text))
+    assert row["status"] == "accepted"
+    assert row["decision_date"] is None
+
+@pytest.mark.parametrize("text, message", [
+    ("", "Empty file"),
+    ("  \n", "Empty file"),
+    ("No heading here\n", "heading"),
+    (NORWEGIAN_ADR.replace("**Komponent:** platform/search", ""), "Missing component"),
+    (NORWEGIAN_ADR.replace("## Beslutning\nValgt: pgvector.", "## Beslutning\n"), "Missing decision"),
+])
+def test_invalid_adrs_raise_value_error(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_adr_markdown(_write(tmp_path, "ADR-0007.md", text))
+
+def test_missing_number_raises_value_error(tmp_path):
+    text = NORWEGIAN_ADR.replace("# ADR-0007: ", "# ", 1)
+    with pytest.raises(ValueError, match="Missing ADR number"):
+        parse_adr_markdown(_write(tmp_path, "notes.md", text))
+
+def test_repository_adrs_parse():
+    paths = iter_adr_files(default_adr_roots())
+    assert paths
+    for path in paths:
+        if Path(path).read_bytes().strip():
+            row = parse_adr_markdown(path)
+            assert row["adr_id"].startswith("ADR-") and row["decision"]
+
+def test_upsert_statements_protect_unrelated_rows():
+    # The API path never rewrites provenance; the import path only updates its own file's row
+    assert "source_path = EXCLUDED.source_path" not in BULK_UPSERT_QUERY
+    assert "IS NOT DISTINCT FROM EXCLUDED.source_path" not in BULK_UPSERT_QUERY
+    assert "source_path = EXCLUDED.source_path" in IMPORT_UPSERT_QUERY
+    assert "WHERE adrs.source_path IS NOT DISTINCT FROM EXCLUDED.source_path" in IMPORT_UPSERT_QUERY
+    for query in (BULK_UPSERT_QUERY, IMPORT_UPSERT_QUERY):
+        assert "COALESCE(s.decision_date, adrs.decision_date)" in query
+        assert "COALESCE(decision_date, NOW())" in query
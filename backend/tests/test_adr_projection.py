@@ -0,0 +1,87 @@
+"""
+🧩 ADR projection tests
+fields= resolution, summary projections and projected ETags
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+from api.adrs import ADR_FIELDS, ADR_SUMMARY_FIELDS, _adr_fields, _adr_record, get_adr, list_adrs
+
+CREATED = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+def _adr_row(**overrides):
+    row = {
+        "id": 7, "adr_id": "ADR-0007-PLATFORM", "title": "Use pgvector", "status": "accepted",
+        "context": "c" * 60, "decision": "d" * 60, "consequences": "e" * 30, "component": "platform",
+        "decision_date": CREATED, "created_at": CREATED, "updated_at": CREATED, "confidence_score": 0.9,
+        "complexity_score": 0.4, "actionability_score": 0.8, "tags": '["search"]', "row_version": 12345,
+    }
+    row.update(overrides)
+    return row
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append(" ".join(query.split()))
+        return self.rows
+
+    async def fetchrow(self, query, *args):
+        self.queries.append(" ".join(query.split()))
+        return self.rows[0] if self.rows else None
+
+def _request(headers=None):
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw})
+
+def test_fields_follow_declared_order():
+    assert _adr_fields("title, adr_id", ADR_FIELDS) == ["adr_id", "title"]
+    assert _adr_fields(None, ADR_SUMMARY_FIELDS) == list(ADR_SUMMARY_FIELDS)
+    assert not {"context", "decision", "consequences"} & set(ADR_SUMMARY_FIELDS)
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(HTTPException) as error:
+        _adr_fields("title,secret", ADR_FIELDS)
+    assert error.value.status_code == 400
+    assert "secret" in error.value.detail
+
+def test_record_decodes_tags():
+    assert _adr_record(_adr_row(), ["adr_id", "tags"]) == {"adr_id": "ADR-0007-PLATFORM", "tags": ["search"]}
+    assert _adr_record(_adr_row(tags=None), ["tags"]) == {"tags": []}
+
+@pytest.mark.asyncio
+async def test_list_selects_only_projected_columns_plus_sort_key():
+    db = FakeConnection([_adr_row()])
+    response = await list_adrs(
+        limit=10, cursor=None, skip=0, status=None, component=None, component_match="contains",
+        count="none", fields="title", as_of=None, db=db
+    )
+
+    assert json.loads(response.body) == [{"title": "Use pgvector"}]
+    assert db.queries[0].startswith("SELECT title, created_at, id FROM adrs")
+
+@pytest.mark.asyncio
+async def test_get_projection_has_its_own_etag():
+    full_response, projected_response = Response(), Response()
+    full = await get_adr(_request(), full_response, "ADR-0007-PLATFORM", None, FakeConnection([_adr_row()]))
+    db = FakeConnection([_adr_row()])
+    projected = await get_adr(_request(), projected_response, "ADR-0007-PLATFORM", "status,title", db)
+
+    assert set(full) == set(ADR_FIELDS)
+    assert projected == {"title": "Use pgvector", "status": "accepted"}
+    assert db.queries[0].startswith("SELECT title, status,")
+    assert full_response.headers["ETag"] != projected_response.headers["ETag"]
+
+@pytest.mark.asyncio
+async def test_get_unknown_adr():
+    with pytest.raises(HTTPException) as error:
+        await get_adr(_request(), Response(), "ADR-0404", None, FakeConnection([]))
+    assert error.value.status_code == 404
@@ -0,0 +1,43 @@
+"""
+🗃️ Derived data cache tests
+Generation-invalidated TTL caching
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from services.cache import GenerationCache, data_generations
+
+def test_hit_until_source_table_is_written():
+    cache = GenerationCache(("cache_test_adrs",))
+    cache.set("key", {"value": 1}, cache.generation())
+
+    assert cache.get("key") == {"value": 1}
+    data_generations.bump("cache_test_other")
+    assert cache.get("key") == {"value": 1}
+    data_generations.bump("cache_test_adrs")
+    assert cache.get("key") is None
+    assert "key" not in cache.cache
+
+def test_write_during_computation_leaves_entry_stale():
+    cache = GenerationCache(("cache_test_evidence",))
+    generation = cache.generation()
+    # A write lands after the data was read but before the value is cached
+    data_generations.bump("cache_test_evidence")
+    cache.set("key", "computed from old data", generation)
+
+    assert cache.get("key") is None
+
+def test_entries_expire_after_ttl():
+    cache = GenerationCache(("cache_test_ttl",), ttl_seconds=60)
+    cache.set("key", "value", cache.generation())
+    generation, _, value = cache.cache["key"]
+    cache.cache["key"] = (generation, datetime.now(timezone.utc) - timedelta(seconds=61), value)
+
+    assert cache.get("key") is None
+
+def test_oldest_entry_is_evicted():
+    cache = GenerationCache(("cache_test_evict",), max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key, cache.generation())
+
+    assert sorted(cache.cache) == ["b", "c"]
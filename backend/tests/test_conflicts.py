@@ -0,0 +1,52 @@
+"""
+⚔️ Conflict detection tests
+Blocked similarity search against brute force
+"""
+
+import numpy as np
+
+from services.conflicts import component_blocks, find_similar_pairs
+
+def _normalized(rows):
+    return (rows / np.linalg.norm(rows, axis=1, keepdims=True)).astype(np.float32)
+
+def _brute_force(matrix, blocks, threshold):
+    pairs = set()
+    for start, end in blocks:
+        for a in range(start, end):
+            for b in range(a + 1, end):
+                if float(matrix[a] @ matrix[b]) >= threshold:
+                    pairs.add((a, b))
+    return pairs
+
+def test_component_blocks():
+    assert component_blocks([]) == []
+    assert component_blocks(["api"]) == []
+    assert component_blocks(["api", "api", "db", "ui", "ui", "ui"]) == [(0, 2), (3, 6)]
+
+def test_matches_brute_force_across_tiles():
+    rng = np.random.default_rng(11)
+    base = rng.normal(size=(6, 16))
+    # Noisy copies of a few base vectors, so some pairs clear the threshold
+    matrix = _normalized(base[rng.integers(0, 6, 90)] + rng.normal(scale=0.3, size=(90, 16)))
+    blocks = [(0, 40), (40, 41), (41, 90)]
+
+    a, b, similarity, truncated = find_similar_pairs(matrix, blocks, 0.9, tile_rows=7)
+    found = set(zip(a.tolist(), b.tolist()))
+    assert found == _brute_force(matrix, blocks, 0.9)
+    assert found and not truncated
+    assert all(x < y for x, y in found)
+    np.testing.assert_allclose(similarity, np.einsum("ij,ij->i", matrix[a], matrix[b]), atol=1e-5)
+
+def test_pairs_never_cross_blocks():
+    matrix = _normalized(np.ones((4, 3)))
+    a, b, _, _ = find_similar_pairs(matrix, [(0, 2), (2, 4)], 0.99)
+    assert set(zip(a.tolist(), b.tolist())) == {(0, 1), (2, 3)}
+
+def test_no_blocks_and_truncation():
+    matrix = _normalized(np.ones((10, 3)))
+    a, b, similarity, truncated = find_similar_pairs(matrix, [], 0.5)
+    assert a.size == b.size == similarity.size == 0 and not truncated
+
+    a, _, _, truncated = find_similar_pairs(matrix, [(0, 10)], 0.5, tile_rows=3, max_pairs=5)
+    assert a.size == 5 and truncated
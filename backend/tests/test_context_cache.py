@@ -0,0 +1,86 @@
+"""
+🧠 AI context cache tests
+Query normalization and context reuse until ADRs change
+"""
+
+from datetime import datetime
+
+import pytest
+
+from api import intelligence
+from api.intelligence import ContextRequest, generate_ai_context
+from services.cache import data_generations
+from services.context_cache import ContextCache, normalize_query
+
+ADR = {
+    "adr_id": "ADR-0001-SEARCH", "title": "Use pgvector", "context": "Need semantic search " * 5,
+    "decision": "Adopt pgvector " * 5, "consequences": "Ops cost", "component": "search", "confidence_score": 0.9,
+}
+
+class FakeConnection:
+    """Serves one matching ADR and records context log inserts"""
+
+    def __init__(self):
+        self.adr_queries = 0
+        self.logged = []
+
+    async def fetch(self, query, *args):
+        self.adr_queries += 1
+        return [ADR]
+
+    async def fetchval(self, query, *args):
+        self.logged.append(args)
+        return datetime(2026, 3, 1)
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(intelligence, "context_cache", ContextCache())
+
+def _request(query, **flags):
+    return ContextRequest(ai_system="assistant", context_type="code-generation", query=query, **flags)
+
+def test_normalize_query():
+    assert normalize_query("  How do we do SEMANTIC search?! ") == "how do we do semantic search"
+    assert normalize_query("semantic-search, pgvector") == normalize_query("Semantic search pgvector")
+
+def test_key_includes_flags():
+    assert ContextCache.key("Search?", "code-generation", True, True, False) == (
+        "search", "code-generation", True, True, False
+    )
+    assert ContextCache.key("search", "code-generation", True, True, False) != ContextCache.key(
+        "search", "code-generation", True, True, True
+    )
+
+@pytest.mark.asyncio
+async def test_equivalent_questions_reuse_context():
+    db = FakeConnection()
+    first = await generate_ai_context(_request("How do we do semantic search?"), db)
+    second = await generate_ai_context(_request("how do we do SEMANTIC search"), db)
+
+    assert db.adr_queries == 1
+    assert second["generated_context"] == first["generated_context"]
+    assert second["sources"] == first["sources"]
+    assert second["metadata"]["cached"] and second["metadata"]["source_context_id"] == first["context_id"]
+    assert second["context_id"] != first["context_id"]
+    # The reuse is logged as a reference, not as another copy of the context
+    assert db.logged[0][4] == first["generated_context"] and db.logged[0][7] is None
+    assert db.logged[1][4] is None and db.logged[1][7] == first["context_id"]
+
+@pytest.mark.asyncio
+async def test_different_flags_do_not_share_context():
+    db = FakeConnection()
+    await generate_ai_context(_request("How do we do semantic search?"), db)
+    other = await generate_ai_context(_request("How do we do semantic search?", include_runbooks=True), db)
+
+    assert not other["metadata"]["cached"]
+    assert "Operational Guidelines" in other["generated_context"]
+
+@pytest.mark.asyncio
+async def test_adr_writes_invalidate_context():
+    db = FakeConnection()
+    await generate_ai_context(_request("How do we do semantic search?"), db)
+    data_generations.bump("adrs")
+    again = await generate_ai_context(_request("How do we do semantic search?"), db)
+
+    assert not again["metadata"]["cached"]
+    assert db.adr_queries == 2
@@ -0,0 +1,91 @@
+"""
+🔗 Bulk decision link tests
+Per-link outcomes reported by the bulk link endpoint
+"""
+
+import pytest
+
+from api import decisions
+from api.decisions import BulkLinkCreate, bulk_create_decision_links
+from services.schema import SCHEMA_STATEMENTS, ensure_schema
+
+def _row(position, from_adr, to_adr, outcome, link_id=None):
+    return {
+        "position": position, "from_adr": from_adr, "to_adr": to_adr, "outcome": outcome,
+        "id": link_id, "relationship_type": "depends" if link_id else None,
+        "strength": 0.5 if link_id else None, "description": None, "created_at": None
+    }
+
+class FakeConnection:
+    """Returns BULK_LINK_QUERY rows as the database would classify them"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.args = None
+
+    async def fetch(self, query, *args):
+        self.args = args
+        return self.rows
+
+@pytest.mark.asyncio
+async def test_bulk_link_outcomes(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(decisions.decision_graph, "record_created_links", lambda rows: recorded.append(rows))
+
+    links = [
+        ("ADR-0001", "ADR-0002"), ("ADR-0001", "ADR-0003"), ("ADR-0001", "ADR-0002"),
+        ("ADR-0404", "ADR-0002"), ("ADR-0001", "ADR-0404"), ("ADR-0002", "ADR-0003"),
+    ]
+    db = FakeConnection([
+        _row(1, "ADR-0001", "ADR-0002", "created", "link-1"),
+        _row(2, "ADR-0001", "ADR-0003", "exists"),
+        _row(3, "ADR-0001", "ADR-0002", "duplicate_in_batch"),
+        _row(4, "ADR-0404", "ADR-0002", "from_not_found"),
+        _row(5, "ADR-0001", "ADR-0404", "to_not_found"),
+        # Classified as new, but another request inserted the pair first
+        _row(6, "ADR-0002", "ADR-0003", "created"),
+    ])
+    payload = BulkLinkCreate(links=[
+        {"from_adr": f, "to_adr": t, "relationship_type": "depends", "strength": 0.5} for f, t in links
+    ])
+
+    response = await bulk_create_decision_links(payload, db)
+
+    outcomes = [(result["index"], result["outcome"]) for result in response["results"]]
+    assert outcomes == [
+        (0, "created"), (1, "exists"), (2, "duplicate_in_batch"),
+        (3, "from_not_found"), (4, "to_not_found"), (5, "exists"),
+    ]
+    assert response["summary"] == {
+        "created": 1, "exists": 2, "duplicate_in_batch": 1, "from_not_found": 1, "to_not_found": 1
+    }
+    assert response["results"][0]["link"]["id"] == "link-1"
+    assert all("link" not in result for result in response["results"][1:])
+    assert [[row["id"] for row in rows] for rows in recorded] == [["link-1"]]
+    assert db.args[0] == [f for f, _ in links]
+
+def test_pair_dedupe_runs_before_unique_index():
+    names = [statement["name"] for statement in SCHEMA_STATEMENTS]
+    assert names.index("decision_links.dedupe_pairs") == names.index("uq_decision_links_pair") - 1
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+class SchemaConnection:
+    async def execute(self, query):
+        return "DELETE 3" if "pair_rank" in query else "ALTER TABLE"
+
+@pytest.mark.asyncio
+async def test_ensure_schema_reports_deleted_duplicates(caplog):
+    await ensure_schema(FakePool(SchemaConnection()))
+    assert "decision_links.dedupe_pairs deleted 3 rows" in caplog.text
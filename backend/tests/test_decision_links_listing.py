@@ -0,0 +1,84 @@
+"""
+🔗 Decision link listing tests
+Keyset pages, field projection and the per-endpoint UNION for ADR filters
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from api.decisions import list_decision_links
+from services.pagination import decode_cursor, encode_cursor
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+def _link(link_id):
+    return {
+        "id": link_id, "from_adr": f"ADR-{link_id:04d}", "to_adr": "ADR-0001", "relationship_type": "depends",
+        "strength": 0.5, "description": None, "created_at": START - timedelta(minutes=link_id),
+        "a1_title": "From", "a1_component": "api", "a2_title": "To", "a2_component": "platform",
+    }
+
+class FakeConnection:
+    """Returns newest-first link rows and records the generated query"""
+
+    def __init__(self, count):
+        self.rows = [_link(link_id) for link_id in range(1, count + 1)]
+        self.query = None
+        self.args = None
+
+    async def fetch(self, query, *args):
+        self.query = " ".join(query.split())
+        self.args = args
+        return self.rows[:args[-2] if "UNION" in self.query else args[-1]]
+
+async def _list(db, adr_id=None, relationship_type=None, limit=2, cursor=None, fields=None):
+    response = await list_decision_links(adr_id, relationship_type, limit, cursor, fields, db)
+    return json.loads(response.body)
+
+@pytest.mark.asyncio
+async def test_first_page_and_cursor():
+    db = FakeConnection(5)
+    page = await _list(db)
+
+    assert [link["id"] for link in page["links"]] == [1, 2]
+    assert page["has_more"] is True
+    assert decode_cursor(page["next_cursor"], (datetime, int)) == (START - timedelta(minutes=2), 2)
+    assert db.args == (3,)
+    assert "JOIN adrs a1" in db.query and "JOIN adrs a2" in db.query
+
+    await _list(db, relationship_type="depends", cursor=page["next_cursor"])
+    assert "relationship_type = $1" in db.query and "(created_at, id) < ($2, $3)" in db.query
+    assert db.args == ("depends", START - timedelta(minutes=2), 2, 3)
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor():
+    page = await _list(FakeConnection(2), limit=5)
+    assert (page["total"], page["has_more"], page["next_cursor"]) == (2, False, None)
+
+@pytest.mark.asyncio
+async def test_projection_selects_only_requested_columns():
+    db = FakeConnection(1)
+    page = await _list(db, fields="to_details,strength")
+
+    assert page["links"] == [{"strength": 0.5, "to_details": {"title": "To", "component": "platform"}}]
+    assert "a1" not in db.query
+    assert "description" not in db.query
+
+@pytest.mark.asyncio
+async def test_adr_filter_scans_each_endpoint():
+    db = FakeConnection(3)
+    await _list(db, adr_id="ADR-0001", fields="id")
+
+    assert db.query.count("UNION") == 1
+    assert "WHERE from_adr = $2" in db.query and "WHERE to_adr = $2" in db.query
+    assert db.args == (3, "ADR-0001")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fields, cursor", [("id,bogus", None), (None, "garbage"), (None, encode_cursor("x", 1))])
+async def test_bad_fields_and_cursors_are_client_errors(fields, cursor):
+    with pytest.raises(HTTPException) as error:
+        await _list(FakeConnection(1), cursor=cursor, fields=fields)
+    assert error.value.status_code == 400
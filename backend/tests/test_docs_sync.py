@@ -0,0 +1,124 @@
+"""
+🔄 Docs sync tests
+Path classification, event debouncing and per-file syncing
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from services.docs_sync import DocsSync, adr_importer
+
+def _sync(tmp_path: Path) -> DocsSync:
+    roots = {kind: [str(tmp_path / kind)] for kind in ("adr", "pattern", "runbook")}
+    for kind_roots in roots.values():
+        Path(kind_roots[0]).mkdir()
+    return DocsSync(roots=roots, debounce_seconds=0.05)
+
+def _write(path: Path, text: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_classify(tmp_path):
+    sync = _sync(tmp_path)
+
+    assert sync.classify(str(tmp_path / "adr" / "ADR-0001-use-postgres.md")) == ("adr", str(tmp_path / "adr"))
+    assert sync.classify(str(tmp_path / "pattern" / "api" / "retries.md")) == ("pattern", str(tmp_path / "pattern"))
+    assert sync.classify(str(tmp_path / "adr" / "notes.md")) is None
+    assert sync.classify(str(tmp_path / "runbook" / "TEMPLATE-runbook.md")) is None
+    assert sync.classify(str(tmp_path / "runbook" / "deploy.txt")) is None
+    assert sync.classify(str(tmp_path / "patterns-elsewhere" / "retries.md")) is None
+
+@pytest.mark.asyncio
+async def test_debounce_merges_bursts(tmp_path):
+    sync = _sync(tmp_path)
+
+    async def changes():
+        yield {"a"}
+        await asyncio.sleep(0.01)
+        yield {"b"}
+        await asyncio.sleep(0.2)
+        yield {"c"}
+
+    sync._changes = changes
+    started = []
+
+    async def on_start():
+        started.append(True)
+
+    batches = [batch async for batch in sync._debounced(on_start=on_start)]
+    assert batches == [{"a", "b"}, {"c"}]
+    assert started == [True]
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeConnection:
+    """Returns every upserted document as changed and records statements"""
+
+    def __init__(self, known_paths=()):
+        self.known_paths = list(known_paths)
+        self.upserted = []
+        self.executed = []
+
+    def transaction(self):
+        return FakeTransaction()
+
+    async def fetch(self, query, *args):
+        if "UNION" in query:
+            return [{"source_path": path} for path in self.known_paths]
+        self.upserted.append(args)
+        return [{"source_path": path, "inserted": True} for path in args[0]]
+
+    async def execute(self, query, *args):
+        self.executed.append((" ".join(query.split()), args))
+
+@pytest.fixture
+def imported(monkeypatch):
+    calls = []
+
+    async def import_paths(db, paths, force=False):
+        calls.append(sorted(paths))
+        return {"imported": len(paths)}
+
+    monkeypatch.setattr(adr_importer, "import_paths", import_paths)
+    return calls
+
+@pytest.mark.asyncio
+async def test_sync_paths(tmp_path, imported):
+    sync = _sync(tmp_path)
+    adr = _write(tmp_path / "adr" / "ADR-0001-use-postgres.md", "# ADR-0001: Use Postgres\n")
+    pattern = _write(tmp_path / "pattern" / "api" / "retries.md", "# Pattern: Retry with backoff\n\nBody")
+    removed = str(tmp_path / "runbook" / "gone.md")
+    ignored = _write(tmp_path / "adr" / "notes.md", "not an ADR")
+
+    db = FakeConnection()
+    summary = await sync.sync_paths(db, {adr, pattern, removed, ignored})
+
+    assert (summary["files"], summary["removed"], summary["documents_changed"]) == (3, 1, 1)
+    assert imported == [[adr]]
+    paths, kinds, titles, categories, _, _ = db.upserted[0]
+    assert (paths, kinds, titles, categories) == ([pattern], ["pattern"], ["Retry with backoff"], ["api"])
+    assert [args for _, args in db.executed] == [([removed],), ([removed],)]
+    assert db.executed[1][0].startswith("UPDATE adrs SET source_hash = NULL")
+
+@pytest.mark.asyncio
+async def test_reconcile_covers_files_on_disk_and_deleted_rows(tmp_path, imported):
+    sync = _sync(tmp_path)
+    adr = _write(tmp_path / "adr" / "ADR-0002-cache.md", "# ADR-0002: Cache\n")
+    runbook = _write(tmp_path / "runbook" / "deploy.md", "# Runbook: Deploy\n")
+    deleted = str(tmp_path / "pattern" / "old.md")
+
+    db = FakeConnection(known_paths=[deleted, runbook])
+    summary = await sync.reconcile(db)
+
+    assert (summary["files"], summary["removed"], summary["documents_changed"]) == (3, 1, 1)
+    assert imported == [[adr]]
+    assert db.upserted[0][0] == [runbook]
+    assert db.executed[0][1] == ([deleted],)
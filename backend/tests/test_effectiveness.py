@@ -0,0 +1,100 @@
+"""
+🎯 Effectiveness scoring tests
+The vectorized formula must agree with the per-ADR calculation it replaced
+"""
+
+import numpy as np
+import pytest
+
+from services.effectiveness import compute_effectiveness_scores, effectiveness_recommendation
+
+def _baseline(confidence_score, evidence, links_count):
+    """The original per-ADR effectiveness calculation over raw evidence rows"""
+    evidence_count = len(evidence)
+    avg_confidence = sum(row["confidence_level"] for row in evidence) / evidence_count if evidence_count > 0 else 0
+
+    positive_impacts = total_impacts = 0
+    for row in evidence:
+        if row["value_before"] and row["value_after"]:
+            total_impacts += 1
+            if row["value_after"] > row["value_before"]:
+                positive_impacts += 1
+
+    success_rate = (positive_impacts / total_impacts) * 100 if total_impacts > 0 else 0
+
+    base_score = float(confidence_score or 0.5) * 0.3
+    evidence_score = min(evidence_count / 5.0, 1.0) * 0.2
+    confidence_score = avg_confidence * 0.2
+    success_score = (success_rate / 100) * 0.2
+    influence_score = min(links_count / 3.0, 1.0) * 0.1
+    return base_score + evidence_score + confidence_score + success_score + influence_score
+
+def _inputs(cases):
+    """Aggregate raw evidence the way EFFECTIVENESS_INPUTS_QUERY and the rollups do"""
+    def impacts(rows, positive):
+        return sum(
+            1 for row in rows
+            if row["value_before"] not in (None, 0) and row["value_after"] not in (None, 0)
+            and (not positive or row["value_after"] > row["value_before"])
+        )
+
+    return {
+        "confidence": np.array([float(c or 0) for c, _, _ in cases]),
+        "evidence_count": np.array([len(rows) for _, rows, _ in cases], dtype=np.int64),
+        "avg_confidence": np.array([
+            sum(row["confidence_level"] for row in rows) / len(rows) if rows else 0.0 for _, rows, _ in cases
+        ]),
+        "positive_impacts": np.array([impacts(rows, True) for _, rows, _ in cases], dtype=np.int64),
+        "total_impacts": np.array([impacts(rows, False) for _, rows, _ in cases], dtype=np.int64),
+        "links_count": np.array([links for _, _, links in cases], dtype=np.int64),
+    }
+
+def _evidence(value_before, value_after, confidence_level=0.8):
+    return {"value_before": value_before, "value_after": value_after, "confidence_level": confidence_level}
+
+def test_matches_baseline_on_random_adrs():
+    rng = np.random.default_rng(7)
+    values = [None, 0.0, 1.0, 2.5, 10.0, -3.0]
+    cases = []
+    for _ in range(200):
+        evidence = [
+            _evidence(rng.choice(values), rng.choice(values), round(float(rng.random()), 2))
+            for _ in range(rng.integers(0, 9))
+        ]
+        confidence = rng.choice([None, 0.0, 0.35, 0.9])
+        cases.append((confidence, evidence, int(rng.integers(0, 6))))
+
+    scores = compute_effectiveness_scores(_inputs(cases))["effectiveness_score"]
+    expected = [_baseline(*case) for case in cases]
+    np.testing.assert_allclose(scores, expected, rtol=0, atol=1e-12)
+
+def test_missing_confidence_and_evidence_is_neutral():
+    scores = compute_effectiveness_scores(_inputs([(None, [], 0), (0.0, [], 0)]))
+    np.testing.assert_allclose(scores["effectiveness_score"], [0.15, 0.15])
+    np.testing.assert_allclose(scores["success_rate"], [0.0, 0.0])
+
+def test_zero_and_missing_values_are_not_impacts():
+    evidence = [_evidence(0.0, 5.0), _evidence(None, 5.0), _evidence(2.0, 3.0), _evidence(4.0, 1.0)]
+    scores = compute_effectiveness_scores(_inputs([(0.8, evidence, 0)]))
+    assert scores["success_rate"][0] == pytest.approx(50.0)
+    assert scores["negative_impacts"][0] == 1
+
+def test_evidence_and_links_saturate():
+    evidence = [_evidence(1.0, 2.0, 1.0)] * 12
+    scores = compute_effectiveness_scores(_inputs([(1.0, evidence, 40)]))
+    assert scores["evidence_completeness"][0] == pytest.approx(0.2)
+    assert scores["influence_score"][0] == pytest.approx(0.1)
+    assert scores["effectiveness_score"][0] == pytest.approx(1.0)
+
+def test_empty_input():
+    scores = compute_effectiveness_scores(_inputs([]))
+    assert scores["effectiveness_score"].shape == (0,)
+
+@pytest.mark.parametrize("score, recommendation", [
+    (0.71, "High effectiveness"),
+    (0.7, "Moderate effectiveness"),
+    (0.41, "Moderate effectiveness"),
+    (0.4, "Low effectiveness - consider review"),
+])
+def test_recommendation_thresholds(score, recommendation):
+    assert effectiveness_recommendation(score) == recommendation
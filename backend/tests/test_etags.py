@@ -0,0 +1,29 @@
+"""
+🏷️ Entity tag tests
+ETag construction and If-None-Match / If-Match parsing
+"""
+
+from services.etags import etag_matches_none_match, if_match_versions, make_etag
+
+def test_make_etag():
+    assert make_etag(255) == '"ff"'
+    projected = make_etag(255, ["id", "title"])
+    assert projected.startswith('"ff-') and projected.endswith('"')
+    assert projected != make_etag(255, ["id", "status"])
+    assert projected == make_etag(255, ["id", "title"])
+
+def test_if_none_match():
+    etag = make_etag(4096)
+    assert etag_matches_none_match(etag, etag)
+    assert etag_matches_none_match(f'"other", W/{etag}', etag)
+    assert etag_matches_none_match("*", etag)
+    assert not etag_matches_none_match('"1001"', etag)
+    assert not etag_matches_none_match(None, etag)
+    assert not etag_matches_none_match("", etag)
+
+def test_if_match_versions():
+    assert if_match_versions(None) is None
+    assert if_match_versions('"a", *') is None
+    assert if_match_versions(f'{make_etag(10)}, {make_etag(11, ["id"])}') == [10, 11]
+    # Weak and malformed tags never match
+    assert if_match_versions('W/"a", a, "", "zz", "') == []
@@ -0,0 +1,104 @@
+"""
+📤 Dataset export tests
+Chunked CSV/Parquet streaming from a server-side cursor
+"""
+
+import csv
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from services import export
+from services.export import iter_record_chunks, parquet_available, stream_csv, stream_parquet
+
+COLUMNS = [("adr_id", "text"), ("score", "float"), ("links", "int"), ("created_at", "timestamp")]
+
+class FakeRecord(dict):
+    """Mapping access plus positional access, like asyncpg.Record"""
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+class FakeTransaction:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        self.db.transactions += 1
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeConnection:
+    """Serves records through cursor() and records the prefetch size"""
+
+    def __init__(self, count):
+        self.records = [
+            FakeRecord(
+                adr_id=f"ADR-{i:04d}", score=i / 10 if i % 3 else None, links=i,
+                created_at=datetime(2026, 1, 1, i % 24, tzinfo=timezone.utc)
+            )
+            for i in range(count)
+        ]
+        self.transactions = 0
+        self.prefetch = None
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    async def cursor(self, query, *args, prefetch):
+        self.prefetch = prefetch
+        for record in self.records:
+            yield record
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+@pytest.fixture
+def chunks_of_four(monkeypatch):
+    def chunked(db, query, *args):
+        return iter_record_chunks(db, query, *args, chunk_size=4)
+
+    monkeypatch.setattr(export, "iter_record_chunks", chunked)
+
+@pytest.mark.asyncio
+async def test_record_chunks_never_exceed_chunk_size():
+    db = FakeConnection(7)
+    chunks = await _collect(iter_record_chunks(db, "SELECT", chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert (db.transactions, db.prefetch) == (1, 3)
+
+@pytest.mark.asyncio
+async def test_csv_stream(chunks_of_four):
+    db = FakeConnection(10)
+    chunks = await _collect(stream_csv(db, COLUMNS, "SELECT"))
+
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == ["adr_id", "score", "links", "created_at"]
+    assert rows[1] == ["ADR-0000", "", "0", "2026-01-01T00:00:00+00:00"]
+    assert rows[2][:3] == ["ADR-0001", "0.1", "1"]
+    assert len(rows) == 11
+
+@pytest.mark.asyncio
+async def test_csv_stream_without_rows_has_header():
+    chunks = await _collect(stream_csv(FakeConnection(0), COLUMNS, "SELECT"))
+    assert b"".join(chunks) == b"adr_id,score,links,created_at\r\n"
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not parquet_available(), reason="pyarrow not installed")
+async def test_parquet_stream_writes_one_row_group_per_chunk(chunks_of_four):
+    import pyarrow.parquet as pq
+
+    chunks = await _collect(stream_parquet(FakeConnection(10), COLUMNS, "SELECT"))
+    parquet = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column_names == ["adr_id", "score", "links", "created_at"]
+    assert table.column("links").to_pylist() == list(range(10))
+    assert table.column("score").to_pylist()[:2] == [None, 0.1]
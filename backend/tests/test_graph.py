@@ -0,0 +1,100 @@
+"""
+🕸️ Decision graph tests
+CSR loading, incremental links, k-hop traversal and connected components
+"""
+
+import pytest
+
+from services.graph import DecisionGraph
+
+class FakeConnection:
+    """Returns the given decision_links rows for every fetch"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, query, *args):
+        return self.rows
+
+def _link(link_id, from_adr, to_adr, relationship_type="depends", strength=0.5):
+    return {
+        "id": link_id, "from_adr": from_adr, "to_adr": to_adr,
+        "relationship_type": relationship_type, "strength": strength
+    }
+
+async def _graph(rows, **kwargs):
+    graph = DecisionGraph(**kwargs)
+    await graph.load(FakeConnection(rows))
+    return graph
+
+# A -> B -> C -> D chain, E <- F, and an isolated self-link on G
+LINKS = [
+    _link(1, "A", "B"), _link(2, "B", "C", "extends"), _link(3, "C", "D"),
+    _link(4, "F", "E", "supersedes", 0.9), _link(5, "G", "G"),
+]
+
+@pytest.mark.asyncio
+async def test_empty_graph():
+    graph = await _graph([])
+    assert graph.k_hop("A", 3) == {}
+    assert graph.neighbors("A") == []
+    assert graph.component_of("A") == []
+    assert graph.shortest_path("A", "B") is None
+    summary = graph.components_summary()
+    assert summary["total_nodes"] == 0 and summary["component_count"] == 0
+
+@pytest.mark.asyncio
+async def test_k_hop_distances_and_direction():
+    graph = await _graph(LINKS)
+    assert graph.k_hop("A", 2, "out") == {"B": 1, "C": 2}
+    assert graph.k_hop("D", 3, "in") == {"C": 1, "B": 2, "A": 3}
+    assert graph.k_hop("B", 1, "both") == {"A": 1, "C": 1}
+    assert graph.k_hop("A", 5, "in") == {}
+
+@pytest.mark.asyncio
+async def test_neighbors_carry_edge_attributes():
+    graph = await _graph(LINKS)
+    neighbors = graph.neighbors("B")
+    assert {(n["adr_id"], n["direction"], n["relationship_type"], n["link_id"]) for n in neighbors} == {
+        ("A", "in", "depends", 1), ("C", "out", "extends", 2)
+    }
+    assert [n["adr_id"] for n in graph.neighbors("B", relationship_type="extends")] == ["C"]
+
+@pytest.mark.asyncio
+async def test_shortest_path():
+    graph = await _graph(LINKS)
+    assert graph.shortest_path("A", "D") == ["A", "B", "C", "D"]
+    assert graph.shortest_path("D", "A", direction="out") is None
+    assert graph.shortest_path("A", "E") is None
+    assert graph.shortest_path("A", "A") == ["A"]
+
+@pytest.mark.asyncio
+async def test_components():
+    graph = await _graph(LINKS)
+    assert sorted(graph.component_of("C")) == ["A", "B", "C", "D"]
+    assert sorted(graph.component_of("E")) == ["E", "F"]
+    assert graph.component_of("G") == ["G"]
+
+    summary = graph.components_summary()
+    assert summary["component_count"] == 2
+    assert [component["size"] for component in summary["largest_components"]] == [4, 2]
+
+@pytest.mark.asyncio
+async def test_dangling_links_become_nodes():
+    # Links may reference ADR ids that no longer exist; they are still traversable
+    graph = await _graph([_link(1, "A", "ADR-9999-GONE"), _link(2, "ADR-9999-GONE", "B", "unknown")])
+    assert graph.k_hop("A", 2, "out") == {"ADR-9999-GONE": 1, "B": 2}
+    assert graph.neighbors("B")[0]["relationship_type"] is None
+
+@pytest.mark.asyncio
+async def test_recorded_links_are_visible_before_and_after_rebuild():
+    graph = await _graph(LINKS, rebuild_threshold=2)
+    graph.record_created_link(_link(6, "D", "H"))
+    assert len(graph.p_src) == 1
+    assert graph.k_hop("A", 4, "out") == {"B": 1, "C": 2, "D": 3, "H": 4}
+    assert "H" in graph.component_of("A")
+
+    graph.record_created_link(_link(7, "H", "E"))
+    assert len(graph.p_src) == 0
+    assert graph.shortest_path("A", "F") == ["A", "B", "C", "D", "H", "E", "F"]
+    assert graph.components_summary()["component_count"] == 1
@@ -0,0 +1,114 @@
+"""
+🗺️ Graph export tests
+JSON Graph, GraphML and edge list output across cursor chunks
+"""
+
+import gzip
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+import pytest
+
+from services import graph_export
+from services.export import iter_record_chunks
+from services.graph_export import GRAPH_FILTERED_EDGES_QUERY, GRAPH_NODES_QUERY, gzip_stream, stream_graph
+
+GRAPHML_NS = "{http://graphml.graphdrawing.org/xmlns}"
+
+NODES = [
+    {"adr_id": f"ADR-000{i}", "title": title, "component": "platform", "status": "accepted",
+     "created_at": datetime(2026, 1, i, tzinfo=timezone.utc)}
+    for i, title in enumerate(["Use <Postgres> & pgvector", "Cache \"hot\" reads", "Retry", "Queue"], start=1)
+]
+EDGES = [
+    {"from_adr": "ADR-0002", "to_adr": "ADR-0001", "relationship_type": "depends", "strength": 0.8},
+    {"from_adr": "ADR-0003", "to_adr": "ADR-0002", "relationship_type": "supersedes", "strength": None},
+    {"from_adr": "ADR-0004", "to_adr": "ADR-0001", "relationship_type": "influences", "strength": 0.25},
+]
+
+class FakeTransaction:
+    def __init__(self, db, options):
+        self.db = db
+        db.transactions.append(options)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeConnection:
+    def __init__(self):
+        self.transactions = []
+        self.queries = []
+
+    def transaction(self, **options):
+        return FakeTransaction(self, options)
+
+    async def cursor(self, query, *args, prefetch):
+        self.queries.append((query, args))
+        for row in NODES if query == GRAPH_NODES_QUERY else EDGES:
+            yield row
+
+@pytest.fixture(autouse=True)
+def chunks_of_two(monkeypatch):
+    def chunked(db, query, *args):
+        return iter_record_chunks(db, query, *args, chunk_size=2)
+
+    monkeypatch.setattr(graph_export, "iter_record_chunks", chunked)
+
+async def _export(db, export_format, **filters):
+    return b"".join([chunk async for chunk in stream_graph(db, export_format, **filters)])
+
+@pytest.mark.asyncio
+async def test_json_graph():
+    db = FakeConnection()
+    graph = json.loads(await _export(db, "json"))["graph"]
+
+    assert graph["directed"] is True
+    assert list(graph["nodes"]) == ["ADR-0001", "ADR-0002", "ADR-0003", "ADR-0004"]
+    assert graph["nodes"]["ADR-0001"]["label"] == "Use <Postgres> & pgvector"
+    assert graph["nodes"]["ADR-0001"]["metadata"]["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert [(e["source"], e["target"], e["relation"]) for e in graph["edges"]] == [
+        ("ADR-0002", "ADR-0001", "depends"), ("ADR-0003", "ADR-0002", "supersedes"), ("ADR-0004", "ADR-0001", "influences")
+    ]
+    assert db.transactions[0] == {"isolation": "repeatable_read", "readonly": True}
+
+@pytest.mark.asyncio
+async def test_graphml_escapes_text():
+    root = ET.fromstring(await _export(FakeConnection(), "graphml"))
+    graph = root.find(f"{GRAPHML_NS}graph")
+    nodes = graph.findall(f"{GRAPHML_NS}node")
+    edges = graph.findall(f"{GRAPHML_NS}edge")
+
+    assert len(nodes) == 4 and len(edges) == 3
+    assert nodes[1].find(f"{GRAPHML_NS}data[@key='title']").text == 'Cache "hot" reads'
+    assert nodes[0].find(f"{GRAPHML_NS}data[@key='title']").text == "Use <Postgres> & pgvector"
+    # Missing strength is omitted rather than written as "None"
+    assert edges[1].find(f"{GRAPHML_NS}data[@key='strength']") is None
+
+@pytest.mark.asyncio
+async def test_edgelist_skips_nodes():
+    db = FakeConnection()
+    lines = (await _export(db, "edgelist")).decode("utf-8").splitlines()
+
+    assert lines == [
+        "from_adr\tto_adr\trelationship_type\tstrength",
+        "ADR-0002\tADR-0001\tdepends\t0.8",
+        "ADR-0003\tADR-0002\tsupersedes\t",
+        "ADR-0004\tADR-0001\tinfluences\t0.25",
+    ]
+    assert all(query != GRAPH_NODES_QUERY for query, _ in db.queries)
+
+@pytest.mark.asyncio
+async def test_filters_restrict_edges_to_exported_nodes():
+    db = FakeConnection()
+    await _export(db, "json", component="platform")
+    assert db.queries == [(GRAPH_NODES_QUERY, ("platform", None)), (GRAPH_FILTERED_EDGES_QUERY, ("platform", None))]
+
+@pytest.mark.asyncio
+async def test_gzip_stream_round_trip():
+    db = FakeConnection()
+    compressed = b"".join([chunk async for chunk in gzip_stream(stream_graph(db, "graphml"))])
+    assert gzip.decompress(compressed) == await _export(FakeConnection(), "graphml")
@@ -0,0 +1,106 @@
+"""
+🌐 Influence ranking tests
+Weighted PageRank against a dense reference and the incremental refresh
+"""
+
+import numpy as np
+import pytest
+
+from services import influence
+from services.cache import data_generations
+from services.graph import DecisionGraph
+from services.influence import InfluenceRanker, weighted_pagerank
+
+def _dense_pagerank(src, dst, weight, node_count, damping=0.85, iterations=500):
+    """Reference implementation on a dense column-stochastic matrix"""
+    matrix = np.zeros((node_count, node_count))
+    for s, d, w in zip(src, dst, weight):
+        matrix[d, s] += w
+    out_weight = matrix.sum(axis=0)
+    for node in range(node_count):
+        if out_weight[node] > 0:
+            matrix[:, node] /= out_weight[node]
+        else:
+            matrix[:, node] = 1.0 / node_count
+    ranks = np.full(node_count, 1.0 / node_count)
+    for _ in range(iterations):
+        ranks = damping * matrix @ ranks + (1 - damping) / node_count
+    return ranks
+
+def _edges(edges):
+    src, dst, weight = zip(*edges)
+    return np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64), np.array(weight, dtype=np.float32)
+
+def test_empty_graph():
+    empty = np.empty(0, dtype=np.int64)
+    ranks, iterations = weighted_pagerank(empty, empty, np.empty(0), 0)
+    assert ranks.size == 0 and iterations == 0
+
+def test_matches_dense_reference_with_dangling_nodes():
+    # Node 3 has no outgoing links and node 4 no links at all
+    src, dst, weight = _edges([(0, 1, 1.0), (1, 2, 0.5), (2, 0, 0.8), (0, 3, 0.2), (2, 3, 1.0)])
+    ranks, _ = weighted_pagerank(src, dst, weight, 5)
+    np.testing.assert_allclose(ranks, _dense_pagerank(src, dst, weight, 5), atol=1e-8)
+    assert ranks.sum() == pytest.approx(1.0)
+    assert ranks.argmin() == 4
+
+def test_zero_weight_edges_count_as_dangling():
+    src, dst, weight = _edges([(0, 1, 0.0), (1, 0, 1.0)])
+    ranks, _ = weighted_pagerank(src, dst, weight, 2)
+    np.testing.assert_allclose(ranks, _dense_pagerank(src, dst, weight, 2), atol=1e-8)
+
+def test_warm_start_converges_faster():
+    rng = np.random.default_rng(3)
+    src, dst = rng.integers(0, 200, 1000), rng.integers(0, 200, 1000)
+    weight = rng.random(1000)
+    cold, cold_iterations = weighted_pagerank(src, dst, weight, 200)
+    warm, warm_iterations = weighted_pagerank(src, dst, weight, 200, initial=cold)
+    np.testing.assert_allclose(warm, cold, atol=1e-9)
+    assert warm_iterations < cold_iterations
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeConnection:
+    """Serves decision_links rows and records executed statements"""
+
+    def __init__(self, links):
+        self.links = links
+        self.executed = []
+
+    async def fetch(self, query, *args):
+        return self.links
+
+    async def execute(self, query, *args):
+        self.executed.append((" ".join(query.split()), args))
+        return "UPDATE 0"
+
+    def transaction(self):
+        return FakeTransaction()
+
+def _link(link_id, from_adr, to_adr):
+    return {"id": link_id, "from_adr": from_adr, "to_adr": to_adr, "relationship_type": "depends", "strength": 1.0}
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_clears_scores_outside_the_graph(monkeypatch):
+    graph = DecisionGraph()
+    monkeypatch.setattr(influence, "decision_graph", graph)
+    ranker = InfluenceRanker()
+
+    db = FakeConnection([_link(1, "A", "B"), _link(2, "B", "C")])
+    first = await ranker.refresh(db)
+    assert first["mode"] == "full" and first["updated"] == 3
+
+    # C's only link is gone; an incremental refresh must reset its stored score
+    db = FakeConnection([_link(1, "A", "B")])
+    data_generations.bump("links")
+    second = await ranker.refresh(db)
+    assert second["mode"] == "incremental"
+    clear, args = db.executed[0]
+    assert clear.startswith("UPDATE adrs SET influence_score = NULL")
+    assert args == (["A", "B"],)
+    assert set(ranker.ranks) == {"A", "B"}
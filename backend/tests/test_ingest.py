@@ -0,0 +1,90 @@
+"""
+📥 Bulk ingestion tests
+Streaming NDJSON/CSV parsing and batched evidence loading
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.ingest import EvidenceIngestor, iter_csv_records, iter_ndjson_records
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def _collect(records):
+    return [record async for record in records]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+async def test_ndjson_records(chunk_size):
+    data = '{"adr_id": "ADR-0001", "note": "æøå"}\n\n{broken\r\n{"adr_id": "ADR-0002"}'.encode("utf-8")
+    records = await _collect(iter_ndjson_records(_chunks(data, chunk_size)))
+
+    assert [line for line, _ in records] == [1, 3, 4]
+    assert records[0][1] == {"adr_id": "ADR-0001", "note": "æøå"}
+    assert isinstance(records[1][1], ValueError)
+    assert records[2][1] == {"adr_id": "ADR-0002"}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+async def test_csv_with_bom_and_quoted_newlines(chunk_size):
+    data = (
+        '\ufeffadr_id,description,value_before\r\n'
+        'ADR-0001,"first line\nsecond, with comma",1.5\r\n'
+        'ADR-0002,,\r\n'
+        'ADR-0003,"say ""hi""",2\n'
+        'ADR-0004,too,many,columns\n'
+    ).encode("utf-8")
+    records = await _collect(iter_csv_records(_chunks(data, chunk_size)))
+
+    assert [line for line, _ in records] == [3, 4, 5, 6]
+    assert records[0][1] == {"adr_id": "ADR-0001", "description": "first line\nsecond, with comma", "value_before": "1.5"}
+    assert records[1][1] == {"adr_id": "ADR-0002", "description": None, "value_before": None}
+    assert records[2][1]["description"] == 'say "hi"'
+    assert isinstance(records[3][1], ValueError)
+
+class FakeConnection:
+    """Knows a fixed set of ADR ids and records COPY calls and rollup markers"""
+
+    def __init__(self, adr_ids):
+        self.adr_ids = adr_ids
+        self.copied = []
+        self.marked = []
+
+    async def execute(self, query, ids):
+        self.marked.append(sorted(ids))
+
+    async def fetch(self, query, ids):
+        return [{"adr_id": adr_id} for adr_id in ids if adr_id in self.adr_ids]
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.append((table, list(records)))
+
+def _validate(payload):
+    if "evidence_type" not in payload:
+        raise ValueError("evidence_type: Field required")
+    return SimpleNamespace(
+        adr_id=payload["adr_id"], evidence_type=payload["evidence_type"], description=None,
+        value_before=None, value_after=None, metric_unit=None, collection_date=None, confidence_level=0.8
+    )
+
+@pytest.mark.asyncio
+async def test_ingest_batches_and_reports_rejections():
+    async def records():
+        yield 1, {"adr_id": "ADR-0001", "evidence_type": "metric"}
+        yield 2, ValueError("Invalid JSON")
+        yield 3, {"adr_id": "ADR-0001"}
+        yield 4, {"adr_id": "ADR-0404", "evidence_type": "metric"}
+        yield 5, {"adr_id": "ADR-0002", "evidence_type": "survey"}
+
+    db = FakeConnection({"ADR-0001", "ADR-0002"})
+    result = await EvidenceIngestor(_validate, batch_rows=2).ingest(db, records())
+
+    assert (result["received"], result["inserted"], result["rejected"]) == (5, 2, 3)
+    assert [error["line"] for error in result["errors"]] == [2, 3, 4]
+    assert result["errors"][2]["error"] == "ADR ADR-0404 not found"
+    assert [len(rows) for _, rows in db.copied] == [1, 1]
+    assert db.marked == [["ADR-0001"], ["ADR-0002"]]
+    assert not result["errors_truncated"]
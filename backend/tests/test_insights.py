@@ -0,0 +1,70 @@
+"""
+🔍 Insights engine tests
+Single-query signal collection and per-filter memoization
+"""
+
+import pytest
+
+from services.cache import data_generations
+from services.insights import INSIGHT_TYPES, InsightsEngine, build_insights, build_signals_query
+
+SIGNALS = {
+    "low_confidence": 4, "recent_count": 9, "previous_count": 2, "decisions_without_evidence": 3,
+    "top_component": "platform/search", "top_component_count": 5, "top_component_confidence": 0.7,
+}
+
+class FakeConnection:
+    def __init__(self, row):
+        self.row = row
+        self.queries = []
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args))
+        return self.row
+
+def test_signals_query_only_collects_requested_signals():
+    trend = build_signals_query(["trend"])
+    assert "recent_count" in trend and "low_confidence" not in trend
+    assert "top_component" not in trend and "$1" not in trend
+
+    pattern = build_signals_query(["pattern"])
+    assert "COUNT(*) AS total" in pattern and "LEFT JOIN top_component" in pattern
+
+    everything = build_signals_query(list(INSIGHT_TYPES))
+    assert everything.count("WITH") == 1
+    assert all(column in everything for column in ("low_confidence", "previous_count", "decisions_without_evidence"))
+
+def test_build_insights():
+    insights = build_insights(SIGNALS, list(INSIGHT_TYPES), window_days=14)
+
+    assert [i["insight_type"] for i in insights] == ["pattern", "anomaly", "trend", "recommendation"]
+    assert insights[0]["impact_level"] == "medium"
+    assert insights[1]["impact_level"] == "high"
+    assert "last 14 days" in insights[1]["description"]
+
+def test_build_insights_skips_quiet_signals():
+    quiet = {**SIGNALS, "low_confidence": 0, "recent_count": 3, "top_component": None}
+    assert [i["insight_type"] for i in build_insights(quiet, list(INSIGHT_TYPES))] == ["recommendation"]
+
+@pytest.mark.asyncio
+async def test_insights_are_cached_per_filter_until_written():
+    engine = InsightsEngine()
+    db = FakeConnection(SIGNALS)
+
+    first = await engine.get_insights(db, 30, "anomaly")
+    second = await engine.get_insights(db, 30, "anomaly")
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["insights"] == first["insights"]
+    assert db.queries[0][1] == (30,)
+
+    await engine.get_insights(db, 30, "trend")
+    assert db.queries[1][1] == ()
+
+    data_generations.bump("evidence")
+    assert (await engine.get_insights(db, 30, "anomaly"))["cached"] is False
+    assert len(db.queries) == 3
+
+@pytest.mark.asyncio
+async def test_impact_filter():
+    result = await InsightsEngine().get_insights(FakeConnection(SIGNALS), impact_level="high")
+    assert [i["insight_type"] for i in result["insights"]] == ["anomaly"]
@@ -0,0 +1,65 @@
+"""
+🔢 ADR numbering tests
+Per-component counters, block allocation and reservation of explicit ids
+"""
+
+import re
+
+import pytest
+
+from services.numbering import (
+    ALLOCATE_NUMBERS_QUERY, RESERVE_NUMBERS_QUERY, adr_id_scope, allocate_adr_id, allocate_adr_numbers,
+    format_adr_id, reserve_adr_ids
+)
+
+ADR_ID_RE = re.compile(r"^ADR-(\d+)-(.+)$")
+
+class CounterConnection:
+    """adr_number_counters in memory, following the two upsert statements"""
+
+    def __init__(self, counters=None):
+        self.counters = dict(counters or {})
+
+    async def fetchval(self, query, scope, count):
+        assert query is ALLOCATE_NUMBERS_QUERY
+        self.counters[scope] = self.counters.get(scope, 0) + count
+        return self.counters[scope]
+
+    async def execute(self, query, adr_ids):
+        assert query is RESERVE_NUMBERS_QUERY
+        for adr_id in adr_ids:
+            match = ADR_ID_RE.match(adr_id)
+            if match:
+                scope, number = match.group(2), int(match.group(1))
+                self.counters[scope] = max(self.counters.get(scope, 0), number)
+
+def test_scope_and_format():
+    assert adr_id_scope("Platform Search") == "PLATFORM-SEARCH"
+    assert format_adr_id(7, "platform search") == "ADR-0007-PLATFORM-SEARCH"
+    assert format_adr_id(12345, "api") == "ADR-12345-API"
+
+@pytest.mark.asyncio
+async def test_components_count_independently():
+    db = CounterConnection()
+    assert await allocate_adr_id(db, "api") == "ADR-0001-API"
+    assert await allocate_adr_id(db, "API") == "ADR-0002-API"
+    assert await allocate_adr_id(db, "platform") == "ADR-0001-PLATFORM"
+
+@pytest.mark.asyncio
+async def test_block_allocation_is_consecutive():
+    db = CounterConnection({"API": 4})
+    assert await allocate_adr_numbers(db, "api", 3) == [5, 6, 7]
+    assert await allocate_adr_numbers(db, "api") == [8]
+
+@pytest.mark.asyncio
+async def test_reserved_ids_are_never_allocated_again():
+    db = CounterConnection({"API": 2})
+    await reserve_adr_ids(db, ["ADR-0010-API", "ADR-0003-API", "legacy-id", "ADR-0001-PLATFORM"])
+
+    assert await allocate_adr_id(db, "api") == "ADR-0011-API"
+    assert await allocate_adr_id(db, "platform") == "ADR-0002-PLATFORM"
+
+def test_reserve_query_matches_formatted_ids():
+    # The SQL patterns must agree with format_adr_id
+    pattern = re.search(r"'(\^ADR-\\d\+-\.\+\$)'", RESERVE_NUMBERS_QUERY).group(1)
+    assert re.match(pattern, format_adr_id(42, "platform search"))
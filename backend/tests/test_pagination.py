@@ -0,0 +1,52 @@
+"""
+📑 Pagination tests
+Keyset cursor round trips, malformed cursors and field projection
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from services.pagination import decode_cursor, encode_cursor, parse_fields
+
+KEYSET = (datetime, int)
+
+def _token(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+def test_round_trip():
+    created_at = datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    token = encode_cursor(created_at, 42)
+    assert "=" not in token
+    assert decode_cursor(token, KEYSET) == (created_at, 42)
+
+def test_float_positions_accept_integers():
+    assert decode_cursor(encode_cursor(3, "ADR-0001"), (float, str)) == (3.0, "ADR-0001")
+
+@pytest.mark.parametrize("token", [
+    "",
+    "not base64!",
+    _token("string"),
+    _token({"t": "2024-01-01"}),
+    _token([{"t": "2024-01-01T00:00:00"}]),
+    _token([{"t": "2024-01-01T00:00:00"}, 1, 2]),
+    _token([{"t": "yesterday"}, 1]),
+    _token([{"t": 20240101}, 1]),
+    _token(["2024-01-01T00:00:00", 1]),
+    _token([{"t": "2024-01-01T00:00:00"}, "1"]),
+    _token([{"t": "2024-01-01T00:00:00"}, 1.5]),
+    _token([{"t": "2024-01-01T00:00:00"}, True]),
+    _token([{"t": "2024-01-01T00:00:00"}, None]),
+])
+def test_malformed_cursors_raise_value_error(token):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        decode_cursor(token, KEYSET)
+
+def test_parse_fields():
+    allowed = ("id", "adr_id", "title", "status")
+    assert parse_fields(None, allowed, ("id",)) == ["id"]
+    assert parse_fields(" status, id ,,", allowed, ("id",)) == ["id", "status"]
+    with pytest.raises(ValueError, match="Unknown fields: bogus"):
+        parse_fields("id,bogus", allowed, ("id",))
@@ -0,0 +1,113 @@
+"""
+⏱️ Evidence rollup tests
+Pending-marker refreshes and the generated rollup SQL
+"""
+
+import pytest
+
+from services.cache import data_generations
+from services.export import EXPORT_DATASETS
+from services.rollups import (
+    ADR_EVIDENCE_STATS_QUERY, ROLLUP_COLUMNS, ROLLUP_GRANULARITIES, REFRESH_ROLLUPS_QUERY, EvidenceRollups
+)
+
+class FakeTransaction:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        self.db.in_transaction = True
+
+    async def __aexit__(self, *exc):
+        self.db.in_transaction = False
+
+class FakeConnection:
+    """Serves rollup state and pending markers, records every statement"""
+
+    def __init__(self, built=True, pending=()):
+        self.built = built
+        self.pending = list(pending)
+        self.in_transaction = False
+        self.statements = []
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    async def execute(self, query, *args):
+        assert self.in_transaction or query.lstrip().startswith("INSERT INTO evidence_rollup_pending")
+        self.statements.append((" ".join(query.split()), args))
+        return "OK"
+
+    async def fetchval(self, query, *args):
+        return "2026-01-01" if self.built else None
+
+    async def fetch(self, query, *args):
+        assert query.startswith("DELETE FROM evidence_rollup_pending")
+        pending, self.pending = self.pending, []
+        return [{"adr_id": adr_id} for adr_id in pending]
+
+    def recomputes(self):
+        return [(query, args) for query, args in self.statements if query.startswith("WITH touched")]
+
+@pytest.mark.asyncio
+async def test_first_refresh_builds_everything():
+    db = FakeConnection(built=False, pending=["ADR-0001"])
+    result = await EvidenceRollups().refresh(db)
+
+    assert result["mode"] == "full"
+    assert db.statements[0] == ("SELECT pg_advisory_xact_lock(hashtext($1))", ("decision_evidence_rollups",))
+    assert ("DELETE FROM decision_evidence_rollups", ()) in db.statements
+    assert [args for _, args in db.recomputes()] == [(), ()]
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_recomputes_pending_adrs_only():
+    db = FakeConnection(pending=["ADR-0001", "ADR-0007"])
+    result = await EvidenceRollups().refresh(db)
+
+    assert (result["mode"], result["pending_adrs"]) == ("incremental", 2)
+    assert (
+        "DELETE FROM decision_evidence_rollups WHERE adr_id = ANY($1::text[])", (["ADR-0001", "ADR-0007"],)
+    ) in db.statements
+    recomputes = db.recomputes()
+    assert len(recomputes) == len(ROLLUP_GRANULARITIES)
+    assert all("WHERE adr_id = ANY($1::text[])" in query for query, _ in recomputes)
+    assert all(args == (["ADR-0001", "ADR-0007"],) for _, args in recomputes)
+
+@pytest.mark.asyncio
+async def test_refresh_without_pending_adrs_skips_recompute():
+    db = FakeConnection()
+    rollups = EvidenceRollups()
+    await rollups.refresh(db)
+
+    assert db.recomputes() == []
+    assert db.statements[-1][0].startswith("INSERT INTO evidence_rollup_state")
+    assert rollups.is_current()
+    data_generations.bump("evidence")
+    assert not rollups.is_current()
+
+@pytest.mark.asyncio
+async def test_mark_pending():
+    db = FakeConnection()
+    await EvidenceRollups().mark_pending(db, [])
+    await EvidenceRollups().mark_pending(db, ("ADR-0003",))
+
+    assert len(db.statements) == 1
+    query, args = db.statements[0]
+    assert "ON CONFLICT (adr_id) DO UPDATE" in query
+    assert args == (["ADR-0003"],)
+
+@pytest.mark.parametrize("unit", ROLLUP_GRANULARITIES)
+def test_refresh_query_buckets_missing_collection_dates_by_created_at(unit):
+    query = " ".join(REFRESH_ROLLUPS_QUERY.format(unit=unit, where="", columns=ROLLUP_COLUMNS).split())
+
+    assert "{" not in query and "}" not in query
+    assert f"date_trunc('{unit}', COALESCE(collection_date, created_at))" in query
+    assert "COALESCE(de.collection_date, de.created_at) >= t.bucket_start" in query
+    assert f"COALESCE(de.collection_date, de.created_at) < t.bucket_start + INTERVAL '1 {unit}'" in query
+    assert "collection_date IS NOT NULL" not in query
+
+def test_effectiveness_export_reads_rollups():
+    spec = EXPORT_DATASETS["effectiveness-matrix"]
+    assert spec["rollups"]
+    assert ADR_EVIDENCE_STATS_QUERY in spec["query"]
+    assert "FROM decision_evidence\n" not in spec["query"]
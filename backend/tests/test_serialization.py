@@ -0,0 +1,75 @@
+"""
+⚡ Serialization tests
+FastJSONResponse rendering with and without orjson, and the asyncpg JSON codecs
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from services import serialization
+from services.serialization import FastJSONResponse, decode_json_list, register_json_codecs
+
+ROW = {
+    "id": 3,
+    "adr_id": "ADR-0003-API",
+    "title": "Bruke pgvector for søk",
+    "confidence_score": Decimal("0.85"),
+    "decision_date": date(2026, 1, 5),
+    "created_at": datetime(2026, 1, 5, 12, 30, 1, 250000, tzinfo=timezone.utc),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "tags": ["search", "db"],
+    "missing": None,
+}
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+def test_renders_like_fastapi(encoder):
+    body = FastJSONResponse([ROW]).body
+    assert json.loads(body) == jsonable_encoder([ROW])
+    assert "søk".encode("utf-8") in body
+
+def test_response_headers(encoder):
+    response = FastJSONResponse({"links": []}, headers={"X-Next-Cursor": "abc"})
+    assert response.media_type == "application/json"
+    assert response.headers["x-next-cursor"] == "abc"
+    assert json.loads(response.body) == {"links": []}
+
+def test_unknown_types_are_rejected(encoder):
+    with pytest.raises(TypeError):
+        FastJSONResponse({"value": object()})
+
+def test_decode_json_list():
+    assert decode_json_list(None) == []
+    assert decode_json_list("") == []
+    assert decode_json_list('["a", "b"]') == ["a", "b"]
+    assert decode_json_list(["already", "decoded"]) == ["already", "decoded"]
+
+class CodecConnection:
+    def __init__(self):
+        self.codecs = {}
+
+    async def set_type_codec(self, type_name, encoder, decoder, schema):
+        self.codecs[(schema, type_name)] = (encoder, decoder)
+
+@pytest.mark.asyncio
+async def test_json_codecs_accept_objects_and_encoded_text():
+    conn = CodecConnection()
+    await register_json_codecs(conn)
+
+    assert set(conn.codecs) == {("pg_catalog", "json"), ("pg_catalog", "jsonb")}
+    encoder, decoder = conn.codecs[("pg_catalog", "jsonb")]
+    assert json.loads(encoder(["a", 1])) == ["a", 1]
+    # json.dumps() call sites keep passing text through unchanged
+    assert encoder('{"k": 1}') == '{"k": 1}'
+    assert decoder('{"k": [1, 2]}') == {"k": [1, 2]}
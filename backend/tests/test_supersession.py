@@ -0,0 +1,77 @@
+"""
+🧬 Supersession resolution tests
+Effective decision selection and lineage caching
+"""
+
+from datetime import datetime
+
+import pytest
+
+from services.cache import data_generations
+from services.supersession import SupersessionResolver
+
+def _row(adr_id, depth, is_head, day=1, status="accepted"):
+    return {
+        "adr_id": adr_id, "depth": depth, "title": f"Decision {adr_id}", "status": status,
+        "component": "platform", "created_at": datetime(2026, 1, day), "is_head": is_head
+    }
+
+class FakeConnection:
+    """Returns fixed LINEAGE_QUERY rows and counts round trips"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    async def fetch(self, query, adr_id):
+        self.calls += 1
+        return self.rows
+
+@pytest.mark.asyncio
+async def test_superseded_adr_resolves_to_newest_successor():
+    # ADR-1 <- ADR-2 <- ADR-3 (each supersedes the previous one)
+    db = FakeConnection([_row("ADR-1", 0, False), _row("ADR-2", 1, False, 2), _row("ADR-3", 2, True, 3)])
+    result = await SupersessionResolver().resolve(db, "ADR-1")
+
+    assert result["effective_adr"]["adr_id"] == "ADR-3"
+    assert result["is_superseded"] and not result["ambiguous"]
+    assert [entry["adr_id"] for entry in result["lineage"]] == ["ADR-1", "ADR-2", "ADR-3"]
+
+@pytest.mark.asyncio
+async def test_head_is_its_own_effective_decision():
+    db = FakeConnection([_row("ADR-0", -2, False), _row("ADR-1", -1, False, 2), _row("ADR-2", 0, True, 3)])
+    result = await SupersessionResolver().resolve(db, "ADR-2")
+
+    assert result["effective_adr"]["adr_id"] == "ADR-2"
+    assert not result["is_superseded"]
+    assert [entry["depth"] for entry in result["lineage"]] == [-2, -1, 0]
+
+@pytest.mark.asyncio
+async def test_branching_successors_are_ambiguous():
+    db = FakeConnection([
+        _row("ADR-1", 0, False), _row("ADR-2", 1, True, 5), _row("ADR-3", 1, True, 9),
+        # The same ADR reached along a second path is listed once
+        _row("ADR-3", 1, True, 9),
+    ])
+    result = await SupersessionResolver().resolve(db, "ADR-1")
+
+    assert result["ambiguous"]
+    assert result["effective_adr"]["adr_id"] == "ADR-3"
+    assert len(result["lineage"]) == 3
+
+@pytest.mark.asyncio
+async def test_unknown_adr():
+    assert await SupersessionResolver().resolve(FakeConnection([]), "ADR-404") is None
+
+@pytest.mark.asyncio
+async def test_lineage_cached_until_links_change():
+    resolver = SupersessionResolver()
+    db = FakeConnection([_row("ADR-1", 0, True)])
+
+    assert (await resolver.resolve(db, "ADR-1"))["cached"] is False
+    assert (await resolver.resolve(db, "ADR-1"))["cached"] is True
+    assert db.calls == 1
+
+    data_generations.bump("links")
+    assert (await resolver.resolve(db, "ADR-1"))["cached"] is False
+    assert db.calls == 2
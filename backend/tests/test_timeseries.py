@@ -0,0 +1,46 @@
+"""
+📈 Time-series engine tests
+LTTB downsampling and bucket summaries
+"""
+
+import math
+
+import pytest
+
+from services.timeseries import lttb_indices, summarize_buckets
+
+@pytest.mark.parametrize("count, threshold", [(0, 10), (1, 10), (5, 10), (10, 10), (10, 2), (10, 0)])
+def test_lttb_keeps_everything_below_threshold(count, threshold):
+    assert lttb_indices([float(i) for i in range(count)], threshold) == list(range(count))
+
+def test_lttb_selects_threshold_points_in_order():
+    values = [math.sin(i / 10) for i in range(500)]
+    indices = lttb_indices(values, 50)
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 499
+    assert indices == sorted(set(indices))
+
+def test_lttb_keeps_spikes():
+    values = [0.0] * 100
+    values[37] = 50.0
+    values[81] = -20.0
+    indices = lttb_indices(values, 10)
+    assert 37 in indices and 81 in indices
+
+def _bucket(decision_count, accepted_count=0):
+    return {"decision_count": decision_count, "accepted_count": accepted_count}
+
+def test_summary_trend_direction():
+    assert summarize_buckets([_bucket(1)] * 5 + [_bucket(5)] * 3)["trend_direction"] == "increasing"
+    assert summarize_buckets([_bucket(5)] * 5 + [_bucket(1)] * 3)["trend_direction"] == "decreasing"
+    assert summarize_buckets([_bucket(2)] * 8)["trend_direction"] == "stable"
+
+def test_summary_of_empty_and_single_bucket():
+    empty = summarize_buckets([])
+    assert empty["trend_direction"] == "insufficient_data"
+    assert empty["avg_decisions_per_period"] == 0
+    assert empty["overall_acceptance_rate"] == 0
+
+    single = summarize_buckets([_bucket(4, 3)])
+    assert single["trend_direction"] == "insufficient_data"
+    assert single["overall_acceptance_rate"] == 75.0